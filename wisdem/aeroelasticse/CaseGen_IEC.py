@@ -33,6 +33,20 @@ def gen_windfile(data):
         WindFile_type_out = wind_file_type
     return [U_out, WindFile_out, WindFile_type_out]
 
+def eval_windfile(job):
+    # [function, data] pair, as sent to the MPI workers
+    return job[0](job[1])
+
+def gen_windfile_seeds(data):
+    # function for generating the wind files of all seeds at one wind speed together
+    iecwind = data[0]
+    IEC_WindType = data[1]
+    U = data[2]
+    seeds = data[3]
+
+    WindFile_out, WindFile_type_out = iecwind.execute_seeds(IEC_WindType, U, seeds)
+    return [[U]*len(seeds), WindFile_out, WindFile_type_out]
+
 class CaseGen_IEC():
 
     def __init__(self):
@@ -56,6 +70,7 @@ class CaseGen_IEC():
         self.cores                       = 0
         self.overwrite                   = False
         self.flag_enlarge_grid           = False
+        self.wind_generator              = 'Turbsim' # 'Turbsim' or 'Veers' (in-process) for turbulent wind files
 
         self.mpi_run                     = False
         self.comm_map_down               = []
@@ -126,6 +141,7 @@ class CaseGen_IEC():
             iecwind.debug_level      = self.debug_level
             iecwind.overwrite        = self.overwrite
             iecwind.flag_enlarge_grid = self.flag_enlarge_grid
+            iecwind.wind_generator   = self.wind_generator
 
             # Set DLC specific settings
             iecwind_ex = pyIECWind_extreme()
@@ -178,6 +194,19 @@ class CaseGen_IEC():
                         row_out[g] = change_vals[g][val]
                 matrix_out.append(row_out)
             matrix_out = np.asarray(matrix_out)
+
+            # Wind file generation jobs, the in-process generator handles all seeds of a wind speed at once
+            if self.wind_generator.lower() == 'veers' and isinstance(iecwind, pyIECWind_turb):
+                jobs = []
+                for var_vals in matrix_out:
+                    U = var_vals[change_vars.index('U')]
+                    seed = var_vals[change_vars.index('Seeds')] if 'Seeds' in change_vars else iecwind.seed
+                    if jobs and jobs[-1][1][2] == U:
+                        jobs[-1][1][3].append(seed)
+                    else:
+                        jobs.append([gen_windfile_seeds, [iecwind, IEC_WindType, U, [seed]]])
+            else:
+                jobs = [[gen_windfile, [iecwind, IEC_WindType, change_vars, var_vals]] for var_vals in matrix_out]
             
             if self.parallel_windfile_gen and not self.mpi_run:
                 # Parallel wind file generation (threaded with multiprocessing)
@@ -185,7 +214,7 @@ class CaseGen_IEC():
                     p = mp.Pool(self.cores)
                 else:
                     p = mp.Pool()
-                data_out = p.map(gen_windfile, [(iecwind, IEC_WindType, change_vars, var_vals) for var_vals in matrix_out])
+                data_out = p.map(eval_windfile, jobs)
                 U_out = []
                 WindFile_out = []
                 WindFile_type_out = []
@@ -202,7 +231,7 @@ class CaseGen_IEC():
                 sub_ranks = self.comm_map_down[rank]
                 size = len(sub_ranks)
 
-                N_cases = len(matrix_out)
+                N_cases = len(jobs)
                 N_loops = int(np.ceil(float(N_cases)/float(size)))
 
                 U_out = []
@@ -212,12 +241,11 @@ class CaseGen_IEC():
                     idx_s    = i*size
                     idx_e    = min((i+1)*size, N_cases)
 
-                    for j, var_vals in enumerate(matrix_out[idx_s:idx_e]):
-                        data   = [gen_windfile, [iecwind, IEC_WindType, change_vars, var_vals]]
+                    for j, data in enumerate(jobs[idx_s:idx_e]):
                         rank_j = sub_ranks[j]
                         comm.send(data, dest=rank_j, tag=0)
 
-                    for j, var_vals in enumerate(matrix_out[idx_s:idx_e]):
+                    for j, data in enumerate(jobs[idx_s:idx_e]):
                         rank_j = sub_ranks[j]
                         data_out = comm.recv(source=rank_j, tag=1)
                         U_out.extend(data_out[0])
@@ -229,8 +257,8 @@ class CaseGen_IEC():
                 U_out = []
                 WindFile_out = []
                 WindFile_type_out = []
-                for var_vals in matrix_out:
-                    [U_out_i, WindFile_out_i, WindFile_type_out_i] = gen_windfile([iecwind, IEC_WindType, change_vars, var_vals])
+                for data in jobs:
+                    [U_out_i, WindFile_out_i, WindFile_type_out_i] = eval_windfile(data)
                     U_out.extend(U_out_i)
                     WindFile_out.extend(WindFile_out_i)
                     WindFile_type_out.extend(WindFile_type_out_i)
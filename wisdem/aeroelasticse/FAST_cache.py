@@ -0,0 +1,288 @@
+"""
+Persistent, content addressed store of OpenFAST results.
+
+A case is identified by a hash of the fully resolved input model (the fst_vt
+dictionary after the case changes and output channels have been applied),
+the contents of the files it references, the FAST version and the executable.
+Each entry holds the post-processed
+output of the case, one per post-processing function, and optionally a copy
+of the binary output file.  The least recently used entries are evicted once
+the cache grows beyond its size limit.
+
+LIMITATION: only the files named directly by an fst_vt value (e.g. the
+controller library, an external DISCON.IN, wind and WAMIT files) are hashed,
+found either at an absolute path or relative to FAST_directory.  Files that
+those files reference in turn (e.g. the Cp/Ct/Cq table named inside an
+external DISCON.IN) are not.  Editing such a file in place, or any other
+input the hash can't see, returns stale results: clear the cache directory
+after doing so.
+"""
+from __future__ import print_function
+import os
+import shutil
+import pickle
+import hashlib
+import tempfile
+import numpy as np
+
+# Input file names that the writers regenerate from the case name
+# (FAST_namingOut); they carry no information about the model
+WRITER_FILES = [('Fst', 'EDFile'), ('Fst', 'BDBldFile(1)'), ('Fst', 'BDBldFile(2)'), ('Fst', 'BDBldFile(3)'),
+                ('Fst', 'InflowFile'), ('Fst', 'AeroFile'), ('Fst', 'ServoFile'), ('Fst', 'HydroFile'),
+                ('Fst', 'SubFile'), ('Fst', 'MooringFile'), ('Fst7', 'ADFile'),
+                ('ElastoDyn', 'BldFile1'), ('ElastoDyn', 'BldFile2'), ('ElastoDyn', 'BldFile3'), ('ElastoDyn', 'TwrFile'),
+                ('BeamDyn', 'BldFile'), ('AeroDyn14', 'TwrFile'),
+                ('AeroDyn15', 'ADBlFile1'), ('AeroDyn15', 'ADBlFile2'), ('AeroDyn15', 'ADBlFile3'), ('AeroDyn15', 'AFNames'),
+                ('ServoDyn', 'DLL_InFile'), ('DISCON_in', 'PerfFileName')]
+
+# Input fields holding the root name of a set of files, with the extensions read
+ROOT_FILES = {('HydroDyn', 'PotFile'): ['.hst', '.1', '.3'], ('InflowWind', 'FilenameRoot'): ['.wnd', '.sum']}
+
+# sha1 digest of file contents, by (path, size, modification time)
+_file_digests = {}
+
+
+class FASTCache(object):
+
+    def __init__(self, cache_dir, max_size=10e9, keep_outb=False):
+        self.cache_dir = cache_dir      # directory holding the cache entries
+        self.max_size  = max_size       # bytes, least recently used entries are evicted beyond this
+        self.keep_outb = keep_outb      # also store the binary output file of each case
+
+    def key(self, fst_vt, FAST_exe=None, FAST_ver='', FAST_directory=None):
+        # hash of the resolved input model, the files it references, FAST
+        # version and executable; relative file names are found in FAST_directory
+        h = hashlib.sha1()
+        h.update(str(FAST_ver).lower().encode())
+        if FAST_exe:
+            exe = shutil.which(FAST_exe) or FAST_exe
+            h.update(os.path.abspath(exe).encode())
+            if os.path.exists(exe):
+                stat = os.stat(exe)
+                h.update(('%d %d' % (stat.st_size, stat.st_mtime_ns)).encode())
+
+        skip = {}
+        for module, var in WRITER_FILES:
+            skip.setdefault(module, set()).add(var)
+        for module in sorted(fst_vt.keys(), key=repr):
+            h.update(repr(module).encode())
+            value = fst_vt[module]
+            if isinstance(value, dict):
+                # contents of referenced files, so that editing one in place
+                # changes the key; the file names of WRITER_FILES are not hashed
+                for var in sorted(value.keys(), key=repr):
+                    for fname in _file_names(value[var], ROOT_FILES.get((module, var), [''])):
+                        path = os.path.join(FAST_directory or '', fname)
+                        if os.path.isfile(path):
+                            h.update(repr(var).encode())
+                            h.update(_file_digest(path))
+                if module in skip:
+                    value = dict((k, v) for k, v in value.items() if k not in skip[module])
+            _hash_value(h, value)
+
+        return h.hexdigest()
+
+    def load(self, key, post):
+        # return (True, stored output of post) for a hit, (False, None) otherwise
+        fname = os.path.join(self.cache_dir, key, _post_name(post))
+        try:
+            with open(fname, 'rb') as f:
+                out = pickle.load(f)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+        self.__touch(key)
+        return True, out
+
+    def restore(self, key, FAST_Output):
+        # copy a stored binary output file to FAST_Output, returns True on a hit
+        fname = os.path.join(self.cache_dir, key, 'output.outb')
+        if not self.keep_outb or not os.path.exists(fname):
+            return False
+
+        out_dir = os.path.dirname(FAST_Output)
+        if out_dir and not os.path.exists(out_dir):
+            os.makedirs(out_dir)
+        shutil.copyfile(fname, FAST_Output)
+        self.__touch(key)
+        return True
+
+    def store(self, key, post, out, FAST_Output=None):
+        # save the output of post (and the binary output file), then evict
+        entry = os.path.join(self.cache_dir, key)
+        if not os.path.exists(entry):
+            os.makedirs(entry)
+
+        if post:
+            self.__write(os.path.join(entry, _post_name(post)), pickle.dumps(out, protocol=pickle.HIGHEST_PROTOCOL))
+        if self.keep_outb and FAST_Output and os.path.exists(FAST_Output):
+            fd, tmp = tempfile.mkstemp(dir=entry)
+            os.close(fd)
+            shutil.copyfile(FAST_Output, tmp)
+            os.replace(tmp, os.path.join(entry, 'output.outb'))
+
+        self.__touch(key)
+        self.evict()
+
+    def evict(self):
+        # remove least recently used entries until the cache fits in max_size
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        entries = []
+        total   = 0
+        for key in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, key)
+            if not os.path.isdir(entry):
+                continue
+            try:
+                size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+                entries.append((os.path.getmtime(entry), size, entry))
+            except OSError:
+                continue    # removed by another process
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def __touch(self, key):
+        # mark an entry as recently used
+        try:
+            os.utime(os.path.join(self.cache_dir, key), None)
+        except OSError:
+            pass
+
+    def __write(self, fname, data):
+        # atomic write, so concurrent cases never read a partial entry
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(fname))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, fname)
+
+
+def _post_name(post):
+    # file name of the stored output of a post-processing function, from its
+    # name, code, defaults, closure values and bound instance, so that lambdas,
+    # closures of one factory or methods of differently configured instances
+    # do not share an entry
+    h = hashlib.sha1()
+    _hash_callable(h, post, set())
+    return 'post_%s.pkl' % h.hexdigest()[:16]
+
+
+def _hash_callable(h, func, seen):
+    # feed the identity and configuration of a callable to h
+    if id(func) in seen:
+        h.update(b'<recursive>')
+        return
+    seen = seen | {id(func)}
+
+    if hasattr(func, 'func') and hasattr(func, 'args') and hasattr(func, 'keywords'):  # functools.partial
+        h.update(b'partial(')
+        _hash_callable(h, func.func, seen)
+        _hash_config(h, list(func.args), seen)
+        _hash_config(h, dict(func.keywords or {}), seen)
+        h.update(b')')
+        return
+
+    if hasattr(func, '__func__') and hasattr(func, '__self__'):  # bound method
+        h.update(b'method(')
+        _hash_callable(h, func.__func__, seen)
+        _hash_config(h, func.__self__, seen)
+        h.update(b')')
+        return
+
+    h.update(('%s.%s' % (getattr(func, '__module__', ''),
+                         getattr(func, '__qualname__', getattr(func, '__name__', type(func).__qualname__)))).encode())
+    code = getattr(func, '__code__', None)
+    if code is not None:
+        _hash_code(h, code)
+        _hash_config(h, func.__defaults__, seen)
+        _hash_config(h, func.__kwdefaults__, seen)
+        for cell in func.__closure__ or ():
+            try:
+                _hash_config(h, cell.cell_contents, seen)
+            except ValueError:  # empty cell
+                h.update(b'<empty>')
+    elif not isinstance(func, type) and hasattr(func, '__dict__'):  # callable instance
+        _hash_config(h, func, seen)
+
+
+def _hash_code(h, code):
+    # bytecode, constants (including nested functions) and names of a code object
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _hash_code(h, const)
+        else:
+            h.update(repr(const).encode())
+
+
+def _hash_config(h, value, seen):
+    # feed a default, closure value or instance state to h
+    if callable(value) and not isinstance(value, type):
+        _hash_callable(h, value, seen)
+    elif isinstance(value, dict):
+        h.update(b'{')
+        for k in sorted(value.keys(), key=repr):
+            h.update(repr(k).encode())
+            _hash_config(h, value[k], seen)
+        h.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        h.update(b'[')
+        for v in value:
+            _hash_config(h, v, seen)
+        h.update(b']')
+    elif hasattr(value, '__dict__') and not isinstance(value, (type, np.ndarray)) and id(value) not in seen:
+        h.update(type(value).__qualname__.encode())
+        _hash_config(h, vars(value), seen | {id(value)})
+    else:
+        _hash_value(h, value)
+
+
+def _file_names(value, extensions):
+    # file names that an input value may hold: a string or a list of strings
+    names = value if isinstance(value, (list, tuple)) else [value]
+    return [n + ext for n in names if isinstance(n, str) and n.strip() for ext in extensions]
+
+
+def _file_digest(path):
+    # sha1 digest of the contents of a file, computed once per file version
+    stat = os.stat(path)
+    version = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if version not in _file_digests:
+        h = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        _file_digests[version] = h.digest()
+    return _file_digests[version]
+
+
+def _hash_value(h, value):
+    # feed a canonical representation of a nested input model value to h
+    if isinstance(value, dict):
+        h.update(b'{')
+        for k in sorted(value.keys(), key=repr):
+            h.update(repr(k).encode())
+            _hash_value(h, value[k])
+        h.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        h.update(b'[')
+        for v in value:
+            _hash_value(h, v)
+        h.update(b']')
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            _hash_value(h, value.tolist())
+        else:
+            h.update(('%s%r' % (value.dtype.str, value.shape)).encode())
+            h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.generic):
+        h.update(repr(value.item()).encode())
+    else:
+        h.update(repr(value).encode())
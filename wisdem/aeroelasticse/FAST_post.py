@@ -1,6 +1,8 @@
 from __future__ import print_function
-from wisdem.aeroelasticse.Util.ReadFASTout import ReadFASToutFormat
+from wisdem.aeroelasticse.Util.ReadFASTout import ReadFASToutFormat, ReadFASTbinaryChunks, ReadFASTtext
 import numpy as np
+import copy
+import os
 
 def return_fname(fname):
     return fname
@@ -9,14 +11,267 @@ def return_timeseries(fname):
     data, meta = ReadFASToutFormat(fname, 2, Verbose=True)
     return data
 
-def return_stats(fname):
-    data, meta = ReadFASToutFormat(fname, 2, Verbose=True)
-    stats = {}
-    for var in data.keys():
-        stats[var] = {}
-        stats[var]['mean']   = np.mean(data[var])
-        stats[var]['min']    = min(data[var])
-        stats[var]['max']    = max(data[var])
-        stats[var]['std']    = np.std((data[var]))
-        stats[var]['absmax'] = np.abs(max(data[var]))
-    return stats
\ No newline at end of file
+def return_stats(fname, OutList=None, percentiles=None, DEL=None, ChunkSize=100000):
+    # Summary statistics of a FAST output file, computed block by block without
+    # holding the time series in memory
+    return stream_stats(fname, OutList=OutList, percentiles=percentiles, DEL=DEL, ChunkSize=ChunkSize).stats()
+
+def stream_stats(fname, OutList=None, percentiles=None, DEL=None, ChunkSize=100000):
+    # Accumulate StreamingStats for a FAST output file; the binary file is read
+    # in blocks of ChunkSize time steps, text files are read whole.  The result
+    # is small and can be merged with the stats of other cases.
+    path, name = os.path.split(fname)
+    root       = os.path.join(path, '.'.join(name.split('.')[:-1]))
+    if os.path.exists(root + '.outb') or not os.path.exists(root + '.out'):
+        blocks, ChanName, ChanUnit, _, _ = ReadFASTbinaryChunks(root + '.outb', OutList=OutList, ChunkSize=ChunkSize)
+    else:
+        Channels, ChanName, ChanUnit, _, _ = ReadFASTtext(root + '.out', OutList=OutList)
+        blocks = [Channels]
+
+    stats = StreamingStats(ChanName, ChanUnit, percentiles=percentiles, DEL=DEL)
+    for block in blocks:
+        stats.update(block[:,0], block)
+    stats.finalize()
+
+    return stats
+
+def aggregate_stats(stats_list):
+    # Merge the StreamingStats of several cases into a new instance, the cases are not modified
+    total = None
+    for stats in stats_list:
+        total = copy.deepcopy(stats) if total is None else total.merge(stats)
+    return total
+
+
+class StreamingStats(object):
+    """
+    Channel statistics accumulated one block of time steps at a time: mean,
+    standard deviation, min, max, absolute max, percentiles (from an adaptive
+    histogram) and rainflow damage equivalent loads.  Instances for different
+    simulations can be merged, so statistics over a whole batch of cases are
+    available without retaining any time series.
+
+    Inputs:
+        channels    - list: channel names
+        units       - list: (optional) channel units
+        percentiles - list: (optional) percentiles to report, 0-100
+        DEL         - dict: (optional) Wohler exponent for each channel needing a damage equivalent load
+        f_eq        - float: (optional) frequency of the equivalent load cycles, Hz
+        nbins       - int: (optional) number of histogram bins per channel
+    """
+
+    def __init__(self, channels, units=None, percentiles=None, DEL=None, f_eq=1.0, nbins=1024):
+        self.channels    = list(channels)
+        self.units       = list(units) if units is not None else ['']*len(self.channels)
+        self.percentiles = list(percentiles) if percentiles is not None else []
+        self.f_eq        = f_eq
+        self.nbins       = nbins
+
+        nchan = len(self.channels)
+        self.n      = 0
+        self.time   = 0.           # simulated time
+        self.mean   = np.zeros(nchan)
+        self.M2     = np.zeros(nchan)
+        self.min    = np.full(nchan, np.inf)
+        self.max    = np.full(nchan, -np.inf)
+        self.counts = np.zeros((nchan, nbins))
+        self.lo     = np.zeros(nchan)
+        self.width  = np.zeros(nchan)
+
+        self.rainflow = {}
+        for chan, m in (DEL or {}).items():
+            if chan in self.channels:
+                self.rainflow[chan] = RainflowCounter(m)
+
+        self._t0 = None
+        self._t1 = None
+
+    def update(self, time, data):
+        # add a block of time steps; data is (n time steps, n channels)
+        data = np.asarray(data, dtype=float)
+        n    = data.shape[0]
+        if n == 0:
+            return
+
+        if self._t0 is None:
+            self._t0 = time[0]
+        self._t1 = time[-1]
+
+        # mean and variance, merged with the running totals (Chan et al.)
+        mean  = np.mean(data, axis=0)
+        M2    = np.sum((data - mean)**2, axis=0)
+        N     = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / N
+        self.M2   += M2 + delta**2 * self.n * n / N
+        self.n     = N
+
+        self.min = np.minimum(self.min, np.min(data, axis=0))
+        self.max = np.maximum(self.max, np.max(data, axis=0))
+        self.__histogram(data)
+
+        for chan, rainflow in self.rainflow.items():
+            rainflow.update(data[:, self.channels.index(chan)])
+
+    def finalize(self):
+        # close the open rainflow cycles and record the simulated time
+        for rainflow in self.rainflow.values():
+            rainflow.finalize()
+        if self._t0 is not None and self.n > 1:
+            self.time += (self._t1 - self._t0) * self.n / (self.n - 1.)
+        self._t0 = None
+
+    def merge(self, other):
+        # combine with the stats of another (finalized) simulation, in place;
+        # other is not modified, its rainflow counters are copied
+        N = self.n + other.n
+        if N > 0:
+            delta      = other.mean - self.mean
+            self.mean  = self.mean + delta * other.n / N
+            self.M2    = self.M2 + other.M2 + delta**2 * self.n * other.n / N
+        self.n     = N
+        self.time += other.time
+        self.min   = np.minimum(self.min, other.min)
+        self.max   = np.maximum(self.max, other.max)
+
+        filled = other.width > 0.
+        if np.any(filled):
+            centers = other.lo + other.width * (np.arange(other.nbins)[:, np.newaxis] + 0.5)
+            self.__histogram(np.where(filled, centers, np.nan), other.counts.T)
+
+        for chan, rainflow in other.rainflow.items():
+            if chan in self.rainflow:
+                self.rainflow[chan].damage += rainflow.damage
+            else:
+                self.rainflow[chan] = copy.deepcopy(rainflow)
+
+        return self
+
+    def stats(self):
+        # summary dictionary, keyed by channel name
+        std  = np.sqrt(self.M2 / max(self.n, 1))
+        perc = self.percentile(self.percentiles) if self.percentiles else None
+
+        stats = {}
+        for k, chan in enumerate(self.channels):
+            stats[chan] = {}
+            stats[chan]['mean']   = self.mean[k]
+            stats[chan]['min']    = self.min[k]
+            stats[chan]['max']    = self.max[k]
+            stats[chan]['std']    = std[k]
+            stats[chan]['absmax'] = max(abs(self.min[k]), abs(self.max[k]))
+            if perc is not None:
+                stats[chan]['percentiles'] = dict(zip(self.percentiles, perc[:,k]))
+            if chan in self.rainflow:
+                stats[chan]['DEL'] = self.rainflow[chan].DEL(self.time * self.f_eq)
+        return stats
+
+    def percentile(self, q):
+        # percentiles (0-100) of every channel, interpolated within histogram bins
+        q      = np.atleast_1d(q) / 100.
+        cdf    = np.cumsum(self.counts, axis=1)
+        total  = cdf[:,-1:]
+        target = q[:,np.newaxis,np.newaxis] * total[np.newaxis,:,:]
+        out    = np.empty((q.size, len(self.channels)))
+        for k in range(len(self.channels)):
+            i    = np.minimum(np.searchsorted(cdf[k], target[:,k,0]), self.nbins-1)
+            prev = np.where(i > 0, cdf[k][i-1], 0.)
+            frac = np.where(self.counts[k][i] > 0, (target[:,k,0] - prev) / np.maximum(self.counts[k][i], 1e-300), 0.5)
+            out[:,k] = self.lo[k] + self.width[k] * (i + frac)
+        return np.clip(out, self.min, self.max)
+
+    def __histogram(self, x, weights=None):
+        # bin x (n, n channels) into the channel histograms, doubling the bin
+        # width of any channel whose range does not cover the new values
+        xmin = np.min(np.where(np.isnan(x), np.inf, x), axis=0)
+        xmax = np.max(np.where(np.isnan(x), -np.inf, x), axis=0)
+
+        new = (self.width == 0.) & np.isfinite(xmin)
+        if np.any(new):
+            span = np.maximum(xmax[new] - xmin[new], 1e-9 * np.maximum(np.abs(xmin[new]), 1.))
+            self.lo[new]    = xmin[new]
+            self.width[new] = span * (1. + 1e-9) / self.nbins
+
+        for _ in range(200):
+            grow = (self.width > 0.) & ((xmin < self.lo) | (xmax >= self.lo + self.nbins * self.width))
+            if not np.any(grow):
+                break
+            # merge pairs of bins and re-center the occupied half
+            counts = self.counts[grow]
+            counts = counts.reshape(counts.shape[0], self.nbins//2, 2).sum(axis=2)
+            shift  = self.nbins//4
+            self.counts[grow] = 0.
+            self.counts[grow, shift:shift+self.nbins//2] = counts
+            self.width[grow] *= 2.
+            self.lo[grow]    -= shift * self.width[grow]
+
+        idx   = np.floor((x - self.lo) / np.where(self.width > 0., self.width, 1.))
+        valid = np.isfinite(idx)
+        idx   = np.clip(np.where(valid, idx, 0), 0, self.nbins-1).astype(int)
+        flat  = idx + self.nbins * np.arange(len(self.channels))
+        w     = valid.astype(float) if weights is None else np.where(valid, weights, 0.)
+        self.counts += np.bincount(flat.ravel(), weights=w.ravel(), minlength=self.counts.size).reshape(self.counts.shape)
+
+
+class RainflowCounter(object):
+    """
+    Rainflow cycle counting (ASTM E1049 four point method) for a signal that
+    arrives in blocks.  Only the open reversals are kept between blocks; the
+    closed cycles are accumulated as the damage sum of range**m.
+    """
+
+    def __init__(self, m):
+        self.m      = m             # Wohler exponent
+        self.damage = 0.            # sum of cycle count * range**m
+        self.stack  = []            # open reversals
+        self.tail   = np.zeros(0)   # samples since the last reversal
+        self.start  = True
+
+    def update(self, x):
+        x = np.concatenate((self.tail, x))
+        x = x[np.concatenate(([True], np.diff(x) != 0.))]
+        if x.size < 3:
+            self.tail = x
+            return
+
+        # reversals inside the block; the leading sample is either the start
+        # of the signal or a reversal found in the previous block
+        d   = np.diff(x)
+        rev = np.nonzero(d[1:] * d[:-1] < 0.)[0] + 1
+        if self.start:
+            self.__count(x[:1])
+            self.start = False
+        self.__count(x[rev])
+        self.tail = x[rev[-1]:] if rev.size > 0 else x
+
+    def finalize(self):
+        # the last sample ends the signal; residual reversals count as half cycles
+        if self.tail.size > 0:
+            self.__count(self.tail[-1:] if not self.start else self.tail[[0, -1]])
+        self.start = True
+        self.tail  = np.zeros(0)
+        ranges = np.abs(np.diff(self.stack))
+        self.damage += 0.5 * np.sum(ranges**self.m)
+        self.stack = []
+
+    def DEL(self, N_eq):
+        # damage equivalent load for N_eq cycles
+        return (self.damage / N_eq)**(1. / self.m) if N_eq > 0 else 0.
+
+    def __count(self, reversals):
+        stack  = self.stack
+        damage = 0.
+        for r in reversals:
+            stack.append(r)
+            while len(stack) >= 3:
+                X = abs(stack[-1] - stack[-2])
+                Y = abs(stack[-2] - stack[-3])
+                if X < Y:
+                    break
+                if len(stack) == 3:
+                    damage += 0.5 * Y**self.m
+                    del stack[0]
+                else:
+                    damage += Y**self.m
+                    del stack[-3:-1]
+        self.damage += damage
@@ -6,6 +6,7 @@ Author: Evan Gaertner, National Renewable Energy Laboratory
 Inputs:
     FileName      - string: contains file name to open
     OutFileFmt    - int: (optional) 1=textfile, 2=binary
+    OutList       - list: (optional) names of the channels to read, time is always included
 
 Outputs:
     data          - dict: FAST output time series, output channel names as dict keys
@@ -13,19 +14,18 @@ Outputs:
 
 """
 import numpy as np
-import struct
 import os
 
-def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False):
+def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False, OutList=None):
     
     if OutFileFmt == 2:
         path,fname = os.path.split(FileName)
         FileName = os.path.join(path, '.'.join(fname.split('.')[:-1])+'.outb')
-        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(FileName)
+        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(FileName, OutList)
     elif OutFileFmt == 1: 
         path,fname = os.path.split(FileName)
         FileName = os.path.join(path, '.'.join(fname.split('.')[:-1])+'.out')
-        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTtext(FileName)
+        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTtext(FileName, OutList)
     else:
         if Verbose:
             print('Attempting to read FAST output file: %s, format not specified'%FileName)
@@ -35,7 +35,7 @@ def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False):
                 print('Attempting binary read')
             path,fname = os.path.split(FileName)
             FileName = os.path.join(path, '.'.join(fname.split('.')[:-1])+'.outb')
-            Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(FileName)
+            Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(FileName, OutList)
             if Verbose:
                 print('Success')
             error = False
@@ -49,7 +49,7 @@ def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False):
                     print('Attempting text read')
                 path,fname = os.path.split(FileName)
                 FileName = os.path.join(path, '.'.join(fname.split('.')[:-1])+'.out')
-                Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTtext(FileName)
+                Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTtext(FileName, OutList)
                 if Verbose:
                     print('Success')
                 error = False
@@ -71,107 +71,102 @@ def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False):
 
     return data, meta
 
-def ReadFASTbinary(FileName):
+def ReadFASTbinary(FileName, OutList=None):
+    header   = ReadFASTbinaryHeader(FileName, OutList)
+    Channels = ScaleFASTbinary(FileName, header, 0, header['NT'])
+
+    return Channels, header['ChanName'], header['ChanUnit'], header['FileID'], header['DescStr']
+
+def ReadFASTbinaryChunks(FileName, OutList=None, ChunkSize=100000):
+    # Same as ReadFASTbinary, but the channels are returned as a generator of
+    # blocks of at most ChunkSize time steps, each scaled only when requested
+    header = ReadFASTbinaryHeader(FileName, OutList)
+
+    def blocks():
+        for i0 in range(0, header['NT'], ChunkSize):
+            yield ScaleFASTbinary(FileName, header, i0, min(i0+ChunkSize, header['NT']))
+
+    return blocks(), header['ChanName'], header['ChanUnit'], header['FileID'], header['DescStr']
+
+def ReadFASTbinaryHeader(FileName, OutList=None):
     LenName = 10    # number of characters per channel name
     LenUnit = 10    # number of characters per unit name
 
-    #----------------------------        
-    # load file binary data
-    #----------------------------
-    f = open(FileName, 'rb')
-    data = f.read()
-    f.close()
-    i = 0           # data position pointer for binary unpacking
-
     #----------------------------        
     # get the header information
     #----------------------------
+    header = {}
+    f = open(FileName, 'rb')
 
-    FileID = struct.unpack('h',data[i:i+2])[0]              # FAST output file format, INT(2)
-    i+=2
-    NumOutChans = struct.unpack('i',data[i:i+4])[0]         # The number of output channels, INT(4)
-    i+=4
-    NT = struct.unpack('i',data[i:i+4])[0]                  # The number of time steps, INT(4)
-    i+=4
+    FileID      = np.fromfile(f, np.int16, 1)[0]            # FAST output file format, INT(2)
+    NumOutChans = np.fromfile(f, np.int32, 1)[0]            # The number of output channels, INT(4)
+    NT          = np.fromfile(f, np.int32, 1)[0]            # The number of time steps, INT(4)
 
     if FileID == 1: # with time
-        TimeScl = struct.unpack('d',data[i:i+8])[0]         # The time slopes for scaling, REAL(8)
-        i+=8
-        TimeOff = struct.unpack('d',data[i:i+8])[0]         # The time offsets for scaling, REAL(8)
-        i+=8
+        header['TimeScl'], header['TimeOff']   = np.fromfile(f, np.float64, 2)  # The time slopes and offsets for scaling, REAL(8)
     else: # without time
-        TimeOut1 = struct.unpack('d',data[i:i+8])[0]        # The first time in the time series, REAL(8)
-        i+=8
-        TimeIncr = struct.unpack('d',data[i:i+8])[0]        # The time increment, REAL(8)
-        i+=8
-    
-    ColScl = [None]*NumOutChans
-    for idx in range(0,NumOutChans):
-        ColScl[idx] = struct.unpack('f',data[i:i+4])[0]     # The channel slopes for scaling, REAL(4)
-        i+=4
-
-    ColOff = [None]*NumOutChans
-    for idx in range(0,NumOutChans):
-        ColOff[idx] = struct.unpack('f',data[i:i+4])[0]     # The channel offsets for scaling, REAL(4)
-        i+=4
-
-    LenDesc = struct.unpack('i',data[i:i+4])[0]             # The number of characters in the description string, INT(4)
-    i+=4
-    try:
-        DescStr = ''.join(struct.unpack(str('c'*LenDesc),data[i:i+LenDesc]))     # DescStr converted to ASCII
-    except:
-        DescStr = data[i:i+LenDesc].decode("utf-8").strip()
-    i+=LenDesc
-
-    ChanName = [None]*(NumOutChans+1)
-    for idx in range(0,NumOutChans+1):
-        try:
-            ChanName[idx] = ''.join(''.join(struct.unpack('c'*LenName,data[i:i+LenName]))).strip()  # variable channel names
-        except:
-            ChanName[idx] = data[i:i+LenName].decode("utf-8").strip()
-        i+=LenName
+        header['TimeOut1'], header['TimeIncr'] = np.fromfile(f, np.float64, 2)  # The first time in the time series and the time increment, REAL(8)
 
-    ChanUnit = [None]*(NumOutChans+1)
-    for idx in range(0,NumOutChans+1):
-        try:
-            ChanUnit[idx] = ''.join(''.join(struct.unpack('c'*LenUnit,data[i:i+LenUnit]))).strip()  # variable units
-        except:
-            ChanUnit[idx] = data[i:i+LenUnit].decode("utf-8").strip()
-        i+=LenUnit
+    ColScl  = np.fromfile(f, np.float32, NumOutChans)       # The channel slopes for scaling, REAL(4)
+    ColOff  = np.fromfile(f, np.float32, NumOutChans)       # The channel offsets for scaling, REAL(4)
 
-    #-------------------------        
-    # get the channel time series
-    #-------------------------
-    nPts = NT*NumOutChans                                       # number of data points in the file   
+    LenDesc = np.fromfile(f, np.int32, 1)[0]                # The number of characters in the description string, INT(4)
+    DescStr = f.read(LenDesc).decode('utf-8', 'replace').strip()
+
+    names    = f.read(LenName*(NumOutChans+1)).decode('utf-8', 'replace')
+    ChanName = [names[k*LenName:(k+1)*LenName].strip() for k in range(NumOutChans+1)]   # variable channel names
+    units    = f.read(LenUnit*(NumOutChans+1)).decode('utf-8', 'replace')
+    ChanUnit = [units[k*LenUnit:(k+1)*LenUnit].strip() for k in range(NumOutChans+1)]   # variable units
 
     if FileID == 1:
-        PackedTime = struct.unpack('i'*NT,data[i:i+4*NT])[0]    # read the time data
-        i+=4*NT
-    
-    PackedData = [None]*nPts
-    for idx in range(0,nPts):
-        PackedData[idx] = struct.unpack('h',data[i:i+2])[0]     # read the channel data
-        i+=2
+        header['PackedTime'] = np.fromfile(f, np.int32, NT) # read the time data
+    header['offset'] = f.tell()                             # start of the channel data
+    f.close()
 
     #-------------------------
-    # Scale the packed binary to real data
+    # select the requested channels (time is always column 0)
     #-------------------------
-    Channels = np.zeros((NT,NumOutChans+1))                     # output channels (including time in column 1)
-    for it in range(0,NT):
-        data_slice = PackedData[NumOutChans*(it):NumOutChans*(it+1)]
-        for idx, (datai, ColOffi, ColScli) in enumerate(zip(data_slice, ColOff, ColScl)):
-            Channels[it,idx+1] = (datai - ColOffi) / ColScli
-
-    if FileID == 1:
-        for idx, (PackedTimei, TimeOffi, TimeScli) in enumerate(zip(PackedTime, TimeOff, TimeScl)):
-            Channels[idx,0] = (PackedTimei - TimeOffi) / TimeScli
+    if OutList is None:
+        cols = np.arange(NumOutChans)
+    else:
+        missing = [chan for chan in OutList if chan not in ChanName]
+        if missing:
+            raise ValueError('Channels not found in %s: %s' % (FileName, ', '.join(missing)))
+        cols = np.array([ChanName.index(chan, 1) - 1 for chan in OutList if chan != ChanName[0]], dtype=int)
+
+    header['FileID']      = FileID
+    header['NumOutChans'] = NumOutChans
+    header['NT']          = NT
+    header['ColScl']      = ColScl[cols]
+    header['ColOff']      = ColOff[cols]
+    header['cols']        = cols
+    header['DescStr']     = DescStr
+    header['ChanName']    = [ChanName[0]] + [ChanName[k+1] for k in cols]
+    header['ChanUnit']    = [ChanUnit[0]] + [ChanUnit[k+1] for k in cols]
+
+    return header
+
+def ScaleFASTbinary(FileName, header, i0, i1):
+    # map time steps i0 to i1 of the channel data and scale the packed binary to real data
+    NT       = i1 - i0
+    cols     = header['cols']
+    Channels = np.empty((NT, cols.size+1))                  # output channels (including time in column 1)
+    if NT > 0 and cols.size > 0:
+        NumOutChans = header['NumOutChans']
+        PackedData  = np.memmap(FileName, dtype=np.int16, mode='r', offset=header['offset'] + 2*i0*NumOutChans, shape=(NT, NumOutChans))
+        Channels[:,1:] = PackedData[:,cols]
+        del PackedData
+        Channels[:,1:] -= header['ColOff']
+        Channels[:,1:] /= header['ColScl']
+
+    if header['FileID'] == 1:
+        Channels[:,0] = (header['PackedTime'][i0:i1] - header['TimeOff']) / header['TimeScl']
     else:
-        for idx in range(0,NT):
-            Channels[idx,0] = TimeOut1 + TimeIncr*idx
+        Channels[:,0] = header['TimeOut1'] + header['TimeIncr']*np.arange(i0, i1)
 
-    return Channels, ChanName, ChanUnit, FileID, DescStr
+    return Channels
 
-def ReadFASTtext(FileName):
+def ReadFASTtext(FileName, OutList=None):
 
     f = open(FileName, 'r')
 
@@ -187,7 +182,16 @@ def ReadFASTtext(FileName):
     DescStr = ' '.join(DescStr).strip()
     ChanName = ln.split()
     ChanUnit = f.readline().split()
-    Channels = np.loadtxt(f)
+    if OutList is None:
+        cols = list(range(len(ChanName)))
+    else:
+        missing = [chan for chan in OutList if chan not in ChanName]
+        if missing:
+            raise ValueError('Channels not found in %s: %s' % (FileName, ', '.join(missing)))
+        cols = [0] + [ChanName.index(chan, 1) for chan in OutList if chan != ChanName[0]]
+    ChanName = [ChanName[k] for k in cols]
+    ChanUnit = [ChanUnit[k] for k in cols]
+    Channels = np.loadtxt(f, usecols=cols, ndmin=2)
     f.close()
 
     return Channels, ChanName, ChanUnit, None, DescStr
@@ -0,0 +1,196 @@
+"""
+Reading and writing of TurbSim full-field binary wind files (.bts).
+Based on the Matlab function readfile_BTS.m by Bonnie Jonkman.
+
+The header is parsed once and the velocities are memory mapped; scaling from
+the stored 16 bit integers to m/s is only applied to the parts of the grid
+that are indexed, so hub height or single point time series can be taken
+from large files without decoding the whole grid.
+
+Usage:
+    bts = TurbSimBTS(FileName)
+    u   = bts.velocity[:, 0, :, :]      # (nt, ny, nz) longitudinal component
+    uvw = bts.hub()                     # (nt, 3) at hub height
+    WriteTurbSimBTS(FileName_out, bts.velocity, bts.dt, bts.dy, bts.dz, bts.z1, bts.zHub, bts.uHub)
+"""
+import numpy as np
+
+# Layout of the fixed part of the header, the slope and offset of each component are stored in pairs:
+# u slope, u offset, v slope, v offset, w slope, w offset
+HEADER = np.dtype([('FileID', '<i2'), ('nz', '<i4'), ('ny', '<i4'), ('ntwr', '<i4'), ('nt', '<i4'),
+                   ('dz', '<f4'), ('dy', '<f4'), ('dt', '<f4'), ('uHub', '<f4'), ('zHub', '<f4'), ('z1', '<f4'),
+                   ('VslopeVoffset', '<f4', (3, 2)), ('nchar', '<i4')])
+NFFC = 3    # number of velocity components
+
+
+class TurbSimBTS(object):
+    """
+    Memory mapped TurbSim .bts file.
+
+    Attributes:
+        velocity    - ScaledView: grid velocities, (nt, 3, ny, nz), m/s
+        tower       - ScaledView: tower velocities, (nt, 3, ntwr), m/s
+        t, y, z     - array: time (s), lateral and vertical grid coordinates (m)
+        FileID, nt, ny, nz, ntwr, dt, dy, dz, uHub, zHub, z1, Vslope, Voffset, DescStr - header data
+    """
+
+    def __init__(self, FileName):
+        self.FileName = FileName
+
+        header = np.fromfile(FileName, dtype=HEADER, count=1)
+        if header.size == 0:
+            raise ValueError('%s is not a TurbSim binary file' % FileName)
+        header = header[0]
+        for name in HEADER.names:
+            if name != 'VslopeVoffset':
+                setattr(self, name, header[name].item())
+        self.Vslope  = header['VslopeVoffset'][:, 0].copy()
+        self.Voffset = header['VslopeVoffset'][:, 1].copy()
+        if self.FileID not in [7, 8]:
+            raise ValueError('%s is not a TurbSim binary file (FileID = %d)' % (FileName, self.FileID))
+
+        with open(FileName, 'rb') as f:
+            f.seek(HEADER.itemsize)
+            self.DescStr = f.read(self.nchar).decode('ascii', 'replace')
+        offset = HEADER.itemsize + self.nchar
+
+        # each time step holds the grid, z slowest and the component fastest, then the tower points
+        nv   = NFFC*self.ny*self.nz
+        data = np.memmap(FileName, dtype='<i2', mode='r', offset=offset, shape=(self.nt, nv + NFFC*self.ntwr))
+
+        grid  = data[:, :nv].reshape(self.nt, self.nz, self.ny, NFFC).transpose(0, 3, 2, 1)
+        tower = data[:, nv:].reshape(self.nt, self.ntwr, NFFC).transpose(0, 2, 1)
+        self.velocity = ScaledView(grid, self.Vslope, self.Voffset, axis=1)
+        self.tower    = ScaledView(tower, self.Vslope, self.Voffset, axis=1)
+
+        self.t = self.dt*np.arange(self.nt)
+        self.y = self.dy*(np.arange(self.ny) - 0.5*(self.ny - 1))
+        self.z = self.z1 + self.dz*np.arange(self.nz)
+
+    @property
+    def periodic(self):
+        return self.FileID == 8
+
+    def point(self, y, z):
+        # velocity time series (nt, 3) at lateral position y and height z,
+        # bilinear between the surrounding grid points
+        iy, wy = _bracket(self.y, y, 'y')
+        iz, wz = _bracket(self.z, z, 'z')
+        v = self.velocity[:, :, iy:iy+2, iz:iz+2]
+        w = np.outer([1. - wy, wy], [1. - wz, wz])[:v.shape[2], :v.shape[3]]
+        return np.einsum('tkyz,yz->tk', v, w)
+
+    def hub(self):
+        # velocity time series (nt, 3) at the hub
+        return self.point(0., self.zHub)
+
+
+class ScaledView(object):
+    """
+    Lazily scaled view of a memory mapped integer array: indexing returns
+    (raw - Voffset)/Vslope for the selected elements only, with the scaling
+    of each velocity component taken along axis.
+    """
+
+    def __init__(self, raw, Vslope, Voffset, axis=1):
+        self.raw = raw
+        shape = [1]*raw.ndim
+        shape[axis] = NFFC
+        self.Vslope  = np.broadcast_to(np.reshape(Vslope, shape), raw.shape)
+        self.Voffset = np.broadcast_to(np.reshape(Voffset, shape), raw.shape)
+
+    @property
+    def shape(self):
+        return self.raw.shape
+
+    @property
+    def ndim(self):
+        return self.raw.ndim
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, idx):
+        return (self.raw[idx] - self.Voffset[idx]) / self.Vslope[idx]
+
+    def __array__(self, dtype=None):
+        out = self[...]
+        return out if dtype is None else out.astype(dtype)
+
+
+def WriteTurbSimBTS(FileName, velocity, dt, dy, dz, z1, zHub, uHub, tower=None, DescStr='', periodic=False, ChunkSize=1000):
+    """
+    Write a TurbSim .bts file.
+
+    Inputs:
+        velocity    - array: grid velocities, (nt, 3, ny, nz), m/s; a ScaledView is read in blocks
+        dt, dy, dz  - float: time step (s), lateral and vertical grid spacing (m)
+        z1          - float: height of the bottom of the grid, m
+        zHub, uHub  - float: hub height (m) and mean hub height wind speed (m/s)
+        tower       - array: (optional) tower velocities, (nt, 3, ntwr), m/s
+        DescStr     - string: (optional) description
+        periodic    - bool: (optional) the wind field is periodic in time
+        ChunkSize   - int: (optional) number of time steps scaled at a time
+    """
+    nt, nffc, ny, nz = velocity.shape
+    if nffc != NFFC:
+        raise ValueError('velocity should have shape (nt, 3, ny, nz), got %s' % (velocity.shape,))
+    ntwr = 0 if tower is None else tower.shape[2]
+
+    # scale each component over its full range to the 16 bit integers
+    vmin = np.full(NFFC, np.inf)
+    vmax = np.full(NFFC, -np.inf)
+    for i0, i1, v, vt in _blocks(velocity, tower, ChunkSize):
+        vmin = np.minimum(vmin, v.min(axis=(0, 2, 3)))
+        vmax = np.maximum(vmax, v.max(axis=(0, 2, 3)))
+        if ntwr > 0:
+            vmin = np.minimum(vmin, vt.min(axis=(0, 2)))
+            vmax = np.maximum(vmax, vt.max(axis=(0, 2)))
+    IntMin = -32768.
+    IntRng = 65535.
+    vrng    = vmax - vmin
+    Vslope  = np.where(vrng > 0., IntRng / np.where(vrng > 0., vrng, 1.), 1.).astype(np.float32)
+    Voffset = (IntMin - Vslope*vmin).astype(np.float32)
+
+    desc = DescStr.encode('ascii', 'replace')
+    header = np.zeros(1, dtype=HEADER)
+    header['FileID'] = 8 if periodic else 7
+    header['nz'], header['ny'], header['ntwr'], header['nt'] = nz, ny, ntwr, nt
+    header['dz'], header['dy'], header['dt'] = dz, dy, dt
+    header['uHub'], header['zHub'], header['z1'] = uHub, zHub, z1
+    header['VslopeVoffset'] = np.c_[Vslope, Voffset]
+    header['nchar'] = len(desc)
+
+    sl = Vslope.astype(float)
+    of = Voffset.astype(float)
+    with open(FileName, 'wb') as f:
+        header.tofile(f)
+        f.write(desc)
+        for i0, i1, v, vt in _blocks(velocity, tower, ChunkSize):
+            n   = i1 - i0
+            out = [(v.transpose(0, 3, 2, 1) * sl + of).reshape(n, -1)]
+            if ntwr > 0:
+                out.append((vt.transpose(0, 2, 1) * sl + of).reshape(n, -1))
+            out = np.clip(np.rint(np.hstack(out)), IntMin, IntMin + IntRng)
+            out.astype('<i2').tofile(f)
+
+
+def _blocks(velocity, tower, ChunkSize):
+    # blocks of time steps (i0, i1, grid, tower) as float arrays
+    nt = velocity.shape[0]
+    for i0 in range(0, nt, ChunkSize):
+        i1 = min(i0 + ChunkSize, nt)
+        v  = np.asarray(velocity[i0:i1], dtype=float)
+        vt = None if tower is None else np.asarray(tower[i0:i1], dtype=float)
+        yield i0, i1, v, vt
+
+
+def _bracket(x, xi, name):
+    # lower grid index and interpolation weight of xi in the uniform grid x
+    if x.size == 1:
+        return 0, 0.
+    s = (xi - x[0]) / (x[1] - x[0])
+    if s < -1e-6 or s > x.size - 1 + 1e-6:
+        raise ValueError('%s = %g is outside of the grid, %g to %g' % (name, xi, x[0], x[-1]))
+    i = int(min(max(np.floor(s), 0), x.size - 2))
+    return i, float(min(max(s - i, 0.), 1.))
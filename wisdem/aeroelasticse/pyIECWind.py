@@ -5,6 +5,7 @@ import os, sys
 from wisdem.aeroelasticse.Turbsim_mdao.turbsim_writer import TurbsimBuilder
 from wisdem.aeroelasticse.Turbsim_mdao.turbsim_wrapper import Turbsim_wrapper
 from wisdem.aeroelasticse.Turbsim_mdao.turbsim_vartrees import turbsiminputs
+from wisdem.aeroelasticse.pyVeers import VeersTurbulence
 
 # from AeroelasticSE.Turbsim_mdao.pyturbsim_wrapper import pyTurbsim_wrapper
 
@@ -434,6 +435,7 @@ class pyIECWind_turb():
         self.debug_level       = 0
         self.overwrite         = True
         self.flag_enlarge_grid = False
+        self.wind_generator    = 'Turbsim'  # 'Turbsim', 'pyTurbsim' or 'Veers' (in-process, see pyVeers)
 
     def setup(self):
         turbsim_vt = turbsiminputs()
@@ -482,7 +484,13 @@ class pyIECWind_turb():
         
         return turbsim_vt
 
-    def execute(self, IEC_WindType, Uref, ver='Turbsim'):
+    def execute(self, IEC_WindType, Uref, ver=None):
+        if ver is None:
+            ver = self.wind_generator
+        if ver.lower() == 'veers':
+            wind_file_out_abs, wind_file_type = self.execute_seeds(IEC_WindType, Uref, [self.seed])
+            return wind_file_out_abs[0], wind_file_type[0]
+
         self.IEC_WindType = IEC_WindType
         self.Uref = Uref
 
@@ -524,6 +532,49 @@ class pyIECWind_turb():
 
             return wind_file_out_abs, 3
 
+    def execute_seeds(self, IEC_WindType, Uref, seeds):
+        # Generate the wind files of several seeds in-process, sharing the
+        # coherence factorization between them
+        self.IEC_WindType = IEC_WindType
+        self.Uref = Uref
+
+        turbsim_vt = self.setup()
+        tmspecs    = turbsim_vt.tmspecs
+
+        # Turbulence standard deviation and scale parameter
+        iec = pyIECWind_extreme()
+        iec.Turbulence_Class = self.Turbulence_Class
+        iec.z_hub = self.z_hub
+        if IEC_WindType[0].isdigit():
+            iec.Turbine_Class = ['I', 'II', 'III'][int(IEC_WindType[0])-1]
+        iec.setup()
+        if 'ETM' in IEC_WindType:
+            sigma_1 = iec.ETM(Uref)
+        elif 'EWM' in IEC_WindType:
+            sigma_1 = iec.EWM(Uref)[0]
+        else:
+            sigma_1 = iec.NTM(Uref)
+
+        wind_file_out_abs = []
+        seeds_run = []
+        for seed in seeds:
+            case_name = self.case_name + '_' + IEC_WindType + '_U%1.6f'%self.Uref + '_Seed%1.1f'%seed
+            wind_file_out = os.path.join(self.outdir, case_name + '.bts')
+            wind_file_out_abs.append(os.path.realpath(os.path.normpath(wind_file_out)))
+            # If wind file already exists and overwriting is turned off, skip wind file write
+            if self.overwrite or not os.path.exists(wind_file_out):
+                seeds_run.append(seed)
+
+        if seeds_run:
+            if not os.path.exists(self.outdir):
+                os.makedirs(self.outdir)
+            turb = VeersTurbulence(Uref, sigma_1, iec.Sigma_1, self.z_hub, self.PLExp,
+                                   tmspecs.NumGrid_Y, tmspecs.NumGrid_Z, tmspecs.GridWidth, tmspecs.GridHeight,
+                                   tmspecs.TimeStep, self.AnalysisTime)
+            turb.write_bts([wind_file_out_abs[seeds.index(seed)] for seed in seeds_run], seeds_run)
+
+        return wind_file_out_abs, [3]*len(seeds)
+
 
 def example_ExtremeWind():
 
@@ -0,0 +1,123 @@
+"""
+In-process full-field turbulence generator for the IEC Kaimal model
+(IEC 61400-1 ed. 3, Annex C), using the Veers method.
+
+Fourier coefficients of the longitudinal velocity at every grid point are
+correlated by the Cholesky factor of the IEC exponential coherence matrix at
+each frequency.  The standard only defines the coherence of u, so v and w are
+spatially uncorrelated unless coherent_vw is set.  The coherence only depends
+on the frequency and the point separation, so the factorization of a block of
+frequencies is shared by every seed generated in the same call; the time
+series are recovered with an inverse real FFT.
+"""
+import numpy as np
+
+# memory of one stacked block of coherence matrices, bytes
+BLOCK_BYTES = 2**27
+
+from wisdem.aeroelasticse.Util.TurbSimBTS import WriteTurbSimBTS
+
+
+class VeersTurbulence(object):
+    """
+    Inputs:
+        Uref        - float: mean wind speed at hub height, m/s
+        sigma_1     - float: longitudinal standard deviation at hub height, m/s
+        Lambda_1    - float: longitudinal turbulence scale parameter, m
+        z_hub       - float: hub height, m
+        PLExp       - float: power law exponent of the mean wind profile
+        ny, nz      - int: number of lateral and vertical grid points
+        width       - float: lateral extent of the grid, m
+        height      - float: vertical extent of the grid (centered on the hub), m
+        dt          - float: time step, s
+        T           - float: length of the time series, s
+        coherent_vw - bool: (optional) apply the IEC coherence of u to v and w too
+    """
+
+    def __init__(self, Uref, sigma_1, Lambda_1, z_hub, PLExp, ny, nz, width, height, dt, T, coherent_vw=False):
+        self.Uref     = Uref
+        self.sigma    = sigma_1*np.array([1., 0.8, 0.5])        # C.2
+        self.L        = Lambda_1*np.array([8.1, 2.7, 0.66])     # integral scales of u, v, w
+        self.Lc       = 8.1*Lambda_1                            # coherence scale parameter
+        self.z_hub    = z_hub
+        self.PLExp    = PLExp
+        self.dt       = dt
+        self.coherent = 3 if coherent_vw else 1                 # number of components with spatial coherence
+
+        self.nt = 2*int(np.ceil(0.5*T/dt))
+        self.y  = width*(np.arange(ny)/max(ny - 1., 1.) - 0.5)
+        self.z  = z_hub + height*(np.arange(nz)/max(nz - 1., 1.) - 0.5)
+        if self.z[0] <= 0.:
+            raise ValueError('The turbulence grid extends below the ground, reduce its height')
+
+        Y, Z   = np.meshgrid(self.y, self.z, indexing='ij')
+        self.Y = Y.ravel()
+        self.Z = Z.ravel()
+
+        # frequencies between the mean and the Nyquist frequency, and their Kaimal spectra
+        self.df = 1./(self.nt*dt)
+        self.f  = self.df*np.arange(1, self.nt//2)
+        S = 4.*self.sigma[:,np.newaxis]**2*self.L[:,np.newaxis]/Uref / (1. + 6.*self.f*self.L[:,np.newaxis]/Uref)**(5./3.)
+        self.amp = self.nt*np.sqrt(0.5*S*self.df)
+
+    def generate(self, seeds, FreqBlock=None):
+        # velocity fields (nt, 3, ny, nz), m/s, one per seed; by default the
+        # frequencies are blocked so that a block of coherence matrices takes
+        # about BLOCK_BYTES
+        ny, nz = self.y.size, self.z.size
+        npts   = ny*nz
+        nf     = self.f.size
+        nseed  = len(seeds)
+        nc     = self.coherent
+        rngs   = [np.random.RandomState(int(seed) % 2**32) for seed in seeds]
+        if FreqBlock is None:
+            FreqBlock = max(1, int(BLOCK_BYTES // (8*npts**2)))
+
+        r = np.sqrt((self.Y[:,np.newaxis] - self.Y)**2 + (self.Z[:,np.newaxis] - self.Z)**2)
+        C = np.zeros((nseed, 3, self.nt//2 + 1, npts), dtype=np.complex64)
+        for b0 in range(0, nf, FreqBlock):
+            b1 = min(b0 + FreqBlock, nf)
+            nb = b1 - b0
+
+            # random phases, drawn from each seed's own stream frequency by
+            # frequency, so the fields do not depend on the blocking
+            X = np.exp(1j*np.array([rng.uniform(0., 2.*np.pi, (nb, 3, npts)) for rng in rngs]))
+
+            # C.3, exponential coherence, factorized once for all seeds
+            kappa = 12.*np.sqrt((self.f[b0:b1]/self.Uref)**2 + (0.12/self.Lc)**2)
+            H  = _cholesky(np.exp(-kappa[:,np.newaxis,np.newaxis]*r))
+            Xc = X[:, :, :nc, :].transpose(1, 3, 0, 2).reshape(nb, npts, nseed*nc)
+            X[:, :, :nc, :] = np.matmul(H, Xc).reshape(nb, npts, nseed, nc).transpose(2, 0, 3, 1)
+
+            C[:, :, 1+b0:1+b1, :] = self.amp[np.newaxis, :, b0:b1, np.newaxis]*X.transpose(0, 2, 1, 3)
+
+        # mean wind profile, added to the longitudinal component
+        U = self.Uref*(self.z/self.z_hub)**self.PLExp
+        ihub = (np.argmin(np.abs(self.y)), np.argmin(np.abs(self.z - self.z_hub)))
+        for i in range(nseed):
+            v = np.fft.irfft(C[i], n=self.nt, axis=1).reshape(3, self.nt, ny, nz)
+
+            # scale every point with the same factor to match the target
+            # standard deviations at the hub, as TurbSim does (ScaleIEC = 1)
+            std = np.std(v[:, :, ihub[0], ihub[1]], axis=1)
+            v  *= (self.sigma/np.where(std > 0., std, 1.))[:, np.newaxis, np.newaxis, np.newaxis]
+            v[0] += U
+
+            yield v.transpose(1, 0, 2, 3)
+
+    def write_bts(self, FileNames, seeds, FreqBlock=None, DescStr='Generated by pyVeers'):
+        # write one .bts file per seed
+        for fname, v in zip(FileNames, self.generate(seeds, FreqBlock)):
+            WriteTurbSimBTS(fname, v, self.dt, self.y[1] - self.y[0] if self.y.size > 1 else 0.,
+                            self.z[1] - self.z[0] if self.z.size > 1 else 0.,
+                            self.z[0], self.z_hub, self.Uref, DescStr=DescStr)
+
+
+def _cholesky(A):
+    # stacked Cholesky factors; the coherence is nearly singular at low
+    # frequencies, so fall back to a clipped eigen decomposition
+    try:
+        return np.linalg.cholesky(A)
+    except np.linalg.LinAlgError:
+        w, V = np.linalg.eigh(A)
+        return V*np.sqrt(np.maximum(w, 0.))[:, np.newaxis, :]
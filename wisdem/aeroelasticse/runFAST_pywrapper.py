@@ -5,7 +5,7 @@ programmatically with minimal additional dependencies.
 """
 # Hacky way of doing relative imports
 from __future__ import print_function
-import os, sys, time
+import os, sys, time, copy
 import multiprocessing as mp
 # sys.path.insert(0, os.path.abspath(".."))
 
@@ -33,6 +33,8 @@ class runFAST_pywrapper(object):
         self.channels = {}              # dictionary of output channels to change
         self.debug_level   = 0
         self.dev_branch = False
+        self.cache = None               # FASTCache of previous runs
+        self.restored = False           # the last execute restored the output file from the cache
 
         # Optional population class attributes from key word arguments
         for (k, w) in kwargs.items():
@@ -43,7 +45,8 @@ class runFAST_pywrapper(object):
 
         super(runFAST_pywrapper, self).__init__()
 
-    def execute(self):
+    def setup(self):
+        # Read the input model and apply the case changes, returns the writer
         # FAST version specific initialization
         if self.FAST_ver.lower() == 'fast7':
             reader = InputReader_FAST7(FAST_ver=self.FAST_ver)
@@ -51,7 +54,6 @@ class runFAST_pywrapper(object):
         elif self.FAST_ver.lower() in ['fast8','openfast']:
             reader = InputReader_OpenFAST(FAST_ver=self.FAST_ver)
             writer = InputWriter_OpenFAST(FAST_ver=self.FAST_ver)
-        wrapper = FastWrapper(FAST_ver=self.FAST_ver, debug_level=self.debug_level)
 
         # Read input model, FAST files or Yaml
         if self.fst_vt == {}:
@@ -77,6 +79,24 @@ class runFAST_pywrapper(object):
         # Modify any specified output channels
         if self.channels:
             writer.update_outlist(self.channels)
+
+        return writer
+
+    def execute(self, writer=None, key=None):
+        if writer is None:
+            writer = self.setup()
+        wrapper = FastWrapper(FAST_ver=self.FAST_ver, debug_level=self.debug_level)
+
+        # Reuse the stored output file of an identical run
+        self.restored = False
+        if self.cache is not None:
+            if key is None:
+                key = self.cache.key(writer.fst_vt, self.FAST_exe, self.FAST_ver, self.FAST_directory)
+            FAST_Output = os.path.join(self.FAST_runDirectory, self.FAST_namingOut+'.outb')
+            if self.cache.restore(key, FAST_Output):
+                self.restored = True
+                return FAST_Output
+
         # Write out FAST model
         writer.execute()
         if self.write_yaml:
@@ -115,6 +135,10 @@ class runFAST_pywrapper_batch(object):
         self.channels           = {}
 
         self.post               = None
+        self.aggregate          = False     # merge the post-processed output of each case as it finishes (e.g. post=stream_stats)
+        self.callback           = None      # called as callback(case_name, output) when each case finishes
+        self.cache              = None      # FASTCache reused across runs of identical cases
+        self.run_times          = {}        # wall time of previous runs, by case name, used to schedule cases
 
         # Optional population of class attributes from key word arguments
         for (k, w) in kwargs.items():
@@ -132,14 +156,14 @@ class runFAST_pywrapper_batch(object):
         if not os.path.exists(self.FAST_runDirectory):
             os.makedirs(self.FAST_runDirectory)
 
-        out = [None]*len(self.case_list)
-        for i, (case, case_name) in enumerate(zip(self.case_list, self.case_name_list)):
-            out[i] = eval(case, case_name, self.FAST_ver, self.FAST_exe, self.FAST_runDirectory, self.FAST_InputFile, self.FAST_directory, self.read_yaml, self.FAST_yamlfile_in, self.fst_vt, self.write_yaml, self.FAST_yamlfile_out, self.channels, self.debug_level, self.dev_branch, self.post)
+        out = (eval_indexed(job) for job in self.case_jobs(range(len(self.case_list))))
 
-        return out
+        return self.collect(out)
 
     def run_multi(self, cores=None):
-        # Run cases in parallel, threaded with multiprocessing module
+        # Run cases in parallel, threaded with multiprocessing module.  Cases are
+        # handed out one at a time, most expensive first, to whichever process
+        # is free, and results are collected as they finish
 
         if not os.path.exists(self.FAST_runDirectory):
             os.makedirs(self.FAST_runDirectory)
@@ -148,90 +172,111 @@ class runFAST_pywrapper_batch(object):
             cores = mp.cpu_count()
         pool = mp.Pool(cores)
 
-        case_data_all = []
-        for i in range(len(self.case_list)):
-            case_data = []
-            case_data.append(self.case_list[i])
-            case_data.append(self.case_name_list[i])
-            case_data.append(self.FAST_ver)
-            case_data.append(self.FAST_exe)
-            case_data.append(self.FAST_runDirectory)
-            case_data.append(self.FAST_InputFile)
-            case_data.append(self.FAST_directory)
-            case_data.append(self.read_yaml)
-            case_data.append(self.FAST_yamlfile_in)
-            case_data.append(self.fst_vt)
-            case_data.append(self.write_yaml)
-            case_data.append(self.FAST_yamlfile_out)
-            case_data.append(self.channels)
-            case_data.append(self.debug_level)
-            case_data.append(self.dev_branch)
-            case_data.append(self.post)
-
-            case_data_all.append(case_data)
-
-        output = pool.map(eval_multi, case_data_all)
+        output = self.collect(pool.imap_unordered(eval_indexed, self.case_jobs(self.schedule()), chunksize=1))
         pool.close()
         pool.join()
 
         return output
 
     def run_mpi(self, mpi_comm_map_down):
-        # Run in parallel with mpi
+        # Run in parallel with mpi.  Each sub rank is given a case, most expensive
+        # first, and is sent the next one as soon as it returns its result
         from mpi4py import MPI
 
         # mpi comm management
         comm = MPI.COMM_WORLD
         rank = comm.Get_rank()
         sub_ranks = mpi_comm_map_down[rank]
-        size = len(sub_ranks)
 
-        N_cases = len(self.case_list)
-        N_loops = int(np.ceil(float(N_cases)/float(size)))
-        
         # file management
         if not os.path.exists(self.FAST_runDirectory) and rank == 0:
             os.makedirs(self.FAST_runDirectory)
 
-        case_data_all = []
-        for i in range(N_cases):
-            case_data = []
-            case_data.append(self.case_list[i])
-            case_data.append(self.case_name_list[i])
-            case_data.append(self.FAST_ver)
-            case_data.append(self.FAST_exe)
-            case_data.append(self.FAST_runDirectory)
-            case_data.append(self.FAST_InputFile)
-            case_data.append(self.FAST_directory)
-            case_data.append(self.read_yaml)
-            case_data.append(self.FAST_yamlfile_in)
-            case_data.append(self.fst_vt)
-            case_data.append(self.write_yaml)
-            case_data.append(self.FAST_yamlfile_out)
-            case_data.append(self.channels)
-            case_data.append(self.debug_level)
-            case_data.append(self.dev_branch)
-            case_data.append(self.post)
-
-            case_data_all.append(case_data)
-
-        output = []
-        for i in range(N_loops):
-            idx_s    = i*size
-            idx_e    = min((i+1)*size, N_cases)
-
-            for j, case_data in enumerate(case_data_all[idx_s:idx_e]):
-                data   = [eval_multi, case_data]
-                rank_j = sub_ranks[j]
-                comm.send(data, dest=rank_j, tag=0)
-
-            # for rank_j in sub_ranks:
-            for j, case_data in enumerate(case_data_all[idx_s:idx_e]):
-                rank_j = sub_ranks[j]
-                data_out = comm.recv(source=rank_j, tag=1)
-                output.append(data_out)
+        jobs = self.case_jobs(self.schedule())
+
+        def receive():
+            running = 0
+            for rank_j in sub_ranks:
+                job = next(jobs, None)
+                if job is None:
+                    break
+                comm.send([eval_indexed, job], dest=rank_j, tag=0)
+                running += 1
+
+            status = MPI.Status()
+            while running > 0:
+                data_out = comm.recv(source=MPI.ANY_SOURCE, tag=1, status=status)
+                running -= 1
+                job = next(jobs, None)
+                if job is not None:
+                    comm.send([eval_indexed, job], dest=status.Get_source(), tag=0)
+                    running += 1
+                yield data_out
+
+        return self.collect(receive())
+
+    def case_jobs(self, order):
+        # Argument lists for eval_indexed, in the given order of case indices
+        for i in order:
+            yield [i, self.case_list[i], self.case_name_list[i], self.FAST_ver, self.FAST_exe, self.FAST_runDirectory, self.FAST_InputFile, self.FAST_directory, self.read_yaml, self.FAST_yamlfile_in, self.fst_vt, self.write_yaml, self.FAST_yamlfile_out, self.channels, self.debug_level, self.dev_branch, self.post, self.cache]
+
+    def schedule(self):
+        # Case indices ordered by decreasing expected cost, so that the longest
+        # cases start first and do not hold up the end of the batch
+        size = [self.case_size(case) for case in self.case_list]
+        rate = [self.run_times[name] / size_i for size_i, name in zip(size, self.case_name_list) if name in self.run_times and size_i > 0.]
+        rate = np.median(rate) if rate else 1.
+
+        cost = [self.case_cost(case_name, size_i, rate) for size_i, case_name in zip(size, self.case_name_list)]
+        return sorted(range(len(cost)), key=lambda i: -cost[i])
+
+    def case_cost(self, case_name, size, rate=1.):
+        # Expected wall time of a case: the measured time of a previous run of
+        # the same case if there is one, otherwise its size (see case_size)
+        # scaled by rate, the median run time per unit size of the cases
+        # already run
+        if case_name in self.run_times:
+            return self.run_times[case_name]
+        return size * rate
+
+    def case_size(self, case):
+        # Simulated time (TMax) of a case, weighted up for full field turbulent inflow
+        def value(module, var, default):
+            if (module, var) in case:
+                return case[(module, var)]
+            return self.fst_vt.get(module, {}).get(var, default)
+        try:
+            TMax = float(value('Fst', 'TMax', 1.))
+        except (TypeError, ValueError):
+            TMax = 1.
+        turbulent = str(value('InflowWind', 'WindType', 1)).strip() in ['3', '4']
+        return TMax * (2. if turbulent else 1.)
+
+    def collect(self, outputs):
+        # Gather the (index, wall time, output) of each case as it finishes,
+        # returning the outputs in case order; with aggregate set, each result is
+        # merged into a running total and then discarded.  The total starts from
+        # a copy of the first result, so results kept by the callback are never
+        # modified.  Results are merged in case order, holding any that arrive
+        # early, so that the total does not depend on which cases finish first
+        out     = [None]*len(self.case_list)
+        total   = None
+        pending = {}
+        i_next  = 0
+        for i, run_time, out_i in outputs:
+            self.run_times[self.case_name_list[i]] = run_time
+            if self.callback:
+                self.callback(self.case_name_list[i], out_i)
+            if self.aggregate:
+                pending[i] = out_i
+                while i_next in pending:
+                    out_i  = pending.pop(i_next)
+                    total  = copy.deepcopy(out_i) if total is None else total.merge(out_i)
+                    i_next += 1
+            else:
+                out[i] = out_i
 
-        return output
+        return total if self.aggregate else out
 
 
     # def run_mpi(self, comm=None):
@@ -319,7 +364,7 @@ class runFAST_pywrapper_batch(object):
 
 
 
-def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch, post):
+def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch, post, cache=None):
     # Batch FAST pyWrapper call, as a function outside the runFAST_pywrapper_batch class for pickle-ablility
 
     fast = runFAST_pywrapper(FAST_ver=FAST_ver)
@@ -339,8 +384,20 @@ def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile,
     fast.case               = case
     fast.channels           = channels
     fast.debug_level        = debug_level
+    fast.cache              = cache
 
-    FAST_Output = fast.execute()
+    # Return the stored output of an identical case
+    writer = None
+    key    = None
+    if cache is not None:
+        writer = fast.setup()
+        key = cache.key(writer.fst_vt, FAST_exe, FAST_ver, FAST_directory)
+        if post:
+            hit, out = cache.load(key, post)
+            if hit:
+                return out
+
+    FAST_Output = fast.execute(writer, key)
 
     # Post process
     if post:
@@ -348,12 +405,26 @@ def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile,
     else:
         out = []
 
+    # A restored output file is already stored, only its post-processed output may be new
+    if cache is not None:
+        if not fast.restored:
+            cache.store(key, post, out, FAST_Output)
+        elif post:
+            cache.store(key, post, out)
+
     return out
 
 def eval_multi(data):
     # helper function for running with multiprocessing.Pool.map
     # converts list of arguement values to arguments
-    return eval(data[0], data[1], data[2], data[3], data[4], data[5], data[6], data[7], data[8], data[9], data[10], data[11], data[12], data[13], data[14], data[15])
+    return eval(*data)
+
+def eval_indexed(data):
+    # helper function for the batch schedulers: runs the case eval_multi(data[1:])
+    # and returns its index data[0], the wall time and the output
+    t0  = time.time()
+    out = eval_multi(data[1:])
+    return data[0], time.time() - t0, out
 
 def example_runFAST_pywrapper_batch():
     """ 
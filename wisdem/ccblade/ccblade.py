@@ -23,6 +23,8 @@ limitations under the License.
 from __future__ import print_function
 import numpy as np
 from math import pi, radians, sin, cos, isnan
+from collections import OrderedDict
+import hashlib
 from scipy.optimize import brentq
 from scipy.interpolate import RectBivariateSpline, bisplev
 import warnings
@@ -41,6 +43,11 @@ class CCAirfoil(object):
     """A helper class to evaluate airfoil data using a continuously
     differentiable cubic spline"""
 
+    # fitted instances keyed by a hash of their polar data (see cached), the
+    # same instance is handed to every caller and must not be modified
+    cache_size = 256
+    _cache = OrderedDict()
+
 
     def __init__(self, alpha, Re, cl, cd, cm=[]):
         """Setup CCAirfoil from raw airfoil data on a grid.
@@ -89,6 +96,12 @@ class CCAirfoil(object):
         if self.use_cm > 0:
             self.cm_spline = RectBivariateSpline(alpha, Re, cm, kx=kx, ky=ky, s=0.0001)
 
+        # spline representation for bisplev (derivatives)
+        self.tck_cl = self.cl_spline.tck[:3] + self.cl_spline.degrees  # concatenate lists
+        self.tck_cd = self.cd_spline.tck[:3] + self.cd_spline.degrees
+        if self.use_cm:
+            self.tck_cm = self.cm_spline.tck[:3] + self.cm_spline.degrees
+
 
     @classmethod
     def initFromAerodynFile(cls, aerodynFile):
@@ -107,6 +120,46 @@ class CCAirfoil(object):
         alpha, Re, cl, cd, cm = af.createDataGrid()
         return cls(alpha, Re, cl, cd, cm=cm)
 
+
+    @classmethod
+    def cached(cls, alpha, Re, cl, cd, cm=[]):
+        """return a fitted CCAirfoil for the given polar data, reusing a
+        previously constructed instance when the data are unchanged.
+        Instances are stored in a least-recently-used cache of at most
+        ``CCAirfoil.cache_size`` entries shared by all callers, so the
+        returned object must be treated as immutable: do not set attributes
+        on it or modify its splines and arrays in place (construct a
+        CCAirfoil directly for a private instance).  Sharing is what lets
+        CCAirfoilTable fit each distinct polar only once.
+        Parameters
+        ----------
+        alpha, Re, cl, cd, cm : array_like
+            same as for the constructor
+        Returns
+        -------
+        af : CCAirfoil
+            a constructed (or cached) CCAirfoil object
+        """
+
+        h = hashlib.sha1(cls.__name__.encode())
+        for x in (alpha, Re, cl, cd, cm):
+            x = np.ascontiguousarray(x, dtype=np.float64)
+            h.update(str(x.shape).encode())
+            h.update(x.tobytes())
+        key = h.hexdigest()
+
+        cache = CCAirfoil._cache
+        af = cache.get(key)
+        if af is None:
+            af = cls(alpha, Re, cl, cd, cm=cm)
+            cache[key] = af
+            while len(cache) > max(CCAirfoil.cache_size, 0):
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        return af
+
     
     def max_eff(self, Re):
         # Get the angle of attack, cl and cd at max airfoil efficiency. For a cylinder, set the angle of attack to 0
@@ -211,8 +264,8 @@ class CCAirfoil(object):
     def derivatives(self, alpha, Re):
 
         # note: direct call to bisplev will be unnecessary with latest scipy update (add derivative method)
-        tck_cl = self.cl_spline.tck[:3] + self.cl_spline.degrees  # concatenate lists
-        tck_cd = self.cd_spline.tck[:3] + self.cd_spline.degrees
+        tck_cl = self.tck_cl
+        tck_cd = self.tck_cd
 
         dcl_dalpha = bisplev(alpha, Re, tck_cl, dx=1, dy=0)
         dcd_dalpha = bisplev(alpha, Re, tck_cd, dx=1, dy=0)
@@ -390,6 +443,417 @@ class CCAirfoil(object):
 
         # plt.show()
 
+
+class CCAirfoilTable(object):
+    """Lookup tables for evaluating the CCAirfoil splines of many stations at once.
+    Each distinct airfoil is pre-sampled onto a uniform (alpha, Re) grid spanning
+    its spline domain, storing values and first/cross derivatives, and the tables
+    are stacked in one contiguous array.  Evaluation is cubic Hermite
+    interpolation, so the result is continuously differentiable and reproduces
+    the spline values and slopes at the grid nodes.  With the default grid, 721
+    angles of attack and 8 linearly spaced Reynolds numbers, the coefficients
+    agree with the splines to within 1e-4."""
+
+
+    def __init__(self, af, n_alpha=721, n_Re=8):
+        """Sample the airfoils assigned to each station.
+        Parameters
+        ----------
+        af : list of CCAirfoil
+            airfoil at each station (the same instance may appear more than once)
+        n_alpha : int, optional
+            number of grid points across the angle of attack range of each airfoil
+        n_Re : int, optional
+            number of grid points across the Reynolds number range of each airfoil
+            (not used if no airfoil depends on Reynolds number)
+        """
+
+        unique = []
+        rows = {}
+        self.index = np.zeros(len(af), dtype=int)
+        for i, afi in enumerate(af):
+            if id(afi) not in rows:
+                rows[id(afi)] = len(unique)
+                unique.append(afi)
+            self.index[i] = rows[id(afi)]
+
+        self.use_cm = all(afi.use_cm for afi in unique)
+        self.one_Re = all(afi.one_Re for afi in unique)
+        if self.one_Re:
+            n_Re = 1
+
+        nrow = len(unique)
+        nterm = 2 if self.one_Re else 4
+        self.n_alpha = n_alpha
+        self.n_Re = n_Re
+        self.alpha0 = np.zeros(nrow)
+        self.dalpha = np.zeros(nrow)
+        self.Re0 = np.zeros(nrow)
+        self.dRe = np.ones(nrow)
+
+        # nodal values and slopes in cell units, (f, df/dalpha[, df/dRe, d2f/dalpha/dRe]),
+        # for cl and cd (table) and cm (table_cm), flattened to one row per grid node
+        table = np.zeros((nrow, n_alpha, n_Re, nterm, 3))
+
+        for k, afi in enumerate(unique):
+            tx, ty = afi.tck_cl[0], afi.tck_cl[1]
+            alpha_grid = np.linspace(tx[0], tx[-1], n_alpha)
+            Re_grid = np.linspace(ty[0], ty[-1], max(n_Re, 2))[:n_Re]
+            self.alpha0[k] = alpha_grid[0]
+            self.dalpha[k] = alpha_grid[1] - alpha_grid[0]
+            if not self.one_Re:
+                self.Re0[k] = Re_grid[0]
+                self.dRe[k] = Re_grid[1] - Re_grid[0]
+
+            tcks = [afi.tck_cl, afi.tck_cd] + ([afi.tck_cm] if self.use_cm else [])
+            for c, tck in enumerate(tcks):
+                table[k, :, :, 0, c] = bisplev(alpha_grid, Re_grid, tck).reshape(n_alpha, n_Re)
+                table[k, :, :, 1, c] = bisplev(alpha_grid, Re_grid, tck, dx=1).reshape(n_alpha, n_Re)*self.dalpha[k]
+                if not afi.one_Re:
+                    table[k, :, :, 2, c] = bisplev(alpha_grid, Re_grid, tck, dy=1)*self.dRe[k]
+                    table[k, :, :, 3, c] = bisplev(alpha_grid, Re_grid, tck, dx=1, dy=1)*self.dalpha[k]*self.dRe[k]
+
+        table = table.reshape(-1, nterm, 3)
+        self.table = np.ascontiguousarray(table[:, :, :2])
+        self.table_cm = np.ascontiguousarray(table[:, :, 2:])
+
+
+    def __interpolate(self, table, alpha, Re, idx, dx=0, dy=0):
+        """cubic Hermite interpolation of the coefficients in table, shape (..., ncoef)"""
+
+        if idx is None:
+            idx = self.index
+
+        alpha, Re, idx = np.broadcast_arrays(alpha, Re, idx)
+        shape = alpha.shape
+        idx = idx.ravel()
+
+        def hermite(x, n, d):
+            # cell index and Hermite basis for (value at 0, value at 1, slope at 0, slope at 1)
+            # (arguments outside the grid are clamped, as in FITPACK)
+            x = np.clip(x, 0.0, n - 1)
+            i = np.minimum(x.astype(int), n - 2)
+            t = x - i
+            t2 = t*t
+            if d == 0:
+                return i, (2*t2*t - 3*t2 + 1, -2*t2*t + 3*t2, t2*t - 2*t2 + t, t2*t - t2)
+            else:
+                return i, (6*t2 - 6*t, -6*t2 + 6*t, 3*t2 - 4*t + 1, 3*t2 - 2*t)
+
+        i, A = hermite((alpha.ravel() - self.alpha0[idx])/self.dalpha[idx], self.n_alpha, dx)
+        node = idx*self.n_alpha + i
+
+        if self.one_Re:
+            # corners (i, i+1) x terms (f, f_alpha)
+            corners = np.stack((node, node + 1), axis=-1)
+            w = np.stack((A[0], A[2], A[1], A[3]), axis=-1)
+
+        else:
+            j, B = hermite((Re.ravel() - self.Re0[idx])/self.dRe[idx], self.n_Re, dy)
+            node = node*self.n_Re + j
+
+            # corners (i, j), (i, j+1), (i+1, j), (i+1, j+1) x terms (f, f_alpha, f_Re, f_alphaRe)
+            corners = np.stack((node, node + 1, node + self.n_Re, node + self.n_Re + 1), axis=-1)
+            w = np.stack([term for di, dj in ((0, 0), (0, 1), (1, 0), (1, 1))
+                          for term in (A[di]*B[dj], A[2+di]*B[dj], A[di]*B[2+dj], A[2+di]*B[2+dj])], axis=-1)
+
+        values = table[corners]
+        f = np.matmul(w[:, np.newaxis, :], values.reshape(len(idx), -1, table.shape[-1]))[:, 0, :]
+
+        if dx:
+            f /= self.dalpha[idx][:, np.newaxis]
+        if dy:
+            f /= self.dRe[idx][:, np.newaxis]
+
+        return f.reshape(shape + (table.shape[-1],))
+
+
+    def evaluate(self, alpha, Re, idx=None, return_cm=False):
+        """Get lift/drag coefficient at the specified angles of attack and Reynolds numbers.
+        Parameters
+        ----------
+        alpha : array_like (rad)
+            angle of attack
+        Re : array_like
+            Reynolds number
+        idx : array_like of int, optional
+            station of each point.  Defaults to one station per entry along the last axis.
+        Returns
+        -------
+        cl : ndarray
+            lift coefficient
+        cd : ndarray
+            drag coefficient
+        """
+
+        f = self.__interpolate(self.table, alpha, Re, idx)
+
+        if self.use_cm and return_cm:
+            cm = self.__interpolate(self.table_cm, alpha, Re, idx)
+            return f[..., 0], f[..., 1], cm[..., 0]
+        else:
+            return f[..., 0], f[..., 1]
+
+
+    def derivatives(self, alpha, Re, idx=None):
+        """dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe with the same conventions as evaluate"""
+
+        fa = self.__interpolate(self.table, alpha, Re, idx, dx=1)
+        if self.one_Re:
+            fR = np.zeros_like(fa)
+        else:
+            fR = self.__interpolate(self.table, alpha, Re, idx, dy=1)
+
+        return fa[..., 0], fR[..., 0], fa[..., 1], fR[..., 1]
+
+
+# ------------------
+#  Vectorized BEM kernels
+# ------------------
+
+
+def _relativewind(phi, a, ap, Vx, Vy, pitch, chord, theta, rho, mu):
+    """array version of _bem.relativewind (all inputs broadcast together)"""
+
+    # angle of attack
+    alpha = phi - (theta + pitch)
+
+    # avoid numerical errors when angle is close to 0 or 90 deg
+    # and other induction factor is at some ridiculous value
+    with np.errstate(divide='ignore', invalid='ignore'):
+        W = np.where(np.abs(a) > 10, Vy*(1+ap)/np.cos(phi),
+            np.where(np.abs(ap) > 10, Vx*(1-a)/np.sin(phi),
+                np.sqrt((Vx*(1-a))**2 + (Vy*(1+ap))**2)))
+
+    Re = rho * W * chord / mu
+
+    return alpha, W, Re
+
+
+def _inductionfactors(r, chord, Rhub, Rtip, phi, cl, cd, B, Vx, Vy,
+                      usecd=True, hubloss=True, tiploss=True, wakerotation=True):
+    """array version of _bem.inductionfactors (all inputs broadcast together)"""
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        sigma_p = B/2.0/pi*chord/r
+        sphi = np.sin(phi)
+        cphi = np.cos(phi)
+
+        # resolve into normal and tangential forces
+        if not usecd:
+            cn = cl*cphi
+            ct = cl*sphi
+        else:
+            cn = cl*cphi + cd*sphi
+            ct = cl*sphi - cd*cphi
+
+        # Prandtl's tip and hub loss factor
+        Ftip = 1.0
+        if tiploss:
+            factortip = B/2.0*(Rtip - r)/(r*sphi)
+            Ftip = 2.0/pi*np.arccos(np.exp(-factortip))
+
+        Fhub = 1.0
+        if hubloss:
+            factorhub = B/2.0*(r - Rhub)/(Rhub*sphi)
+            Fhub = 2.0/pi*np.arccos(np.exp(-factorhub))
+
+        F = Ftip * Fhub
+
+        # bem parameters
+        k = sigma_p*cn/4.0/F/sphi/sphi
+        kp = sigma_p*ct/4.0/F/sphi/cphi
+
+        # axial induction factor: momentum state, Glauert(Buhl) correction, or propeller brake
+        g1 = 2.0*F*k - (10.0/9-F)
+        g2 = 2.0*F*k - (4.0/3-F)*F
+        g3 = 2.0*F*k - (25.0/9-2*F)
+        a_buhl = np.where(np.abs(g3) < 1e-6, 1.0 - 1.0/2.0/np.sqrt(g2), (g1 - np.sqrt(g2)) / g3)
+        a_mom = np.where(k <= 2.0/3.0, k/(1+k), a_buhl)
+        a_brake = np.where(k > 1, k/(k-1), 0.0)
+        a = np.where(phi > 0, a_mom, a_brake)
+
+        # tangential induction factor
+        ap = kp/(1-kp)
+
+        if not wakerotation:
+            ap = np.zeros_like(ap)
+            kp = np.zeros_like(kp)
+
+        # error function
+        lambda_r = Vy/Vx
+        fzero = np.where(phi > 0, sphi/(1-a) - cphi/lambda_r*(1-kp),
+                         sphi*(1-k) - cphi/lambda_r*(1-kp))
+
+    return fzero, a, ap
+
+
+def _definecurvature(r, precurve, presweep, precone):
+    """array version of _bem.definecurvature (station is the last axis)"""
+
+    # coordinate in azimuthal coordinate system
+    x_az = -r*np.sin(precone) + precurve*np.cos(precone)
+    z_az = r*np.cos(precone) + precurve*np.sin(precone)
+    y_az = presweep
+
+    # compute total coning angle for purposes of relative velocity
+    seg = np.arctan2(-np.diff(x_az, axis=-1), np.diff(z_az, axis=-1))
+    cone = np.concatenate((seg[..., :1], 0.5*(seg[..., :-1] + seg[..., 1:]), seg[..., -1:]), axis=-1)
+
+    # total path length of blade
+    ds = np.sqrt(np.diff(precurve, axis=-1)**2 + np.diff(presweep, axis=-1)**2 + np.diff(r, axis=-1)**2)
+    s = np.concatenate((np.zeros(np.shape(ds)[:-1] + (1,)), np.cumsum(ds, axis=-1)), axis=-1)
+
+    return x_az, y_az, z_az, cone, s
+
+
+def _windcomponents(r, precurve, presweep, precone, yaw, tilt, azimuth, Uinf, OmegaRPM, hubHt, shearExp):
+    """array version of _bem.windcomponents.  azimuth, Uinf, and OmegaRPM broadcast
+    against the station axis, e.g. shapes (npts, 1, 1), (1, nsec, 1) give (npts, nsec, n)"""
+
+    sy = np.sin(yaw)
+    cy = np.cos(yaw)
+    st = np.sin(tilt)
+    ct = np.cos(tilt)
+    sa = np.sin(azimuth)
+    ca = np.cos(azimuth)
+    Omega = OmegaRPM * pi/30.0
+
+    x_az, y_az, z_az, cone, _ = _definecurvature(r, precurve, presweep, precone)
+    sc = np.sin(cone)
+    cc = np.cos(cone)
+
+    # get section heights in wind-aligned coordinate system
+    heightFromHub = (y_az*sa + z_az*ca)*ct - x_az*st
+
+    # velocity with shear
+    V = Uinf*(1 + heightFromHub/hubHt)**shearExp
+
+    # transform wind to blade c.s.
+    Vwind_x = V * ((cy*st*ca + sy*sa)*sc + cy*ct*cc)
+    Vwind_y = V * (cy*st*sa - sy*ca)
+
+    # wind from rotation to blade c.s.
+    Vrot_x = -Omega*y_az*sc
+    Vrot_y = Omega*z_az
+
+    # total velocity
+    Vx = Vwind_x + Vrot_x
+    Vy = Vwind_y + Vrot_y
+
+    return Vx, Vy
+
+
+def _thrusttorque(Np, Tp, r, precurve, presweep, precone, Rhub, Rtip, precurveTip, presweepTip):
+    """array version of _bem.thrusttorque.  Np and Tp may carry leading batch
+    dimensions (station is the last axis); T, Q, M have the batch shape."""
+
+    # add hub/tip for complete integration.  loads go to zero at hub/tip.
+    rfull = np.r_[Rhub, r, Rtip]
+    curvefull = np.r_[0.0, precurve, precurveTip]
+    sweepfull = np.r_[0.0, presweep, presweepTip]
+
+    pad = [(0, 0)]*(np.ndim(Np) - 1) + [(1, 1)]
+    Npfull = np.pad(Np, pad)
+    Tpfull = np.pad(Tp, pad)
+
+    # get z_az and total cone angle
+    _, _, z_az, cone, s = _definecurvature(rfull, curvefull, sweepfull, precone)
+
+    # integrate Thrust and Torque (trapezoidal)
+    thrust = Npfull*np.cos(cone)
+    torque = Tpfull*z_az
+    flap_moment = Npfull*z_az
+
+    ds = np.diff(s)
+    T = np.sum(0.5*(thrust[..., :-1] + thrust[..., 1:])*ds, axis=-1)
+    Q = np.sum(0.5*(torque[..., :-1] + torque[..., 1:])*ds, axis=-1)
+    M = np.sum(0.5*(flap_moment[..., :-1] + flap_moment[..., 1:])*ds, axis=-1)
+
+    return T, Q, M
+
+
+def _brentq(f, xa, xb, xtol=2e-12, rtol=4*np.finfo(float).eps, maxiter=100):
+    """Brent's method applied elementwise to arrays of bracketed roots.
+    Follows the same steps as scipy.optimize.brentq so results match the
+    scalar solve, but every bracket is advanced together.
+    Parameters
+    ----------
+    f : callable
+        residual function, called with an array shaped like xa and
+        returning an array of the same shape
+    xa, xb : ndarray
+        lower and upper brackets (f must change sign across each pair)
+    Returns
+    -------
+    x : ndarray
+        roots (NaN where the bracket does not contain a sign change)
+    """
+
+    xpre = np.array(xa, dtype=float)
+    xcur = np.array(xb, dtype=float)
+    fpre = f(xpre)
+    fcur = f(xcur)
+
+    xblk = np.zeros_like(xcur)
+    fblk = np.zeros_like(xcur)
+    spre = np.zeros_like(xcur)
+    scur = np.zeros_like(xcur)
+
+    valid = (fpre*fcur <= 0)
+    done = ~valid | (fpre == 0) | (fcur == 0)
+    root = np.where(fpre == 0, xpre, xcur)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(maxiter):
+
+            if np.all(done):
+                break
+
+            # update the bracket where the sign changed
+            flip = (fpre != 0) & (fcur != 0) & (np.signbit(fpre) != np.signbit(fcur))
+            xblk = np.where(flip, xpre, xblk)
+            fblk = np.where(flip, fpre, fblk)
+            spre = np.where(flip, xcur - xpre, spre)
+            scur = np.where(flip, xcur - xpre, scur)
+
+            # keep the best guess in xcur
+            swap = np.abs(fblk) < np.abs(fcur)
+            xpre = np.where(swap, xcur, xpre)
+            fpre = np.where(swap, fcur, fpre)
+            xcur, xblk = np.where(swap, xblk, xcur), np.where(swap, xcur, xblk)
+            fcur, fblk = np.where(swap, fblk, fcur), np.where(swap, fcur, fblk)
+
+            delta = (xtol + rtol*np.abs(xcur))/2
+            sbis = (xblk - xcur)/2
+
+            converged = ~done & ((fcur == 0) | (np.abs(sbis) < delta))
+            root = np.where(converged, xcur, root)
+            done = done | converged
+
+            # interpolate (secant) or extrapolate (inverse quadratic)
+            dpre = (fpre - fcur)/(xpre - xcur)
+            dblk = (fblk - fcur)/(xblk - xcur)
+            stry = np.where(xpre == xblk, -fcur*(xcur - xpre)/(fcur - fpre),
+                            -fcur*(fblk*dblk - fpre*dpre)/(dblk*dpre*(fblk - fpre)))
+
+            interp = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+            good = interp & (2*np.abs(stry) < np.minimum(np.abs(spre), 3*np.abs(sbis) - delta))
+            spre = np.where(good, scur, sbis)
+            scur = np.where(good, stry, sbis)
+
+            xpre = np.where(done, xpre, xcur)
+            fpre = np.where(done, fpre, fcur)
+            step = np.where(np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta))
+            xcur = np.where(done, xcur, xcur + step)
+            fcur = np.where(done, fcur, f(xcur))
+
+    root = np.where(done, root, xcur)
+    root[~valid] = np.nan
+
+    return root
+
+
 # ------------------
 #  Main Class: CCBlade
 # ------------------
@@ -400,7 +864,8 @@ class CCBlade(object):
     def __init__(self, r, chord, theta, af, Rhub, Rtip, B=3, rho=1.225, mu=1.81206e-5,
                  precone=0.0, tilt=0.0, yaw=0.0, shearExp=0.2, hubHt=80.0,
                  nSector=8, precurve=None, precurveTip=0.0, presweep=None, presweepTip=0.0,
-                 tiploss=True, hubloss=True, wakerotation=True, usecd=True, iterRe=1, derivatives=False):
+                 tiploss=True, hubloss=True, wakerotation=True, usecd=True, iterRe=1, derivatives=False,
+                 vectorized=False, lookup_table=False):
         """Constructor for aerodynamic rotor analysis
         Parameters
         ----------
@@ -462,6 +927,15 @@ class CCBlade(object):
             should not be necessary.  Gradients have only been implemented for the case iterRe=1.
         derivatives : boolean, optional
             if True, derivatives along with function values will be returned for the various methods
+        vectorized : boolean, optional
+            if True, the inflow angle is bracketed and converged for all stations at once with
+            array operations instead of one scalar root find per station.  Results match the
+            default solver to within the root-finding tolerance.  :meth:`evaluate` then solves all
+            conditions and sectors in one batch; with ``derivatives`` only that inflow solve is
+            batched and the Jacobians are still assembled one condition and sector at a time.
+        lookup_table : boolean, optional
+            if True, the vectorized solver evaluates the polars of all stations together from a
+            :class:`CCAirfoilTable` sampled from the airfoil splines instead of calling each spline.
         """
 
         self.r = np.array(r)
@@ -481,6 +955,8 @@ class CCBlade(object):
         self.bemoptions = dict(usecd=usecd, tiploss=tiploss, hubloss=hubloss, wakerotation=wakerotation)
         self.iterRe = iterRe
         self.derivatives = derivatives
+        self.vectorized = vectorized
+        self.lookup_table = lookup_table
         
         
         # check if no precurve / presweep
@@ -681,6 +1157,122 @@ class CCBlade(object):
 
 
 
+    def __airfoilGroups(self):
+        """station indices sharing each distinct airfoil object"""
+
+        key = tuple(id(af) for af in self.af)
+        if getattr(self, '_af_groups_key', None) != key:
+            groups = {}
+            for i, af in enumerate(self.af):
+                groups.setdefault(id(af), (af, []))[1].append(i)
+
+            self._af_groups = [(af, np.array(idx)) for af, idx in groups.values()]
+            self._af_groups_key = key
+
+        return self._af_groups
+
+
+    def __evaluateAirfoils(self, alpha, Re):
+        """cl, cd for arrays of shape (..., n) with one airfoil per station (last axis)"""
+
+        if self.lookup_table:
+            key = tuple(id(af) for af in self.af)
+            if getattr(self, '_af_table_key', None) != key:
+                self._af_table = CCAirfoilTable(self.af)
+                self._af_table_key = key
+
+            return self._af_table.evaluate(alpha, Re)
+
+        cl = np.zeros(np.shape(alpha))
+        cd = np.zeros(np.shape(alpha))
+        for af, idx in self.__airfoilGroups():
+            cl[..., idx], cd[..., idx] = af.evaluate(alpha[..., idx], Re[..., idx])
+
+        return cl, cd
+
+
+    def __runBEMVectorized(self, phi, Vx, Vy, pitch):
+        """residual of BEM method for all stations at once (station is the last axis)"""
+
+        a = np.zeros_like(phi)
+        ap = np.zeros_like(phi)
+
+        for i in range(self.iterRe):
+
+            alpha, W, Re = _relativewind(phi, a, ap, Vx, Vy, pitch,
+                                         self.chord, self.theta, self.rho, self.mu)
+            cl, cd = self.__evaluateAirfoils(alpha, Re)
+
+            fzero, a, ap = _inductionfactors(self.r, self.chord, self.Rhub, self.Rtip, phi,
+                                             cl, cd, self.B, Vx, Vy, **self.bemoptions)
+
+        return fzero, a, ap
+
+
+    def __solveInflowVectorized(self, Vx, Vy, pitch):
+        """bracket and converge the inflow angle phi at every station simultaneously.
+        Same bracketing logic as the scalar solve in distributedAeroLoads.
+        """
+
+        def errf(phi):
+            return self.__runBEMVectorized(phi, Vx, Vy, pitch)[0]
+
+        shape = np.shape(Vx)
+        epsilon = 1e-6
+        phi_lower = epsilon*np.ones(shape)
+        phi_upper = pi/2*np.ones(shape)
+
+        # an uncommon but possible case: no sign change in the standard bracket
+        nobracket = errf(phi_lower)*errf(phi_upper) > 0
+        if np.any(nobracket):
+            brake = nobracket & (errf(-pi/4*np.ones(shape)) < 0) & (errf(-epsilon*np.ones(shape)) > 0)
+            high = nobracket & ~brake
+            phi_lower[brake] = -pi/4
+            phi_upper[brake] = -epsilon
+            phi_lower[high] = pi/2
+            phi_upper[high] = pi - epsilon
+
+        phi_star = _brentq(errf, phi_lower, phi_upper)
+
+        if np.any(np.isnan(phi_star)):
+            warnings.warn('error.  check input values.')
+            phi_star[np.isnan(phi_star)] = 0.0
+
+        return phi_star
+
+
+    def __loadsVectorized(self, phi, rotating, Vx, Vy, pitch):
+        """normal and tangential loads at all sections at once (no derivatives)"""
+
+        if rotating:
+            _, a, ap = self.__runBEMVectorized(phi, Vx, Vy, pitch)
+        else:
+            a = np.zeros_like(phi)
+            ap = np.zeros_like(phi)
+
+        alpha_rad, W, Re = _relativewind(phi, a, ap, Vx, Vy, pitch,
+                                         self.chord, self.theta, self.rho, self.mu)
+        cl, cd = self.__evaluateAirfoils(alpha_rad, Re)
+
+        cphi = np.cos(phi)
+        sphi = np.sin(phi)
+        cn = cl*cphi + cd*sphi  # these expressions should always contain drag
+        ct = cl*sphi - cd*cphi
+
+        q = 0.5*self.rho*W**2
+        Np = cn*q*self.chord
+        Tp = ct*q*self.chord
+
+        alpha_deg = alpha_rad * 180. / np.pi
+
+        # BEM convergence error, set loads to zero
+        bad = np.isnan(Np)
+        for x in (a, ap, Np, Tp, alpha_deg):
+            x[bad] = 0.0
+
+        return a, ap, Np, Tp, alpha_deg, cl, cd
+
+
     def __windComponents(self, Uinf, Omega, azimuth):
         """x, y components of wind in blade-aligned coordinate system"""
 
@@ -750,6 +1342,13 @@ class CCBlade(object):
             derivatives of tangential loads.  Same keys as dNp.
         """
 
+        return self.__distributedAeroLoads(Uinf, Omega, pitch, azimuth)
+
+
+    def __distributedAeroLoads(self, Uinf, Omega, pitch, azimuth, phi_all=None):
+        """distributedAeroLoads, optionally with the inflow angles already
+        converged by a batched solve (phi_all, one per station)"""
+
         self.pitch = radians(pitch)
         azimuth = radians(azimuth)
 
@@ -781,6 +1380,24 @@ class CCBlade(object):
             errf = self.__errorFunction
         rotating = (Omega != 0)
 
+        # ---------------- batched solve across blade ------------------
+        if phi_all is None and self.vectorized and not self.inverse_analysis:
+
+            if rotating:
+                phi_all = self.__solveInflowVectorized(Vx, Vy, self.pitch)
+            else:
+                phi_all = pi/2.0*np.ones(n)
+
+            if not self.derivatives:
+                a, ap, Np, Tp, alpha, cl, cd = self.__loadsVectorized(phi_all, rotating, Vx, Vy, self.pitch)
+
+                if self.induction:
+                    return a, ap, Np, Tp
+                elif self.induction_inflow:
+                    return a, ap, alpha, cl, cd
+                else:
+                    return Np, Tp
+
         # ---------------- loop across blade ------------------
         for i in range(n):
 
@@ -790,7 +1407,11 @@ class CCBlade(object):
             else:
                 args = (self.r[i], self.chord[i], self.theta[i], self.af[i], Vx[i], Vy[i])
 
-            if not rotating:  # non-rotating
+            if phi_all is not None:  # already converged above
+
+                phi_star = phi_all[i]
+
+            elif not rotating:  # non-rotating
 
                 phi_star = pi/2.0
 
@@ -990,6 +1611,13 @@ class CCBlade(object):
         CQ = Q / (q * A * R)
         The rotor radius R, may not actually be Rtip if precone and precurve are both nonzero
         ``R = Rtip*cos(precone) + precurveTip*sin(precone)``
+
+        With ``vectorized`` set (and no inverse analysis), the inflow angles of all
+        conditions and azimuthal sectors are converged in one batched solve.  Without
+        derivatives the loads are batched too.  With derivatives, the loads and their
+        Jacobians are still computed by the scalar analytic-gradient routines in a loop
+        over conditions and sectors, starting from the batched inflow angles, so the
+        cost of this part still grows with npts*nSector.
         """
 
         # rename
@@ -1014,39 +1642,63 @@ class CCBlade(object):
             dT_dv = np.zeros((npts, 5, len(self.r)))
             dQ_dv = np.zeros((npts, 5, len(self.r)))
 
-        for i in range(npts):  # iterate across conditions
+        batch = self.vectorized and not self.inverse_analysis
 
-            for j in range(nsec):  # integrate across azimuth
-                azimuth = 360.0*float(j)/nsec
+        if batch and not self.derivatives:
+            # solve all conditions and azimuthal sectors at once
+            if self.induction:
+                a, ap, Np, Tp = self.batchAeroLoads(Uinf, Omega, pitch)
+                self.a  = a[-1, -1, :]
+                self.ap = ap[-1, -1, :]
+            else:
+                Np, Tp = self.batchAeroLoads(Uinf, Omega, pitch)
 
-                if not self.derivatives:
-                    # contribution from this azimuthal location
-                    if self.induction:
-                        a, ap, Np, Tp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
-                        # Induction
-                        self.a  = a
-                        self.ap = ap
-                    else:
-                        Np, Tp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
+            Tsub, Qsub, Msub = _thrusttorque(Np, Tp, *args)
 
-                else:
+            T = self.B * np.sum(Tsub, axis=1) / nsec
+            Q = self.B * np.sum(Qsub, axis=1) / nsec
+            M = np.sum(Msub, axis=1) / nsec
 
-                    Np, Tp, dNp, dTp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
+        else:
+            # inflow for all conditions and sectors converged together, then
+            # loads and derivatives by the scalar routines, one condition and
+            # sector at a time (the Jacobians are not batched)
+            phi = self.__batchInflow(Uinf, Omega, pitch)[0] if batch else None
+
+            for i in range(npts):  # iterate across conditions
+
+                for j in range(nsec):  # integrate across azimuth
+                    azimuth = 360.0*float(j)/nsec
+                    phi_ij = None if phi is None else phi[i, j, :]
+
+                    if not self.derivatives:
+                        # contribution from this azimuthal location
+                        if self.induction:
+                            a, ap, Np, Tp = self.__distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth, phi_ij)
+                            # Induction
+                            self.a  = a
+                            self.ap = ap
+                        else:
+                            Np, Tp = self.__distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth, phi_ij)
 
-                    dT_ds_sub, dQ_ds_sub, dT_dv_sub, dQ_dv_sub = self.__thrustTorqueDeriv(
-                        Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args)
+                    else:
 
-                    dT_ds[i, :] += self.B * dT_ds_sub / nsec
-                    dQ_ds[i, :] += self.B * dQ_ds_sub / nsec
-                    dT_dv[i, :, :] += self.B * dT_dv_sub / nsec
-                    dQ_dv[i, :, :] += self.B * dQ_dv_sub / nsec
+                        Np, Tp, dNp, dTp = self.__distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth, phi_ij)
 
+                        dT_ds_sub, dQ_ds_sub, dT_dv_sub, dQ_dv_sub = self.__thrustTorqueDeriv(
+                            Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args)
 
-                Tsub, Qsub, Msub = _bem.thrusttorque(Np, Tp, *args)
+                        dT_ds[i, :] += self.B * dT_ds_sub / nsec
+                        dQ_ds[i, :] += self.B * dQ_ds_sub / nsec
+                        dT_dv[i, :, :] += self.B * dT_dv_sub / nsec
+                        dQ_dv[i, :, :] += self.B * dQ_dv_sub / nsec
 
-                T[i] += self.B * Tsub / nsec
-                Q[i] += self.B * Qsub / nsec
-                M[i] += Msub / nsec
+
+                    Tsub, Qsub, Msub = _bem.thrusttorque(Np, Tp, *args)
+
+                    T[i] += self.B * Tsub / nsec
+                    Q[i] += self.B * Qsub / nsec
+                    M[i] += Msub / nsec
 
 
         
@@ -1124,6 +1776,78 @@ class CCBlade(object):
 
 
 
+    def __batchInflow(self, Uinf, Omega, pitch):
+        """wind components and converged inflow angles for every condition,
+        azimuthal sector, and station, as (npts, nsector, n) arrays"""
+
+        Uinf = np.array(Uinf, dtype=float).flatten()
+        Omega = np.array(Omega, dtype=float).flatten()
+        pitch = np.array(pitch, dtype=float).flatten()
+
+        nsec = self.nSector
+        npts = len(Uinf)
+        n = len(self.r)
+
+        azimuth = np.radians(360.0*np.arange(nsec)/nsec).reshape(1, nsec, 1)
+        Vx, Vy = _windcomponents(self.r, self.precurve, self.presweep, self.precone, self.yaw, self.tilt,
+            azimuth, Uinf.reshape(npts, 1, 1), Omega.reshape(npts, 1, 1), self.hubHt, self.shearExp)
+
+        pitch_rad = np.radians(pitch).reshape(npts, 1, 1)
+
+        phi = pi/2.0*np.ones((npts, nsec, n))
+        rotating = (Omega != 0)
+        if np.any(rotating):
+            phi[rotating] = self.__solveInflowVectorized(Vx[rotating], Vy[rotating], pitch_rad[rotating])
+
+        return phi, Vx, Vy, pitch_rad
+
+
+    def batchAeroLoads(self, Uinf, Omega, pitch):
+        """Compute distributed aerodynamic loads for many operating conditions at
+        every azimuthal sector in one batched solve.
+        Parameters
+        ----------
+        Uinf : array_like (m/s)
+            hub height wind speed
+        Omega : array_like (RPM)
+            rotor rotation speed
+        pitch : array_like (deg)
+            blade pitch setting
+        Returns
+        -------
+        Np : ndarray (N/m)
+            force per unit length normal to the section on downwind side,
+            shape (npts, nSector, n) with sector j at azimuth 360*j/nSector deg
+        Tp : ndarray (N/m)
+            force per unit length tangential to the section in the direction of rotation,
+            same shape as Np
+        Notes
+        -----
+        As with distributedAeroLoads, induction factors are prepended (a, ap, Np, Tp)
+        if ``self.induction`` is set and (a, ap, alpha, cl, cd) are returned instead
+        if ``self.induction_inflow`` is set.  Derivatives are not returned.
+        """
+
+        phi, Vx, Vy, pitch_rad = self.__batchInflow(Uinf, Omega, pitch)
+
+        out = [np.zeros_like(phi) for k in range(7)]
+        rotating = (np.array(Omega).flatten() != 0)
+        for mask, spinning in [(rotating, True), (~rotating, False)]:
+            if np.any(mask):
+                res = self.__loadsVectorized(phi[mask], spinning, Vx[mask], Vy[mask], pitch_rad[mask])
+                for x, y in zip(out, res):
+                    x[mask] = y
+        a, ap, Np, Tp, alpha, cl, cd = out
+
+        if self.induction:
+            return a, ap, Np, Tp
+        elif self.induction_inflow:
+            return a, ap, alpha, cl, cd
+        else:
+            return Np, Tp
+
+
+
     def __thrustTorqueDeriv(self, Np, Tp, dNp_dX, dTp_dX, dNp_dprecurve, dTp_dprecurve,
             r, precurve, presweep, precone, Rhub, Rtip, precurveTip, presweepTip):
         """derivatives of thrust and torque"""
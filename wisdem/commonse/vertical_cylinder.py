@@ -243,7 +243,7 @@ class CylinderFrame3DD(ExplicitComponent):
         self.add_discrete_input('geom', False, desc='include geometric stiffness')
         self.add_input('dx', 5.0, desc='z-axis increment for internal forces')
         self.add_discrete_input('nM', 2, desc='number of desired dynamic modes of vibration (below only necessary if nM > 0)')
-        self.add_discrete_input('Mmethod', 1, desc='1: subspace Jacobi, 2: Stodola')
+        self.add_discrete_input('Mmethod', 1, desc='1: subspace Jacobi, 2: Stodola, 3: sparse shift-invert Lanczos')
         self.add_discrete_input('lump', 0, desc='0: consistent mass, 1: lumped mass matrix')
         self.add_input('tol', 1e-9, desc='mode shape tolerance')
         self.add_input('shift', 0.0, desc='shift value ... for unrestrained structures')
@@ -270,6 +270,9 @@ class CylinderFrame3DD(ExplicitComponent):
         # Derivatives
         # self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
 
+        # frame3dd object kept between computes
+        self.frame = None
+
         
     def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
 
@@ -320,8 +323,16 @@ class CylinderFrame3DD(ExplicitComponent):
         options = frame3dd.Options(discrete_inputs['shear'], discrete_inputs['geom'], float(inputs['dx']))
         # -----------------------------------
 
-        # initialize frame3dd object
-        cylinder = frame3dd.Frame(nodes, reactions, elements, options)
+        # initialize frame3dd object, or update the one of the last compute so
+        # its factored stiffness matrix is reused when the structure is unchanged
+        if getattr(self, 'frame', None) is None or not self.frame.sameTopology(nodes, reactions, elements, options):
+            self.frame = frame3dd.Frame(nodes, reactions, elements, options)
+        else:
+            self.frame.changeNodeData(nodes)
+            self.frame.changeReactionData(reactions)
+            self.frame.changeElementData(elements)
+            self.frame.clearLoadCases()
+        cylinder = self.frame
 
 
         # ------ add extra mass ------------
@@ -0,0 +1,177 @@
+"""
+yaml_loader.py
+
+Fast loading of YAML inputs (turbine ontology, ORBIT library files) shared by
+repeated runs on the same files.
+
+The files are parsed with the LibYAML based loader when PyYAML was built with
+it, optionally validated against a JSON schema, and the resulting structure
+is cached:
+    - in memory, keyed by the file path, size and modification time, so a
+      file read several times by the same process is only parsed once
+    - in a binary sidecar file next to the input (.<name>.cache), keyed by
+      the hash of the input and schema contents, so separate runs on the same
+      inputs skip parsing and validation
+
+The sidecar is a pickle, only load inputs from directories you trust.
+"""
+
+import os
+import re
+import copy
+import pickle
+import hashlib
+import tempfile
+
+import numpy as np
+import yaml
+
+CACHE_VERSION = 1
+
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class SafeLoader(_SafeLoader):
+    # YAML 1.2 style floats (1e-3 without a decimal point) and python tuples
+    def construct_python_tuple(self, node):
+        return tuple(self.construct_sequence(node))
+
+
+SafeLoader.add_constructor(u'tag:yaml.org,2002:python/tuple', SafeLoader.construct_python_tuple)
+SafeLoader.add_implicit_resolver(
+    u'tag:yaml.org,2002:float',
+    re.compile(u'''^(?:
+     [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+    |\\.[0-9_]+(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*
+    |[-+]?\\.(?:inf|Inf|INF)
+    |\\.(?:nan|NaN|NAN))$''', re.X),
+    list(u'-+0123456789.'))
+
+_memory = {}
+
+
+def load_yaml(fname, fname_schema='', arrays=False, cache=True, sidecar=True, Loader=SafeLoader):
+    """
+    Load a YAML file into dicts and lists.
+
+    Inputs:
+        fname        - string: YAML file
+        fname_schema - string: (optional) JSON schema in YAML, the input is validated against it
+        arrays       - bool: (optional) return lists of numbers (also nested, rectangular) as arrays
+        cache        - bool: (optional) reuse the structure parsed by an earlier call of this process
+        sidecar      - bool: (optional) read and write the binary sidecar cache next to fname
+        Loader       - (optional) PyYAML loader class
+
+    Returns a new copy of the structure on every call.
+    """
+    fname = os.path.abspath(fname)
+    stat  = os.stat(fname)
+    key   = (fname, stat.st_size, stat.st_mtime_ns, os.path.abspath(fname_schema) if fname_schema else '', arrays, Loader)
+    if fname_schema:
+        stat_schema = os.stat(fname_schema)
+        key += (stat_schema.st_size, stat_schema.st_mtime_ns)
+
+    if cache and key in _memory:
+        return copy.deepcopy(_memory[key])
+
+    with open(fname, 'rb') as f:
+        inputs = f.read()
+    if fname_schema:
+        with open(fname_schema, 'rb') as f:
+            schema = f.read()
+    else:
+        schema = b''
+
+    h = hashlib.sha1()
+    for value in [str(CACHE_VERSION), Loader.__module__, Loader.__name__, str(arrays)]:
+        h.update(value.encode())
+    h.update(hashlib.sha1(inputs).digest())
+    h.update(hashlib.sha1(schema).digest())
+    content_key = h.hexdigest()
+
+    fname_cache = os.path.join(os.path.dirname(fname), '.' + os.path.basename(fname) + '.cache')
+    data = _read_sidecar(fname_cache, content_key) if sidecar else None
+    if data is None:
+        data = yaml.load(inputs, Loader=Loader)
+        if fname_schema:
+            import jsonschema
+            jsonschema.validate(data, yaml.load(schema, Loader=Loader))
+        if arrays:
+            data = to_arrays(data)
+        if sidecar:
+            _write_sidecar(fname_cache, content_key, data)
+
+    if cache:
+        _memory[key] = data
+        return copy.deepcopy(data)
+    return data
+
+
+def to_arrays(data):
+    # replace lists of numbers, in nested dicts and lists, by arrays (int if all the numbers are)
+    if isinstance(data, dict):
+        return {k: to_arrays(v) for k, v in data.items()}
+    if isinstance(data, list):
+        if len(data) > 0 and _numeric_shape(data) is not None:
+            return np.array(data)
+        return [to_arrays(v) for v in data]
+    return data
+
+
+def to_lists(data):
+    # inverse of to_arrays, for writing the structure back to YAML
+    if isinstance(data, dict):
+        return {k: to_lists(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [to_lists(v) for v in data]
+    if isinstance(data, np.ndarray):
+        return data.tolist()
+    if isinstance(data, np.generic):
+        return data.item()
+    return data
+
+
+def clear_cache():
+    # forget the structures parsed by this process
+    _memory.clear()
+
+
+def _numeric_shape(data):
+    # shape of a rectangular, nested list of numbers, None for anything else
+    if isinstance(data, list):
+        shapes = [_numeric_shape(v) for v in data]
+        if len(shapes) == 0 or any(shape is None or shape != shapes[0] for shape in shapes):
+            return None
+        return (len(data),) + shapes[0]
+    if isinstance(data, bool) or not isinstance(data, (int, float)):
+        return None
+    return ()
+
+
+def _read_sidecar(fname_cache, content_key):
+    try:
+        with open(fname_cache, 'rb') as f:
+            if pickle.load(f) != content_key:
+                return None
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_sidecar(fname_cache, content_key, data):
+    # written to a temporary file and renamed, so concurrent jobs never read a partial cache;
+    # the cache is skipped when the directory is read only
+    try:
+        fid, fname_tmp = tempfile.mkstemp(dir=os.path.dirname(fname_cache), prefix=os.path.basename(fname_cache))
+    except OSError:
+        return
+    try:
+        with os.fdopen(fid, 'wb') as f:
+            pickle.dump(content_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fname_tmp, fname_cache)
+    except Exception:
+        if os.path.exists(fname_tmp):
+            os.remove(fname_tmp)
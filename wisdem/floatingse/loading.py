@@ -1026,8 +1026,15 @@ class FloatingFrame(ExplicitComponent):
         
         # ---FRAME3DD INSTANCE---
 
-        # Initialize frame3dd object
-        self.myframe = frame3dd.Frame(nodes, reactions, elements, other)
+        # Initialize frame3dd object, or update the one of the last compute so
+        # its factored stiffness matrix is reused when the structure is unchanged
+        if getattr(self, 'myframe', None) is None or not self.myframe.sameTopology(nodes, reactions, elements, other):
+            self.myframe = frame3dd.Frame(nodes, reactions, elements, other)
+        else:
+            self.myframe.changeNodeData(nodes)
+            self.myframe.changeReactionData(reactions)
+            self.myframe.changeElementData(elements)
+            self.myframe.clearLoadCases()
         
         # Add in extra mass of rna
         inode   = np.array([towerEndID], dtype=np.int32) # rna
@@ -1051,7 +1058,7 @@ class FloatingFrame(ExplicitComponent):
         # This needs to be compared to FAST until I trust it enough to use it.
         # Have to test BCs, results, mooring stiffness, mooring mass/MOI, etc
         nM = 0 #NFREQ          # number of desired dynamic modes of vibration
-        Mmethod = 1         # 1: subspace Jacobi     2: Stodola
+        Mmethod = 3         # 1: subspace Jacobi     2: Stodola     3: sparse shift-invert Lanczos (for large frames)
         lump = 0            # 0: consistent mass ... 1: lumped mass matrix
         tol = 1e-5          # mode shape tolerance
         shift = 0.0        # shift value ... for unrestrained or partially restrained structures
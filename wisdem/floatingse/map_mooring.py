@@ -1,7 +1,9 @@
 from openmdao.api import ExplicitComponent
 import numpy as np
+import multiprocessing as mp
 import os
 import sys
+import tempfile
 from wisdem.pymap import pyMAP
 
 from wisdem.commonse import gravity, Enum
@@ -11,12 +13,67 @@ Anchor    = Enum('DRAGEMBEDMENT SUCTIONPILE')
 NLINES_MAX = 15
 NPTS_PLOT = 20
 
+
+def vessel_displacements(angles, offsets, heels=0.0):
+    """Vessel displacements for all combinations of offset direction, offset magnitude and heel,
+    with the heel about the horizontal axis normal to the offset direction (pitch for angle 0).
+
+    INPUTS:
+    ----------
+    angles  : offset directions from the x-axis, in radians
+    offsets : offset magnitudes
+    heels   : heel angles, in the angle units of MAP++ (degrees)
+
+    OUTPUTS  : array (nangles*noffsets*nheels, 6) of [surge, sway, heave, roll, pitch, yaw], angles varying slowest
+    """
+    a, r, h = [x.ravel() for x in np.meshgrid(angles, offsets, heels, indexing='ij')]
+    zero    = np.zeros(a.size)
+    return np.c_[r*np.cos(a), r*np.sin(a), zero, -h*np.sin(a), h*np.cos(a), zero]
+
+
+def _init_map(finput, waterDepth, rhoWater):
+    # Initiate MAP++ from the list of input file lines of a design.
+    # The summary file is written on init; keep it in a temporary directory owned by this instance,
+    # rather than the working directory that all worker processes share
+    mymap = pyMAP( )
+    mymap.summary_dir = tempfile.TemporaryDirectory(prefix='map_')
+    mymap.summary_file(os.path.join(mymap.summary_dir.name, 'outlist.map.sum'))
+    mymap.map_set_sea_depth(waterDepth)
+    mymap.map_set_gravity(gravity)
+    mymap.map_set_sea_density(rhoWater)
+    mymap.read_list_input(finput)
+    mymap.init( )
+    return mymap
+
+
+def _fairlead_forces(mymap, displacements, nlines):
+    # Fairlead forces, (ndisplacements, nlines, 3), solving MAP++ at each vessel displacement in turn
+    F = np.zeros((len(displacements), nlines, 3))
+    for i, x in enumerate(displacements):
+        mymap.displace_vessel(*x)
+        mymap.update_states(0.0, 0)
+        F[i] = mymap.get_fairlead_forces_3d(nlines)
+    return F
+
+
+def _fairlead_forces_worker(args):
+    # helper function for multiprocessing.Pool.map, every worker owns its MAP++ instance
+    finput, waterDepth, rhoWater, displacements, nlines = args
+    mymap = _init_map(finput, waterDepth, rhoWater)
+    F     = _fairlead_forces(mymap, displacements, nlines)
+    mymap.end()
+    return F
+
+
 class MapMooring(ExplicitComponent):
     """
     OpenMDAO Component class for mooring system attached to sub-structure of floating offshore wind turbines.
     Should be tightly coupled with Spar class for full system representation.
     """
 
+    def initialize(self):
+        self.options.declare('cores', default=1, desc='number of processes for the MAP++ offset sweeps')
+
     def setup(self):
     
         # Variables local to the class and not OpenMDAO
@@ -418,13 +475,7 @@ class MapMooring(ExplicitComponent):
         self.write_input_file(inputs, discrete_inputs)
 
         # Initiate MAP++ for this design
-        mymap = pyMAP( )
-        #mymap.ierr = 0
-        mymap.map_set_sea_depth(waterDepth)
-        mymap.map_set_gravity(gravity)
-        mymap.map_set_sea_density(rhoWater)
-        mymap.read_list_input(self.finput)
-        mymap.init( )
+        mymap = _init_map(self.finput, waterDepth, rhoWater)
 
         # Get the stiffness matrix at neutral position
         mymap.displace_vessel(0, 0, 0, 0, 0, 0)
@@ -471,6 +522,14 @@ class MapMooring(ExplicitComponent):
         Imat = self.wet_mass_per_length * np.trapz(R, x=xyzpts_ds[:,:,np.newaxis], axis=1)
         outputs['mooring_moments_of_inertia'] = np.abs( Imat.sum(axis=0) )
 
+        # Get angles by which to find the weakest line
+        dangle  = 2.0
+        angles  = np.deg2rad( np.arange(0.0, 360.0, dangle) )
+
+        # Solve at the maximum angle of heel and at the maximum offset in all directions in one batch
+        displacements = np.r_[ [[0.0, 0.0, 0.0, 0.0, float(heel), 0.0]], vessel_displacements(angles, float(offset)) ]
+        F_batch, T_batch = self.solve_offsets(inputs, displacements, mymap=mymap)
+
         # Get the restoring moment at maximum angle of heel
         # Since we don't know the substucture CG, have to just get the forces of the lines now and do the cross product later
         # We also want to allow for arbitraty wind direction and yaw of rotor relative to mooring lines, so we will compare
@@ -478,54 +537,16 @@ class MapMooring(ExplicitComponent):
         # TODO: This still isgn't quite the same as clocking the mooring lines in different directions,
         # which is what we want to do, but that requires multiple input files and solutions
         Fh = np.zeros((NLINES_MAX,3))
-        mymap.displace_vessel(0, 0, 0, 0, heel, 0)
-        mymap.update_states(0.0, 0)
-        for k in range(ntotal):
-            Fh[k][0], Fh[k][1], Fh[k][2] = mymap.get_fairlead_force_3d(k)
-
+        Fh[:ntotal,:] = F_batch[0]
         outputs['operational_heel_restoring_force'] = Fh
 
-        # Get angles by which to find the weakest line
-        dangle  = 2.0
-        angles  = np.deg2rad( np.arange(0.0, 360.0, dangle) )
-        nangles = len(angles)
-
         # Get restoring force at weakest line at maximum allowable offset
         # Will global minimum always be along mooring angle?
-        max_tension   = 0.0
-        max_angle     = None
-        min_angle     = None
-        F_max_tension = None
-        F_min         = np.inf
-        T = np.zeros((NLINES_MAX,))
-        F = np.zeros((NLINES_MAX,))
-        # Loop around all angles to find weakest point
-        for a in angles:
-            # Unit vector and offset in x-y components
-            idir  = np.array([np.cos(a), np.sin(a)])
-            surge = offset * idir[0]
-            sway  = offset * idir[1]
-
-            # Get restoring force of offset at this angle
-            mymap.displace_vessel(surge, sway, 0, 0, 0, 0) # 0s for z, angles
-            mymap.update_states(0.0, 0)
-            for k in range(ntotal):
-                # Force in x-y-z coordinates
-                fx,fy,fz = mymap.get_fairlead_force_3d(k)
-                T[k]     = np.sqrt(fx*fx + fy*fy + fz*fz)
-                # Total restoring force
-                F[k]     = np.dot([fx, fy], idir)
-                
-            # Check if this is the weakest direction (highest tension)
-            tempMax = T.max()
-            if tempMax > max_tension:
-                max_tension   = tempMax
-                F_max_tension = F.sum()
-                max_angle     = a
-            if F.sum() < F_min:
-                F_min     = F.sum()
-                min_angle = a
-                
+        # Total restoring force along the offset direction and highest line tension over all angles
+        F           = F_batch[1:,:,0]*np.cos(angles)[:,np.newaxis] + F_batch[1:,:,1]*np.sin(angles)[:,np.newaxis]
+        F_min       = F.sum(axis=1).min()
+        max_tension = max(T_batch[1:].max(), 0.0)
+
         # Store the weakest restoring force when the vessel is offset the maximum amount
         outputs['max_offset_restoring_force'] = F_min
 
@@ -538,6 +559,46 @@ class MapMooring(ExplicitComponent):
         mymap.end()
 
         
+    def solve_offsets(self, inputs, displacements, mymap=None, cores=None):
+        """Solves MAP++ for a batch of vessel displacements, optionally split across worker
+        processes that each own a MAP++ instance of this design. Requires the MAP input
+        file lines, written by write_input_file.
+
+        INPUTS:
+        ----------
+        inputs        : dictionary of input parameters
+        displacements : array (n, 6) of [surge, sway, heave, roll, pitch, yaw] vessel displacements (see vessel_displacements)
+        mymap         : (optional) initialized MAP++ instance of this design, used when solving in this process
+        cores         : (optional) number of processes, defaults to the cores option
+
+        OUTPUTS:
+        ----------
+        F : array (n, nlines, 3) of fairlead forces in global coordinates
+        T : array (n, nlines) of fairlead tensions
+        """
+        rhoWater      = float(inputs['water_density'])
+        waterDepth    = float(inputs['water_depth'])
+        ntotal        = int(inputs['number_of_mooring_connections']) * int(inputs['mooring_lines_per_connection'])
+        displacements = np.atleast_2d(displacements)
+        if cores is None: cores = self.options['cores']
+        cores = max(min(cores, len(displacements)), 1)
+
+        if cores > 1:
+            chunks = np.array_split(displacements, cores)
+            jobs   = [(self.finput, waterDepth, rhoWater, x, ntotal) for x in chunks]
+            pool   = mp.Pool(cores)
+            out    = pool.map(_fairlead_forces_worker, jobs)
+            pool.close()
+            pool.join()
+            F = np.concatenate(out)
+        elif mymap is None:
+            F = _fairlead_forces_worker((self.finput, waterDepth, rhoWater, displacements, ntotal))
+        else:
+            F = _fairlead_forces(mymap, displacements, ntotal)
+
+        return F, np.sqrt(np.sum(F**2, axis=2))
+
+        
     def compute_cost(self, inputs, discrete_inputs, outputs):
         """Computes cost, based on mass scaling, of mooring system.
         
@@ -8,6 +8,7 @@ __email__ = "jake.nunemaker@nrel.gov"
 
 from .port import Port
 from .cargo import Cargo
+from .logs import LogStore
 from .vessel import Vessel
 from .components import Crane, JackingSys
 from .environment import OrbitEnvironment as Environment
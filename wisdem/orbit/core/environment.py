@@ -6,11 +6,13 @@ __maintainer__ = "Jake Nunemaker"
 __email__ = "jake.nunemaker@nrel.gov"
 
 
+from math import ceil
 from bisect import bisect
 
 import numpy as np
 from marmot import Environment
-from marmot._core import Constraint
+from marmot._core import Constraint, ge, gt, le, lt, true, false
+from marmot._exceptions import StateExhausted, WindowNotFound
 from numpy.lib.recfunctions import append_fields
 
 
@@ -42,6 +44,165 @@ class OrbitEnvironment(Environment):
         self._agents = {}
         self._objects = []
 
+    @Environment.state.setter
+    def state(self, data):
+        """
+        Sets the state data for the environment and clears the weather window
+        indices built from the previous data.
+
+        Parameters
+        ----------
+        data : np.ndarray | None
+        """
+
+        Environment.state.fset(self, data)
+        self._windows = {}
+
+    def find_operational_window(self, n, constraints):
+        """
+        Finds the first window of length `n` that satisfies any valid
+        `constraints`.
+
+        This method overrides the default method, looking the window up in the
+        index of weather windows of the constraint set (see `weather_windows`)
+        instead of searching the forecast.
+
+        Parameters
+        ----------
+        n : int
+            Length of required operational window.
+        constraints : dict
+            Dictionary of `Constraints` applied to `self.state` columns.
+
+        Returns
+        -------
+        delay : int
+            Duration of delay until operational window begins.
+        """
+
+        if not self.state.size > 0 or n <= 0:
+            return 0
+
+        valid = self._find_valid_constraints(**constraints)
+        starts, ends, long_starts = self.weather_windows(valid)
+
+        now = ceil(self.now)
+        i = np.searchsorted(starts, now, side="right") - 1
+        if i >= 0 and ends[i] - now >= n:
+            return 0
+
+        if n not in long_starts:
+            long_starts[n] = starts[ends - starts >= n]
+
+        j = np.searchsorted(long_starts[n], now, side="right")
+        if j == long_starts[n].size:
+            raise WindowNotFound(n, **valid)
+
+        return int(long_starts[n][j] - now)
+
+    def calculate_operational_delays(self, n, constraints):
+        """
+        Calculates the accumulated operational delay associated with an
+        operation of length `n` that can be suspended when any valid
+        `constraints` are not met.
+
+        This method overrides the default method, walking the index of weather
+        windows of the constraint set (see `weather_windows`) from the current
+        time instead of the forecast.
+
+        Parameters
+        ----------
+        n : int | float
+            Operation length.
+        constraints : dict
+            Dictionary of `Constraints` applied to `self.state` columns.
+
+        Returns
+        -------
+        durations : list
+            List of delays and operation times.
+        """
+
+        if not self.state.size > 0:
+            return [n]
+
+        valid = self._find_valid_constraints(**constraints)
+        starts, ends, _ = self.weather_windows(valid)
+
+        now = ceil(self.now)
+        i = np.searchsorted(ends, now, side="right")
+
+        durations = []
+        for start, end in zip(starts[i:].tolist(), ends[i:].tolist()):
+            if start > now:
+                durations.append(start - now)
+
+            l = end - max(start, now)
+            if l >= n:
+                durations.append(n)
+                return durations
+
+            durations.append(l)
+            n -= l
+            now = end
+
+        raise StateExhausted(len(self._state), **valid)
+
+    def weather_windows(self, constraints):
+        """
+        Returns the index of the time steps of the full weather time series
+        where all `constraints` are met, run-length encoded. The index is
+        built once per constraint set and reused by later tasks.
+
+        Parameters
+        ----------
+        constraints : dict
+            Valid constraints that apply to a column in `self.state`.
+
+        Returns
+        -------
+        starts : np.ndarray
+            First time step of every window.
+        ends : np.ndarray
+            Time step after the last of every window.
+        long_starts : dict
+            Starts of the windows of at least the key length, filled by
+            `find_operational_window`.
+        """
+
+        key = self._constraints_key(constraints)
+        if key in self._windows:
+            return self._windows[key]
+
+        valid = self._apply_constraints(self._state, constraints)
+        edges = np.diff(np.concatenate(([0], valid.astype(np.int8), [0])))
+        windows = (np.flatnonzero(edges == 1), np.flatnonzero(edges == -1), {})
+
+        if key is not None:
+            self._windows[key] = windows
+
+        return windows
+
+    @staticmethod
+    def _constraints_key(constraints):
+        """
+        Returns a hashable representation of `constraints`, or None if they
+        include a constraint type that can't be compared by value.
+        """
+
+        key = []
+        for k, v in sorted(constraints.items(), key=lambda c: c[0]):
+            if type(v) in (gt, ge, lt, le):
+                key.append((k, type(v).__name__, v.val))
+
+            elif type(v) in (true, false):
+                key.append((k, type(v).__name__))
+
+            else:
+                return None
+
+        return tuple(key)
+
     def _find_valid_constraints(self, **kwargs):
         """
         Finds any constraitns in `kwargs` where the key matches a column name
@@ -200,13 +361,13 @@ class OrbitEnvironment(Environment):
             Desired profile height.
         """
 
-        ts1 = self.state[f"windspeed_{h1}m"]
-        ts2 = self.state[f"windspeed_{h2}m"]
+        ts1 = self._state[f"windspeed_{h1}m"]
+        ts2 = self._state[f"windspeed_{h2}m"]
         alpha = np.log(ts2.mean() / ts1.mean()) / np.log(h2 / h1)
 
         ts = ts1 * (h / h1) ** alpha
 
-        self.state = np.array(append_fields(self.state, f"windspeed_{h}m", ts))
+        self.state = np.array(append_fields(self._state, f"windspeed_{h}m", ts))
 
     def extrapolate_ws(self, h1, h):
         """
@@ -221,10 +382,10 @@ class OrbitEnvironment(Environment):
             Desired profile height.
         """
 
-        ts1 = self.state[f"windspeed_{h1}m"]
+        ts1 = self._state[f"windspeed_{h1}m"]
         ts = ts1 * (h / h1) ** self.alpha
 
-        self.state = np.array(append_fields(self.state, f"windspeed_{h}m", ts))
+        self.state = np.array(append_fields(self._state, f"windspeed_{h}m", ts))
 
     @staticmethod
     def simplify_num(str):
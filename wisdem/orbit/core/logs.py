@@ -0,0 +1,247 @@
+"""Provides the `LogStore` class."""
+
+__author__ = "Jake Nunemaker"
+__copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
+__maintainer__ = "Jake Nunemaker"
+__email__ = "jake.nunemaker@nrel.gov"
+
+
+from array import array
+from numbers import Number
+
+import numpy as np
+import pandas as pd
+
+
+class LogStore:
+    """
+    Columnar store of simulation logs.
+
+    The fields shared by most logs are kept in typed columns, string fields
+    as integer codes into a list of categories and numeric fields as floats
+    with a presence mask. Any other fields are kept per log, only to rebuild
+    the logs as dictionaries.
+    """
+
+    categorical = ("level", "agent", "action", "phase", "progress")
+    numeric = ("time", "duration", "cost")
+
+    def __init__(self):
+        """Creates an instance of `LogStore`."""
+
+        self._lookup = {k: {} for k in self.categorical}
+        self._categories = {k: [] for k in self.categorical}
+        self._codes = {k: array("q") for k in self.categorical}
+        self._values = {k: array("d") for k in self.numeric}
+        self._present = {k: array("b") for k in self.numeric}
+        self._extra = []
+
+        self._clear_cache()
+
+    def __len__(self):
+        return len(self._extra)
+
+    def _clear_cache(self):
+        """Clears the arrays, frame and records built from the columns."""
+
+        self._columns = {}
+        self._frame = None
+        self._records = None
+
+    def append(self, log, offset=0):
+        """
+        Appends `log` to the store.
+
+        Parameters
+        ----------
+        log : dict
+            Log data.
+        offset : int | float
+            Added to the 'time' of the log.
+        """
+
+        self.extend([log], offset=offset)
+
+    def extend(self, logs, offset=0):
+        """
+        Appends `logs` to the store. The logs themselves are not modified.
+
+        Parameters
+        ----------
+        logs : list
+            List of log dictionaries.
+        offset : int | float
+            Added to the 'time' of each log.
+        """
+
+        core = {*self.categorical, *self.numeric}
+        for log in logs:
+            extra = {k: v for k, v in log.items() if k not in core}
+
+            for k in self.categorical:
+                v = log.get(k, None)
+                if v is None:
+                    self._codes[k].append(-1)
+                    continue
+
+                if not isinstance(v, str):
+                    extra[k] = v
+                    self._codes[k].append(-1)
+                    continue
+
+                lookup = self._lookup[k]
+                code = lookup.get(v, None)
+                if code is None:
+                    code = lookup[v] = len(lookup)
+                    self._categories[k].append(v)
+
+                self._codes[k].append(code)
+
+            for k in self.numeric:
+                v = log.get(k, None)
+                if v is None or not isinstance(v, Number):
+                    if v is not None:
+                        extra[k] = v
+
+                    self._values[k].append(np.nan)
+                    self._present[k].append(0)
+                    continue
+
+                if k == "time":
+                    v += offset
+
+                self._values[k].append(v)
+                self._present[k].append(1)
+
+            self._extra.append(extra)
+
+        self._clear_cache()
+
+    def categories(self, key):
+        """Returns the values of categorical column `key` in code order."""
+
+        return self._categories[key]
+
+    def code(self, key, value):
+        """Returns the code of `value` in categorical column `key` or -1."""
+
+        return self._lookup[key].get(value, -1)
+
+    def column(self, key):
+        """
+        Returns column `key` as an array: codes for categorical columns and
+        floats, NaN where missing, for numeric columns.
+        """
+
+        try:
+            return self._columns[key]
+
+        except KeyError:
+            pass
+
+        if key in self._codes:
+            col = np.array(self._codes[key], dtype=np.int64)
+
+        else:
+            col = np.array(self._values[key], dtype=float)
+
+        self._columns[key] = col
+        return col
+
+    def mask(self, key):
+        """Returns a boolean array of the logs that have field `key`."""
+
+        if key in self._codes:
+            return self.column(key) >= 0
+
+        if key in self._present:
+            return np.array(self._present[key], dtype=bool)
+
+        return np.array([key in e for e in self._extra], dtype=bool)
+
+    @property
+    def frame(self):
+        """Returns a DataFrame of the columns, with categorical dtypes."""
+
+        if self._frame is None:
+            data = {
+                k: pd.Categorical.from_codes(
+                    self.column(k), categories=self._categories[k]
+                )
+                for k in self.categorical
+            }
+            data.update({k: self.column(k) for k in self.numeric})
+            self._frame = pd.DataFrame(data)
+
+        return self._frame
+
+    def filter(self, keys):
+        """
+        Returns a list of tuples of the values of `keys` of each log that has
+        all of `keys`.
+
+        Parameters
+        ----------
+        keys : list
+            Log fields.
+        """
+
+        if not all(k in self._codes or k in self._values for k in keys):
+            records = self.records()
+            return [
+                tuple(l[k] for k in keys)
+                for l in records
+                if all(k in l for k in keys)
+            ]
+
+        mask = np.ones(len(self), dtype=bool)
+        for k in keys:
+            mask &= self.mask(k)
+
+        cols = []
+        for k in keys:
+            col = self.column(k)[mask]
+            if k in self._codes:
+                col = np.array(self._categories[k], dtype=object)[col]
+
+            cols.append(col.tolist())
+
+        return list(zip(*cols))
+
+    def records(self, index=None):
+        """
+        Returns the logs as a list of dictionaries.
+
+        Parameters
+        ----------
+        index : array-like, default: None
+            Positions of the logs to return. All logs if None.
+        """
+
+        if index is None and self._records is not None:
+            return self._records
+
+        rows = range(len(self)) if index is None else index
+        cat = [
+            (k, self._codes[k], self._categories[k]) for k in self.categorical
+        ]
+        num = [(k, self._values[k], self._present[k]) for k in self.numeric]
+
+        records = []
+        for i in rows:
+            log = {}
+            for k, codes, categories in cat:
+                if codes[i] >= 0:
+                    log[k] = categories[codes[i]]
+
+            for k, values, present in num:
+                if present[i]:
+                    log[k] = values[i]
+
+            log.update(self._extra[i])
+            records.append(log)
+
+        if index is None:
+            self._records = records
+
+        return records
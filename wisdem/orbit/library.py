@@ -39,13 +39,15 @@ import yaml
 import pandas as pd
 from yaml import Dumper
 
+from wisdem.commonse.yaml_loader import load_yaml
 from wisdem.orbit.core.exceptions import LibraryItemNotFoundError
 
 ROOT = os.path.abspath(os.path.join(os.path.abspath(__file__), "../.."))
 default_library = os.path.join(ROOT, "library")
 
-# Need a custom loader to read in scientific notation correctly
-class CustomSafeLoader(yaml.SafeLoader):
+# Need a custom loader to read in scientific notation correctly, based on the
+# LibYAML loader when available
+class CustomSafeLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
     def construct_python_tuple(self, node):
         return tuple(self.construct_sequence(node))
 
@@ -191,10 +193,9 @@ def _extract_file(filepath):
     """
 
     if filepath.endswith("yaml"):
-        f = open(filepath, "r")
-        fyaml = yaml.load(f, Loader=loader)
-        f.close()
-        return fyaml
+        # Parsed once per process, later calls return a copy of the cached
+        # specifications until the file is modified
+        return load_yaml(filepath, Loader=loader, sidecar=False)
 
     elif filepath.endswith("csv"):
         df = pd.read_csv(filepath, index_col=False)
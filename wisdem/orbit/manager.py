@@ -5,17 +5,22 @@ __email__ = ["jake.nunemaker@nrel.gov"]
 
 
 import re
+import warnings
 import datetime as dt
+import multiprocessing as mp
 import collections.abc as collections
 from copy import deepcopy
 from math import ceil
 from numbers import Number
 from itertools import product
+from contextlib import contextmanager
+from multiprocessing import shared_memory
 
 import numpy as np
 import pandas as pd
 
 from wisdem.orbit import library
+from wisdem.orbit.core import LogStore
 from wisdem.orbit.phases import DesignPhase, InstallPhase
 from wisdem.orbit.library import initialize_library, extract_library_data
 from wisdem.orbit.phases.design import (
@@ -96,8 +101,10 @@ class ProjectManager:
         self.phase_starts = {}
         self.phase_times = {}
         self.phase_costs = {}
-        self._output_logs = []
+        self._output_logs = LogStore()
         self._phases = {}
+        self._worker_phases = set()
+        self._cash_flow_model = None
 
         self.design_results = {}
         self.detailed_outputs = {}
@@ -119,6 +126,9 @@ class ProjectManager:
             - If ``self.config['install_phases']`` is a dict, phases are ran
               using ``self.run_multiple_phases_overlapping()``. The expected
               format for the dictionary is ``{'phase_name': '%m/%d/%Y'}``.
+        cores : int, default: 1
+            Number of worker processes used to run independent overlapping
+            installation phases, see ``self.run_multiple_phases_overlapping()``.
         """
 
         design_phases = self.config.get("design_phases", [])
@@ -129,6 +139,7 @@ class ProjectManager:
         if isinstance(install_phases, str):
             install_phases = [install_phases]
 
+        self._cash_flow_model = None
         self.run_all_design_phases(design_phases, **kwargs)
 
         if isinstance(install_phases, (list, set)):
@@ -139,9 +150,192 @@ class ProjectManager:
 
         self.progress = ProjectProgress(self.progress_logs)
 
+    @classmethod
+    def run_monte_carlo(
+        cls,
+        config,
+        weather,
+        starts=None,
+        years=None,
+        seed=None,
+        cores=1,
+        library_path=None,
+        **kwargs,
+    ):
+        """
+        Runs the project defined by `config` over many weather samples and
+        returns the distributions of installation time, CapEx and NPV.
+
+        Each sample is a weather profile of the same length and index as
+        `weather`, built from the input profile either:
+
+        - rotated to begin at one of `starts`, wrapping around at the end of
+          the profile, or
+        - resampled year by year: each calendar year of the profile is taken
+          from a complete year of the profile drawn at random, with
+          replacement. Hours are matched by date and time, so seasons stay
+          aligned across leap years; Feb 29 is taken from Feb 28 of the drawn
+          year.
+
+        The library data is extracted once and the weather values are placed
+        in shared memory, read by the `cores` worker processes.
+
+        Parameters
+        ----------
+        config : dict
+            Project configuration.
+        weather : pd.DataFrame
+            Site weather timeseries, hourly, indexed by datetime.
+        starts : list, default: None
+            Start indices or dates ('%m/%d/%Y') in the weather profile.
+        years : int, default: None
+            Number of samples built from resampled weather years.
+        seed : int, default: None
+            Seed for the weather year resampling.
+        cores : int, default: 1
+            Number of worker processes.
+        library_path: str, default: None
+            The absolute path to the project library.
+        kwargs : dict
+            Passed to `run_project`.
+
+        Returns
+        -------
+        results : dict
+            'samples': pd.DataFrame of 'installation_time', 'total_capex' and
+            'npv' per sample; 'quantiles': pd.DataFrame of the 10th, 50th and
+            90th percentile of each; 'P50' and 'P90': dicts of the median and
+            of the value reached with 90% probability, ie. the 90th percentile
+            of 'installation_time' and 'total_capex' but the 10th percentile
+            of 'npv'.
+        """
+
+        project = cls(config, library_path=library_path, weather=weather)
+        weather = project.weather
+        if weather is None:
+            raise ValueError("A weather profile is required.")
+
+        n = len(weather)
+        samples = []
+        for start in starts or []:
+            if isinstance(start, str):
+                _dt = dt.datetime.strptime(start, cls.date_format_short)
+                try:
+                    start = weather.index.get_loc(_dt)
+
+                except KeyError:
+                    raise WeatherProfileError(_dt, weather)
+
+            samples.append(ceil(start) % n)
+
+        if years:
+            rng = np.random.default_rng(seed)
+            samples.extend(cls._resample_weather_years(weather, years, rng))
+
+        if not samples:
+            raise ValueError("No weather samples defined by starts or years.")
+
+        values = weather.to_numpy(dtype=float)
+        shm = shared_memory.SharedMemory(create=True, size=values.nbytes)
+        try:
+            np.ndarray(values.shape, dtype=float, buffer=shm.buf)[:] = values
+            initargs = (
+                cls,
+                project.config,
+                (shm.name, values.shape, weather.index, weather.columns),
+                kwargs,
+            )
+
+            cores = min(cores, len(samples))
+            if cores > 1:
+                pool = mp.Pool(
+                    cores, initializer=_init_monte_carlo, initargs=initargs
+                )
+                out = pool.map(_run_monte_carlo_sample, samples)
+                pool.close()
+                pool.join()
+
+            else:
+                _init_monte_carlo(*initargs)
+                try:
+                    out = [_run_monte_carlo_sample(s) for s in samples]
+
+                finally:
+                    _monte_carlo.pop("shm").close()
+                    _monte_carlo.clear()
+
+        finally:
+            shm.close()
+            shm.unlink()
+
+        df = pd.DataFrame(
+            out, columns=["installation_time", "total_capex", "npv"]
+        )
+        quantiles = df.quantile([0.1, 0.5, 0.9])
+        p90 = quantiles.loc[0.9].to_dict()
+        p90["npv"] = quantiles.loc[0.1, "npv"]
+
+        return {
+            "samples": df,
+            "quantiles": quantiles,
+            "P50": quantiles.loc[0.5].to_dict(),
+            "P90": p90,
+        }
+
+    @staticmethod
+    def _resample_weather_years(weather, years, rng):
+        """
+        Returns `years` arrays of the rows of `weather` that rebuild it from
+        calendar years drawn at random from its complete years.
+
+        Parameters
+        ----------
+        weather : pd.DataFrame
+            Hourly weather profile with a DatetimeIndex.
+        years : int
+            Number of samples.
+        rng : np.random.Generator
+        """
+
+        index = weather.index
+        if not isinstance(index, pd.DatetimeIndex):
+            raise ValueError(
+                "Weather profile must be indexed by datetime to resample years."
+            )
+
+        # Hour of a non-leap year of each row, Feb 29 falling on Feb 28
+        day = index.dayofyear.to_numpy() - 1
+        day -= index.is_leap_year & (day >= 59)
+        hour = day * 24 + index.hour.to_numpy()
+
+        year, inverse = np.unique(index.year.to_numpy(), return_inverse=True)
+        table = np.full((year.size, 8760), -1, dtype=np.int64)
+        rows = np.arange(len(index))[::-1]
+        table[inverse[rows], hour[rows]] = rows
+
+        table = table[(table >= 0).all(axis=1)]
+        if not len(table):
+            raise ValueError(
+                "Weather profile has no complete year, "
+                "years can't be resampled."
+            )
+
+        draws = rng.integers(len(table), size=(years, year.size))
+        return list(table[draws[:, inverse], hour])
+
     @property
     def phases(self):
-        """Returns dict of phases that have been ran."""
+        """
+        Returns dict of phases that have been ran. Installation phases ran in
+        worker processes, see `run_multiple_phases_overlapping`, are not
+        included and a warning lists them.
+        """
+
+        if self._worker_phases:
+            warnings.warn(
+                "Installation phases ran in worker processes are not "
+                f"included in 'phases': {sorted(self._worker_phases)}"
+            )
 
         return self._phases
 
@@ -397,7 +591,21 @@ class ProjectManager:
         cost : int | float
             Total phase cost.
         logs : list
-            List of phase logs.
+            List of phase logs, `phase.env.logs`.
+        """
+
+        task = self._install_phase_task(name, start, **kwargs)
+        phase, result = _run_install_phase(*task)
+
+        if phase is not None:
+            self._phases[name] = phase
+
+        return self._record_install_phase(name, start, result)
+
+    def _install_phase_task(self, name, start, **kwargs):
+        """
+        Returns the arguments of `_run_install_phase` for phase `name`
+        starting at `start`.
         """
 
         if self.weather is not None:
@@ -412,35 +620,27 @@ class ProjectManager:
 
         kwargs = _config.pop("kwargs", {})
 
-        if _catch:
-            try:
-                phase = _class(
-                    _config, weather=weather, phase_name=name, **kwargs
-                )
-                phase.run()
+        return _class, _config, weather, name, kwargs, _catch
 
-            except Exception as e:
-                print(f"\n\t - {name}: {e}")
-                self.phase_costs[name] = e.__class__.__name__
-                self.phase_times[name] = e.__class__.__name__
+    def _record_install_phase(self, name, start, result):
+        """
+        Stores the `result` of `_run_install_phase` for phase `name` and
+        returns the phase cost, time and logs, or None if the phase failed.
+        """
 
-                return None, None, None
+        if isinstance(result, str):
+            self.phase_costs[name] = result
+            self.phase_times[name] = result
 
-        else:
-            phase = _class(_config, weather=weather, phase_name=name, **kwargs)
-            phase.run()
+            return None, None, None
 
-        self._phases[name] = phase
-
-        time = phase.total_phase_time
-        cost = phase.total_phase_cost
-        logs = deepcopy(phase.env.logs)
+        time, cost, logs, detailed_output = result
 
         self.phase_starts[name] = start
         self.phase_costs[name] = cost
         self.phase_times[name] = time
         self.detailed_outputs = self.merge_dicts(
-            self.detailed_outputs, phase.detailed_output
+            self.detailed_outputs, detailed_output
         )
 
         return cost, time, logs
@@ -540,50 +740,48 @@ class ProjectManager:
                 continue
 
             else:
-                for l in logs:
-                    try:
-                        l["time"] += start
-                    except KeyError:
-                        pass
-
-                self._output_logs.extend(logs)
+                self._output_logs.extend(logs, offset=start)
                 start = ceil(start + time)
 
-    def run_multiple_phases_overlapping(self, phases, **kwargs):
+    def run_multiple_phases_overlapping(self, phases, cores=1, **kwargs):
         """
         Runs multiple phases overlapping using a mixture of dates, indices or
         dependencies.
 
+        Phases with a defined start are independent of each other and are ran
+        together, followed by the dependent phases in order of their
+        dependencies. With `cores` > 1, the phases ran together are split over
+        worker processes. The logs are merged in the order of `phases`, so
+        the project outputs don't depend on `cores` or on the order the
+        phases are ran in, but `self.phases` won't include the installation
+        phases ran in workers.
+
         Parameters
         ----------
         phases : dict
             Dictionary of phases to run.
+        cores : int, default: 1
+            Number of worker processes.
         """
 
         defined, variable = self._parse_install_phase_values(phases)
         zero = min(defined.values())
 
-        # Run defined
-        for name, start in defined.items():
-
-            _, _, logs = self.run_install_phase(name, start, **kwargs)
-
-            if logs is None:
-                continue
+        with self._install_phase_pool(cores, len(phases)) as pool:
 
-            else:
-                for l in logs:
-                    try:
-                        l["time"] += start - zero
-                    except KeyError:
-                        pass
+            # Run defined
+            results = self._run_install_phase_group(
+                list(defined.items()), pool, **kwargs
+            )
 
-                self._output_logs.extend(logs)
+            # Run remaining phases
+            results.update(
+                self._run_dependent_phases(variable, pool, **kwargs)
+            )
 
-        # Run remaining phases
-        self.run_dependent_phases(variable, zero)
+        self._merge_install_phase_logs([*defined, *variable], results, zero)
 
-    def run_dependent_phases(self, phases, zero, **kwargs):
+    def run_dependent_phases(self, phases, zero, cores=1, **kwargs):
         """
         Runs remaining phases that depend on other phase times.
 
@@ -593,43 +791,134 @@ class ProjectManager:
             Dictionary of phases to run.
         zero : int | float
             Zero time for the simulation. Used to aggregate total logs.
+        cores : int, default: 1
+            Number of worker processes.
         """
 
-        while True:
+        with self._install_phase_pool(cores, len(phases)) as pool:
+            results = self._run_dependent_phases(phases, pool, **kwargs)
 
-            progress = False
-            for name, (target, perc) in phases.items():
+        self._merge_install_phase_logs(phases, results, zero)
 
-                try:
-                    start = self.get_dependency_start_time(target, perc)
-                    cost, time, logs = self.run_install_phase(
-                        name, start, **kwargs
-                    )
-                    progress = True
+    def _run_dependent_phases(self, phases, pool, **kwargs):
+        """
+        Runs the phases that depend on other phase times, in groups of phases
+        whose target phases have all been ran. Returns the start and logs of
+        each phase ran, see `_run_install_phase_group`.
+        """
 
-                    if logs is None:
-                        continue
+        remaining = dict(phases)
+        results = {}
+        progress = False
 
-                    else:
-                        for l in logs:
-                            try:
-                                l["time"] += start - zero
-                            except KeyError:
-                                pass
+        while remaining:
+            ready = [
+                n
+                for n, (target, _) in remaining.items()
+                if target in self.phase_starts
+            ]
+            if not ready:
+                break
 
-                        self._output_logs.extend(logs)
+            group = []
+            for name in ready:
+                target, perc = remaining.pop(name)
+                start = self.get_dependency_start_time(target, perc)
+                group.append((name, start))
 
-                except KeyError:
-                    print(
-                        f"Skipped '{name}': Dependency '{target}' not found."
-                    )
-                    continue
+            results.update(
+                self._run_install_phase_group(group, pool, **kwargs)
+            )
+            progress = True
 
-            if phases and progress is False:
-                raise PhaseDependenciesInvalid(phases)
+        for name, (target, _) in remaining.items():
+            print(f"Skipped '{name}': Dependency '{target}' not found.")
 
-            else:
-                break
+        if phases and progress is False:
+            raise PhaseDependenciesInvalid(phases)
+
+        return results
+
+    def _run_install_phase_group(self, group, pool, **kwargs):
+        """
+        Runs a group of independent install phases, in `pool` if it isn't
+        None.
+
+        Parameters
+        ----------
+        group : list
+            List of (phase name, start) tuples.
+        pool : multiprocessing.Pool | None
+
+        Returns
+        -------
+        results : dict
+            (start, logs) of each phase, logs None if the phase failed.
+        """
+
+        if pool is None or len(group) < 2:
+            results = [
+                self.run_install_phase(name, start, **kwargs)
+                for name, start in group
+            ]
+
+        else:
+            tasks = [
+                self._install_phase_task(name, start, **kwargs)
+                for name, start in group
+            ]
+            results = pool.map(_run_install_phase_task, tasks)
+            results = [
+                self._record_install_phase(name, start, result)
+                for (name, start), result in zip(group, results)
+            ]
+            self._worker_phases.update(name for name, _ in group)
+
+        return {
+            name: (start, logs)
+            for (name, start), (_, _, logs) in zip(group, results)
+        }
+
+    def _merge_install_phase_logs(self, order, results, zero):
+        """
+        Adds the logs of the install phases in `results` to the project logs,
+        in the order of the phase names in `order`.
+
+        Parameters
+        ----------
+        order : list
+            Phase names.
+        results : dict
+            (start, logs) of each phase ran.
+        zero : int | float
+            Zero time for the simulation. Used to aggregate total logs.
+        """
+
+        for name in order:
+            start, logs = results.get(name, (None, None))
+            if logs is not None:
+                self._output_logs.extend(logs, offset=start - zero)
+
+    @staticmethod
+    @contextmanager
+    def _install_phase_pool(cores, num_phases):
+        """
+        Yields a pool of up to `cores` worker processes for running
+        `num_phases` install phases, or None if they are ran in this process.
+        """
+
+        cores = min(cores, num_phases)
+        if cores < 2:
+            yield None
+            return
+
+        pool = mp.Pool(cores)
+        try:
+            yield pool
+
+        finally:
+            pool.close()
+            pool.join()
 
     def get_dependency_start_time(self, target, perc):
         """
@@ -781,19 +1070,32 @@ class ProjectManager:
         return rating
 
     @property
-    def project_logs(self):
-        """Returns list of all logs in the project."""
+    def log_store(self):
+        """Returns the columnar store of all logs in the project."""
 
         if not self._output_logs:
             raise Exception("Project hasn't been ran yet.")
 
         return self._output_logs
 
+    @property
+    def project_logs(self):
+        """Returns list of all logs in the project."""
+
+        return self.log_store.records()
+
+    @property
+    def project_logs_frame(self):
+        """Returns a DataFrame of the logged level, agent, action, phase,
+        progress, time, duration and cost of all logs in the project."""
+
+        return self.log_store.frame
+
     @property
     def project_time(self):
         """Returns total project time as the time of the last log."""
 
-        return self.project_logs[-1]["time"]
+        return self.log_store.column("time")[-1]
 
     @property
     def month_bins(self):
@@ -802,105 +1104,148 @@ class ProjectManager:
         return np.arange(0, self.project_time + 730, 730)
 
     @property
-    def monthly_expenses(self):
-        """Returns the monthly expenses of the project from development through
-        construction."""
+    def cash_flow_model(self):
+        """
+        Returns the monthly cash flow model of the project, see
+        `run_cash_flow_model`. The model is computed on first access and kept
+        until the project is ran again or any of its inputs, see
+        `_cash_flow_inputs`, change.
+        """
 
-        opex = self.monthly_opex
-        lifetime = self.config.get("project_lifetime", 25)
+        inputs = self._cash_flow_inputs()
+        if self._cash_flow_model is None or self._cash_flow_model[0] != inputs:
+            self._cash_flow_model = (inputs, self.run_cash_flow_model())
+
+        return self._cash_flow_model[1]
+
+    def _cash_flow_inputs(self):
+        """
+        Returns the config values and project results, other than the logs,
+        that `run_cash_flow_model` depends on.
+        """
 
-        _expense_logs = self._filter_logs(keys=["cost", "time"])
-        expenses = np.array(
-            _expense_logs, dtype=[("cost", "f8"), ("time", "i4")]
+        return (
+            self.config.get("opex_rate", 150),
+            self.config.get("ncf", 0.4),
+            self.config.get("offtake_price", 80),
+            self.config.get("project_lifetime", 25),
+            self.config.get("discount_rate", 0.025),
+            self.turbine_rating,
+            self.overnight_capex,
         )
-        dig = np.digitize(expenses["time"], self.month_bins)
 
-        monthly = {}
-        for i in range(1, lifetime * 12):
-            monthly[i] = sum(expenses["cost"][dig == i]) + opex[i]
+    def run_cash_flow_model(self):
+        """
+        Computes the monthly expenses, OpEx, revenue and net cash flow of the
+        project over months `1` to `12 * project_lifetime - 1`, and the NPV.
 
-        return monthly
+        The number of generating turbines in each month is the cumulative sum
+        of the turbines per array string, up to the number of strings
+        energized by that month (see `ProjectProgress.energize_points`).
 
-    @property
-    def monthly_opex(self):
-        """Returns the monthly OpEx expenditures based on project size."""
+        Returns
+        -------
+        model : dict
+            'months', 'expenses', 'opex', 'revenue' and 'cash_flow' arrays
+            and the 'npv' of the project. 'revenue' is None if the array
+            strings can't be energized and 'revenue_error' is the reason.
+        """
 
         rate = self.config.get("opex_rate", 150)
+        ncf = self.config.get("ncf", 0.4)
+        price = self.config.get("offtake_price", 80)
         lifetime = self.config.get("project_lifetime", 25)
+        dr = self.config.get("discount_rate", 0.025)
+
+        months = np.arange(1, lifetime * 12)
+        bins = self.month_bins
+
+        logs = self.log_store
+        mask = logs.mask("cost") & logs.mask("time")
+        times = logs.column("time")[mask].astype("i4")
+        costs = np.bincount(
+            np.digitize(times, bins),
+            weights=logs.column("cost")[mask],
+            minlength=lifetime * 12,
+        )[months]
 
         try:
             times, turbines = self.progress.energize_points
-            dig = list(np.digitize(times, self.month_bins))
+            error = None
 
-        except ValueError:
-            return {i: 0.0 for i in range(1, lifetime * 12)}
+        except ValueError as e:
+            error = e
 
-        opex = {}
-        for i in range(1, lifetime * 12):
-            generating_strings = len([t for t in dig if i >= t])
-            generating_turbines = sum(turbines[:generating_strings])
+        if error is None:
+            dig = np.sort(np.digitize(times, bins))
+            strings = np.searchsorted(dig, months, side="right")
+            generating = np.concatenate(([0], np.cumsum(turbines)))[strings]
 
-            opex[i] = (
-                generating_turbines * self.turbine_rating * rate * 1000 / 12
-            )
+            opex = generating * self.turbine_rating * rate * 1000 / 12
+            production = generating * self.turbine_rating * ncf * 730  # MWh
+            revenue = production * price
+            expenses = costs + opex
+            cash_flow = revenue - expenses
 
-        return opex
+        else:
+            opex = np.zeros(months.size)
+            revenue = None
+            expenses = costs + opex
+            cash_flow = -expenses
+
+        pr = (1 + dr) ** (1 / 12) - 1
+        npv = self.overnight_capex - np.sum(cash_flow / (1 + pr) ** months)
+
+        return {
+            "months": months,
+            "expenses": expenses,
+            "opex": opex,
+            "revenue": revenue,
+            "revenue_error": error,
+            "cash_flow": cash_flow,
+            "npv": npv,
+        }
+
+    @property
+    def monthly_expenses(self):
+        """Returns the monthly expenses of the project from development through
+        construction."""
+
+        model = self.cash_flow_model
+        return dict(zip(model["months"].tolist(), model["expenses"]))
+
+    @property
+    def monthly_opex(self):
+        """Returns the monthly OpEx expenditures based on project size."""
+
+        model = self.cash_flow_model
+        return dict(zip(model["months"].tolist(), model["opex"]))
 
     @property
     def monthly_revenue(self):
         """Returns the monthly revenue based on when array system strings can
         be energized, eg. 'self.progress.energize_points'."""
 
-        ncf = self.config.get("ncf", 0.4)
-        price = self.config.get("offtake_price", 80)
-        lifetime = self.config.get("project_lifetime", 25)
-
-        times, turbines = self.progress.energize_points
-        dig = list(np.digitize(times, self.month_bins))
-
-        revenue = {}
-        for i in range(1, lifetime * 12):
-            generating_strings = len([t for t in dig if i >= t])
-            generating_turbines = sum(turbines[:generating_strings])
-            production = (
-                generating_turbines * self.turbine_rating * ncf * 730
-            )  # MWh
-            revenue[i] = production * price
+        model = self.cash_flow_model
+        if model["revenue"] is None:
+            raise model["revenue_error"]
 
-        return revenue
+        return dict(zip(model["months"].tolist(), model["revenue"]))
 
     @property
     def cash_flow(self):
         """Returns the net cash flow based on `self.monthly_expenses` and
         `self.monthly_revenue`."""
 
-        try:
-            revenue = self.monthly_revenue
-
-        except ValueError:
-            revenue = {}
-
-        expenses = self.monthly_expenses
-        return {
-            i: revenue.get(i, 0.0) - expenses.get(i, 0.0)
-            for i in range(1, max([*revenue.keys(), *expenses.keys()]) + 1)
-        }
+        model = self.cash_flow_model
+        return dict(zip(model["months"].tolist(), model["cash_flow"]))
 
     @property
     def npv(self):
         """Returns the net present value of the project based on
         `self.cash_flow`."""
 
-        dr = self.config.get("discount_rate", 0.025)
-        pr = (1 + dr) ** (1 / 12) - 1
-
-        cash_flow = self.cash_flow
-        _npv = [
-            (cash_flow[i] / (1 + pr) ** (i))
-            for i in range(1, max(cash_flow.keys()) + 1)
-        ]
-
-        return self.overnight_capex - sum(_npv)
+        return self.cash_flow_model["npv"]
 
     @property
     def progress_logs(self):
@@ -911,32 +1256,29 @@ class ProjectManager:
     def _filter_logs(self, keys):
         """Returns filtered list of logs."""
 
-        filtered = []
-        for l in self.project_logs:
-            try:
-                filtered.append(tuple(l[k] for k in keys))
-
-            except KeyError:
-                pass
-
-        return filtered
+        return self.log_store.filter(keys)
 
     @property
     def progress_summary(self):
         """Returns a summary of progress by month."""
 
-        arr = np.array(
-            self.progress_logs, dtype=[("progress", "U32"), ("time", "i4")]
+        logs = self.log_store
+        mask = logs.mask("progress") & logs.mask("time")
+        times = logs.column("time")[mask].astype("i4")
+        dig = np.digitize(times, self.month_bins)
+
+        # Count (month, progress) pairs, ordering progress points by name
+        categories = np.array(logs.categories("progress"), dtype=object)
+        order = np.argsort(categories)
+        rank = np.argsort(order)[logs.column("progress")[mask]]
+        pairs, counts = np.unique(
+            np.stack([dig, rank]), axis=1, return_counts=True
         )
-        dig = np.digitize(arr["time"], self.month_bins)
 
-        summary = {}
-        for i in range(1, len(self.month_bins)):
-
-            unique, counts = np.unique(
-                arr["progress"][dig == i], return_counts=True
-            )
-            summary[i] = dict(zip(unique, counts))
+        summary = {i: {} for i in range(1, len(self.month_bins))}
+        for (i, r), count in zip(pairs.T, counts):
+            if i in summary:
+                summary[i][categories[order[r]]] = count
 
         return summary
 
@@ -944,8 +1286,15 @@ class ProjectManager:
     def project_actions(self):
         """Returns list of all actions in the project."""
 
-        actions = [l for l in self.project_logs if l["level"] == "ACTION"]
-        return sorted(actions, key=lambda l: l["time"])
+        logs = self.log_store
+        level = logs.code("level", "ACTION")
+        if level < 0:
+            return []
+
+        index = np.flatnonzero(logs.column("level") == level)
+        order = np.argsort(logs.column("time")[index], kind="stable")
+
+        return logs.records(index[order])
 
     @staticmethod
     def create_input_xlsx():
@@ -1335,3 +1684,90 @@ class ProjectProgress:
 
         for i in range(0, len(l), n):
             yield len(l[i : i + n])
+
+
+def _run_install_phase(_class, config, weather, name, kwargs, catch):
+    """
+    Runs install phase `name` of class `_class`. Returns the phase and a tuple
+    of its time, cost, logs and detailed output, or the phase (None) and the
+    name of the exception raised if `catch` is True.
+    """
+
+    if catch:
+        try:
+            phase = _class(config, weather=weather, phase_name=name, **kwargs)
+            phase.run()
+
+        except Exception as e:
+            print(f"\n\t - {name}: {e}")
+            return None, e.__class__.__name__
+
+    else:
+        phase = _class(config, weather=weather, phase_name=name, **kwargs)
+        phase.run()
+
+    return phase, (
+        phase.total_phase_time,
+        phase.total_phase_cost,
+        phase.env.logs,
+        phase.detailed_output,
+    )
+
+
+def _run_install_phase_task(task):
+    """
+    Runs an install phase in a worker process, returning the results of
+    `_run_install_phase` without the phase.
+    """
+
+    _, result = _run_install_phase(*task)
+    return result
+
+
+_monte_carlo = {}
+
+
+def _init_monte_carlo(cls, config, weather, kwargs):
+    """
+    Initializes a Monte Carlo worker with the resolved project configuration
+    and the weather values shared by `ProjectManager.run_monte_carlo`.
+    """
+
+    name, shape, index, columns = weather
+    shm = shared_memory.SharedMemory(name=name)
+    _monte_carlo.update(
+        cls=cls,
+        config=config,
+        shm=shm,
+        values=np.ndarray(shape, dtype=float, buffer=shm.buf),
+        index=index,
+        columns=columns,
+        kwargs=kwargs,
+    )
+
+
+def _run_monte_carlo_sample(sample):
+    """
+    Runs the project over one weather sample, defined by either its start row
+    in the shared weather profile or the array of its rows.
+    """
+
+    values = _monte_carlo["values"]
+    n = values.shape[0]
+
+    if np.ndim(sample) == 0:
+        rows = (sample + np.arange(n)) % n
+
+    else:
+        rows = sample
+
+    weather = pd.DataFrame(
+        values[rows],
+        index=_monte_carlo["index"],
+        columns=_monte_carlo["columns"],
+    )
+
+    project = _monte_carlo["cls"](_monte_carlo["config"], weather=weather)
+    project.run_project(**_monte_carlo["kwargs"])
+
+    return project.installation_time, project.total_capex, project.npv
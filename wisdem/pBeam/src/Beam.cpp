@@ -232,6 +232,9 @@ void Beam::assembleMatrices(){
     // apply base b.c.
     length = applyBaseBoundaryCondition(base.k, base.rigid, nodes, KFull, MFull, NotherFull, NFull, FFull, K, M, Nother, N, F);
 
+    // factor once, shared by all load cases
+    Kfact.compute(K);
+
 }
 
 
@@ -353,9 +356,7 @@ void Beam::naturalFrequencies(bool cmpVec, int n, Vector &freq, Matrix &vec) con
 void Beam::computeDisplacement(Vector &dx, Vector &dy, Vector&dz, Vector &dtheta_x, Vector &dtheta_y, Vector &dtheta_z) const{
 
     // solve linear system
-    Vector q(length);
-
-    myMath::solveSPDBLinearSystem(K, F, q);
+    Vector q = Kfact.solve(F);
 
     computeDisplacementComponentsFromVector(q, dx, dy, dz, dtheta_x, dtheta_y, dtheta_z);
 }
@@ -491,6 +492,16 @@ double Beam::estimateCriticalBucklingLoad(double FzExisting, int ix1, int ix2) c
 // using FEA coordinate system
 void Beam::shearAndBending(PolyVec &Vx, PolyVec &Vy, PolyVec &Fz, PolyVec &Mx, PolyVec &My, PolyVec &Tz) const{
 
+    shearAndBending(Px, Py, Pz, Fx_node, Fy_node, Fz_node, Mx_node, My_node, Mz_node, Vx, Vy, Fz, Mx, My, Tz);
+}
+
+
+// private method
+void Beam::shearAndBending(const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
+                           const Vector &Fx_node, const Vector &Fy_node, const Vector &Fz_node,
+                           const Vector &Mx_node, const Vector &My_node, const Vector &Mz_node,
+                           PolyVec &Vx, PolyVec &Vy, PolyVec &Fz, PolyVec &Mx, PolyVec &My, PolyVec &Tz) const{
+
     Vx.resize(nodes-1);
     Vy.resize(nodes-1);
     Fz.resize(nodes-1);
@@ -548,6 +559,14 @@ void Beam::computeAxialStrain(Vector &x, Vector &y, Vector &z, Vector &epsilon_a
     PolyVec Vx, Vy, Fz, Mx, My, Tz;
     shearAndBending(Vx, Vy, Fz, Mx, My, Tz);
 
+    axialStrain(Fz, Mx, My, x, y, z, epsilon_axial);
+}
+
+
+// private method
+void Beam::axialStrain(const PolyVec &Fz, const PolyVec &Mx, const PolyVec &My,
+                       Vector &x, Vector &y, Vector &z, Vector &epsilon_axial) const{
+
     // find location in structure
     int idx;
     double distance;
@@ -610,6 +629,145 @@ void Beam::computeAxialStrain(Vector &x, Vector &y, Vector &z, Vector &epsilon_a
 }
 
 
+void Beam::computeLoadCases(const std::vector<Loads> &cases,
+                            Matrix &dx, Matrix &dy, Matrix &dz, Matrix &dtheta_x, Matrix &dtheta_y, Matrix &dtheta_z,
+                            Matrix &Vx, Matrix &Vy, Matrix &Fz, Matrix &Mx, Matrix &My, Matrix &Tz) const{
+
+    int ncase = (int) cases.size();
+    int n = nodes - 1;
+
+    // force vectors of all cases, solved together with the existing factorization
+    Matrix Fcases(length, ncase);
+    std::vector<PolyVec> VxP(ncase), VyP(ncase), FzP(ncase), MxP(ncase), MyP(ncase), TzP(ncase);
+
+    for (int c = 0; c < ncase; c++) {
+        PolyVec Px_c, Py_c, Pz_c;
+        Vector Fx_c, Fy_c, Fz_c, Mx_c, My_c, Mz_c, F_c;
+        translateLoads(cases[c], Px_c, Py_c, Pz_c, Fx_c, Fy_c, Fz_c, Mx_c, My_c, Mz_c);
+
+        loadVector(Px_c, Py_c, Pz_c, Fx_c, Fy_c, Fz_c, Mx_c, My_c, Mz_c, F_c);
+        Fcases.col(c) = F_c;
+
+        shearAndBending(Px_c, Py_c, Pz_c, Fx_c, Fy_c, Fz_c, Mx_c, My_c, Mz_c,
+                        VxP[c], VyP[c], FzP[c], MxP[c], MyP[c], TzP[c]);
+    }
+
+    Matrix q = Kfact.solve(Fcases);
+
+    dx.resize(ncase, nodes);
+    dy.resize(ncase, nodes);
+    dz.resize(ncase, nodes);
+    dtheta_x.resize(ncase, nodes);
+    dtheta_y.resize(ncase, nodes);
+    dtheta_z.resize(ncase, nodes);
+    Vx.resize(ncase, nodes);
+    Vy.resize(ncase, nodes);
+    Fz.resize(ncase, nodes);
+    Mx.resize(ncase, nodes);
+    My.resize(ncase, nodes);
+    Tz.resize(ncase, nodes);
+
+    for (int c = 0; c < ncase; c++) {
+        Vector dx_c, dy_c, dz_c, dtx_c, dty_c, dtz_c;
+        computeDisplacementComponentsFromVector(q.col(c), dx_c, dy_c, dz_c, dtx_c, dty_c, dtz_c);
+        dx.row(c) = dx_c;
+        dy.row(c) = dy_c;
+        dz.row(c) = dz_c;
+        dtheta_x.row(c) = dtx_c;
+        dtheta_y.row(c) = dty_c;
+        dtheta_z.row(c) = dtz_c;
+
+        // evaluate at the nodes, translating back to global coordinates
+        for (int i = 0; i < nodes; i++) {
+            int e = (i < n) ? i : n-1;
+            double s = (i < n) ? 0.0 : 1.0;
+            Vx(c, i) = VxP[c][e].eval(s);
+            Vy(c, i) = VyP[c][e].eval(s);
+            Fz(c, i) = FzP[c][e].eval(s);
+            Mx(c, i) = -MyP[c][e].eval(s);
+            My(c, i) = MxP[c][e].eval(s);
+            Tz(c, i) = TzP[c][e].eval(s);
+        }
+    }
+}
+
+
+void Beam::computeAxialStrainLoadCases(const std::vector<Loads> &cases, Vector &x, Vector &y, Vector &z,
+                                       Matrix &epsilon_axial) const{
+
+    int ncase = (int) cases.size();
+    epsilon_axial.resize(ncase, z.size());
+
+    for (int c = 0; c < ncase; c++) {
+        PolyVec Px_c, Py_c, Pz_c;
+        Vector Fx_c, Fy_c, Fz_c, Mx_c, My_c, Mz_c;
+        translateLoads(cases[c], Px_c, Py_c, Pz_c, Fx_c, Fy_c, Fz_c, Mx_c, My_c, Mz_c);
+
+        PolyVec Vx, Vy, Fz, Mx, My, Tz;
+        shearAndBending(Px_c, Py_c, Pz_c, Fx_c, Fy_c, Fz_c, Mx_c, My_c, Mz_c, Vx, Vy, Fz, Mx, My, Tz);
+
+        Vector eps(z.size());
+        axialStrain(Fz, Mx, My, x, y, z, eps);
+        epsilon_axial.row(c) = eps;
+    }
+}
+
+
+// private method
+void Beam::translateLoads(const Loads &loads, PolyVec &Px, PolyVec &Py, PolyVec &Pz,
+                          Vector &Fx, Vector &Fy, Vector &Fz, Vector &Mx, Vector &My, Vector &Mz) const{
+
+    // linear variation in distributed loads
+    Px.resize(nodes-1);
+    Py.resize(nodes-1);
+    Pz.resize(nodes-1);
+    for (int i = 0; i < nodes-1; i++) {
+        Px[i] = Poly(2, loads.Px(i+1) - loads.Px(i), loads.Px(i));
+        Py[i] = Poly(2, loads.Py(i+1) - loads.Py(i), loads.Py(i));
+        Pz[i] = Poly(2, loads.Pz(i+1) - loads.Pz(i), loads.Pz(i));
+    }
+
+    // moments as in translateFromGlobalToFEACoordinateSystem
+    Fx = loads.Fx;
+    Fy = loads.Fy;
+    Fz = loads.Fz;
+    Mx = loads.My;
+    My = -loads.Mx;
+    Mz = loads.Mz;
+}
+
+
+// private method
+void Beam::loadVector(const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
+                      const Vector &Fx, const Vector &Fy, const Vector &Fz,
+                      const Vector &Mx, const Vector &My, const Vector &Mz, Vector &F) const{
+
+    using namespace BeamFEA;
+
+    Vector FFull(DOF*nodes);
+    loadVectorAssembly(nodes, z_node, Px, Py, Pz, FFull);
+    addPointLoads(nodes, FFull, Fx, Fy, Fz, Mx, My, Mz);
+
+    // tip loads (see addTipMassContribution)
+    int r = (nodes-1)*DOF;
+    FFull(r + 0) += tip.Fx;
+    FFull(r + 1) += tip.Mx;
+    FFull(r + 2) += tip.Fy;
+    FFull(r + 3) += tip.My;
+    FFull(r + 4) += tip.Fz;
+    FFull(r + 5) += tip.Mz;
+
+    // remove rigid directions (see applyBaseBoundaryCondition)
+    F.resize(length);
+    int j = 0;
+    for (int i = 0; i < DOF*nodes; i++) {
+        if (i >= DOF || !base.rigid[i]) {
+            F(j++) = FFull(i);
+        }
+    }
+}
+
+
 // x and y should be in same coordinate system as used in inputs EIxx, EIxy, etc.
 
 //void Beam::computeShearStressForThinShellSection(Vector &x, Vector &y, Vector &t, Vector &E, Vector &dEdz, double z, double shear_stress) const{
@@ -13,6 +13,7 @@
 #include "myMath.h"
 #include "Poly.h"
 #include "BeamFEA.h"
+#include <vector>
 
 /**
  pBEAM = Polynomial Beam Element Analysis Module
@@ -50,6 +51,7 @@ class Beam {
     int length;
     Matrix K, M, N, Nother;
     Vector F;
+    Eigen::LDLT<Matrix> Kfact;  // factorization of K, reused by every load case
 
 
 
@@ -221,6 +223,34 @@ public:
 
     // void computeShearStressForThinShellSections(Vector &x, Vector &y, Vector &z, Vector &E, Vector &sigma_axial) const;
 
+
+    /**
+     Solves a set of load cases with the stiffness matrix factored only once.  The loads
+     given at construction are ignored, tip loads are applied to every case.
+
+     In:
+     cases - applied loads of each case (see BeamFEA.h)
+
+     Out (size: ncase x nodes, in global coordinate system):
+     dx, dy, dz, dtheta_x, dtheta_y, dtheta_z - displacements at each node
+     Vx, Vy, Fz, Mx, My, Tz - shear forces, axial force, bending moments and torsion at each node
+
+     **/
+    void computeLoadCases(const std::vector<Loads> &cases,
+                          Matrix &dx, Matrix &dy, Matrix &dz, Matrix &dtheta_x, Matrix &dtheta_y, Matrix &dtheta_z,
+                          Matrix &Vx, Matrix &Vy, Matrix &Fz, Matrix &Mx, Matrix &My, Matrix &Tz) const;
+
+
+    /**
+     Computes the axial strain for a set of load cases (see computeAxialStrain).
+
+     Out:
+     epsilon_axial - axial strain of each case at each point.  size: ncase x npts
+
+     **/
+    void computeAxialStrainLoadCases(const std::vector<Loads> &cases, Vector &x, Vector &y, Vector &z,
+                                     Matrix &epsilon_axial) const;
+
 private:
 
     // translation of definitions
@@ -237,6 +267,25 @@ private:
 
     // estimating critical buckling loads
     double estimateCriticalBucklingLoad(double FzExisting, int ix1, int ix2) const;
+
+    // loads of one case in the FEA coordinate system
+    void translateLoads(const Loads &loads, PolyVec &Px, PolyVec &Py, PolyVec &Pz,
+                        Vector &Fx, Vector &Fy, Vector &Fz, Vector &Mx, Vector &My, Vector &Mz) const;
+
+    // force vector of one case, with the base b.c. applied
+    void loadVector(const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
+                    const Vector &Fx, const Vector &Fy, const Vector &Fz,
+                    const Vector &Mx, const Vector &My, const Vector &Mz, Vector &F) const;
+
+    // shear and bending for the given loads (FEA coordinate system)
+    void shearAndBending(const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
+                         const Vector &Fx, const Vector &Fy, const Vector &Fz,
+                         const Vector &Mx, const Vector &My, const Vector &Mz,
+                         PolyVec &Vx, PolyVec &Vy, PolyVec &Fz_out, PolyVec &Mx_out, PolyVec &My_out, PolyVec &Tz) const;
+
+    // axial strain from the axial force and bending moments
+    void axialStrain(const PolyVec &Fz, const PolyVec &Mx, const PolyVec &My,
+                     Vector &x, Vector &y, Vector &z, Vector &epsilon_axial) const;
 };
 
 
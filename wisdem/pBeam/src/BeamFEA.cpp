@@ -320,6 +320,52 @@ namespace BeamFEA {
 
 
 
+  // assembles the nodal force vector only (same as F of FEMAssembly)
+  void loadVectorAssembly(int nodes, const Vector &z,
+			  const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz, Vector &F){
+
+    F.setZero();
+
+    // integrate distributed axial loads
+    PolyVec FzFromPz;
+    integrateDistributedCompressionLoads(z, Pz, FzFromPz);
+
+    const int ns = 4; // number of bending shape functions
+    Vector FbendX(ns), FbendY(ns);
+
+    for (int i = 0; i < nodes-1; i++) {
+
+      double L = z[i+1] - z[i];
+
+      // bending shape functions (see beamMatrix)
+      Poly f[ns] = {
+		    Poly(4, 2.0, -3.0, 0.0, 1.0),
+		    Poly(4, 1.0*L, -2.0*L, 1.0*L, 0.0*L),
+		    Poly(4, -2.0, 3.0, 0.0, 0.0),
+		    Poly(4, 1.0*L, -1.0*L, 0.0*L, 0.0*L)
+      };
+
+      vectorAssembly(Px[i], ns, f, L, FbendX);
+      vectorAssembly(Py[i], ns, f, L, FbendY);
+
+      int r = i*DOF;
+      F(r + 0) += FbendX(0);
+      F(r + 1) += FbendX(1);
+      F(r + 6) += FbendX(2);
+      F(r + 7) += FbendX(3);
+      F(r + 2) += FbendY(0);
+      F(r + 3) += FbendY(1);
+      F(r + 8) += FbendY(2);
+      F(r + 9) += FbendY(3);
+      F(r + 4) += FzFromPz[i].eval(0.0);
+      F(r + 10) += FzFromPz[i].eval(1.0);
+    }
+
+  }
+
+
+
+
   // MARK: --------- BOUNDARY CONDITIONS ------------------
 
 
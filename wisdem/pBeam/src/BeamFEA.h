@@ -147,6 +147,24 @@ namespace BeamFEA {
                             const PolyVec &EA, const PolyVec &GJ, const PolyVec &rhoA, const PolyVec &rhoJ, 
                             const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
                             Matrix &K, Matrix &M, Matrix &Nother, Matrix &N, Vector &F);
+
+
+    /**
+     Assembles only the work-equivalent nodal force vector of the structure, i.e. the F
+     returned by FEMAssembly, without computing any of the matrices.  Used to solve
+     additional load cases against an already assembled stiffness matrix.
+
+     Arguments:
+     nodes - number of nodes at which data is supplied
+     z - axial location of each node
+     Px, Py, Pz - distributed loads in x, y, z-direction.  length: nodes-1
+
+     Returns:
+     F - work-equivalent nodal forces/moments.  length: DOF*nodes
+
+     **/
+    void loadVectorAssembly(int nodes, const Vector &z,
+                            const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz, Vector &F);
   
     
     
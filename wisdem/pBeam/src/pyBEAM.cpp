@@ -13,6 +13,7 @@
 #include "Beam.h"
 #include "CurveFEM.h"
 #include <iostream>
+#include <vector>
 
 namespace py = pybind11;
 
@@ -201,6 +202,49 @@ struct pyLoads {
 };
 
 
+// load cases stacked by row, each matrix is ncase x nodes
+struct pyLoadCases {
+
+  std::vector<Loads> cases;
+
+  pyLoadCases(int np, const Matrix &Px_np, const Matrix &Py_np, const Matrix &Pz_np){
+
+    Matrix zero = Matrix::Zero(Px_np.rows(), np);
+    setup(np, Px_np, Py_np, Pz_np, zero, zero, zero, zero, zero, zero);
+  }
+
+  pyLoadCases(int np, const Matrix &Px_np, const Matrix &Py_np, const Matrix &Pz_np,
+	      const Matrix &Fx_np, const Matrix &Fy_np, const Matrix &Fz_np,
+	      const Matrix &Mx_np, const Matrix &My_np, const Matrix &Mz_np){
+
+    setup(np, Px_np, Py_np, Pz_np, Fx_np, Fy_np, Fz_np, Mx_np, My_np, Mz_np);
+  }
+
+  void setup(int np, const Matrix &Px_np, const Matrix &Py_np, const Matrix &Pz_np,
+	     const Matrix &Fx_np, const Matrix &Fy_np, const Matrix &Fz_np,
+	     const Matrix &Mx_np, const Matrix &My_np, const Matrix &Mz_np){
+
+    int ncase = (int) Px_np.rows();
+    cases.resize(ncase);
+
+    for (int c = 0; c < ncase; c++) {
+      Loads &loads = cases[c];
+      loads.nodes = np;
+
+      loads.Px = Px_np.row(c);
+      loads.Py = Py_np.row(c);
+      loads.Pz = Pz_np.row(c);
+      loads.Fx = Fx_np.row(c);
+      loads.Fy = Fy_np.row(c);
+      loads.Fz = Fz_np.row(c);
+      loads.Mx = Mx_np.row(c);
+      loads.My = My_np.row(c);
+      loads.Mz = Mz_np.row(c);
+    }
+  }
+};
+
+
 struct pyPolynomialLoads {
 
   PolynomialLoads loads;
@@ -458,6 +502,48 @@ public:
     return py::make_tuple(Vx0, Vy0, Fz0, Mx0, My0, Tz0);
   }
 
+
+
+  /**
+     Displacements, shear and bending of several load cases, factoring the stiffness
+     matrix only once (in global coordinate system)
+
+     Arguments:
+     cases - LoadCases object
+
+     Return:
+     a tuple containing (x, y, z, theta_x, theta_y, theta_z, Vx, Vy, Fz, Mx, My, Tz).
+     each entry is a numpy array of size (ncase, nodes).
+
+  **/
+  py::tuple computeLoadCases(const py::object &cases_o){
+
+    pyLoadCases &cases = cases_o.cast<pyLoadCases&>();
+
+    Matrix dx, dy, dz, dtx, dty, dtz, Vx, Vy, Fz, Mx, My, Tz;
+    beam->computeLoadCases(cases.cases, dx, dy, dz, dtx, dty, dtz, Vx, Vy, Fz, Mx, My, Tz);
+
+    return py::make_tuple(dx, dy, dz, dtx, dty, dtz, Vx, Vy, Fz, Mx, My, Tz);
+  }
+
+
+  /**
+     Axial strain of several load cases (see axialStrain)
+
+     Return:
+     epsilon_axial - a numpy array of size (ncase, length)
+
+  **/
+  Matrix computeAxialStrainLoadCases(const py::object &cases_o, Vector &x_np, Vector &y_np, Vector &z_np){
+
+    pyLoadCases &cases = cases_o.cast<pyLoadCases&>();
+
+    Matrix epsilon_axial;
+    beam->computeAxialStrainLoadCases(cases.cases, x_np, y_np, z_np, epsilon_axial);
+
+    return epsilon_axial;
+  }
+
 };
 
 
@@ -528,6 +614,8 @@ PYBIND11_MODULE(_pBEAM, m)
     .def("axialStrain", &pyBEAM::computeAxialStrain)
     .def("outOfPlaneMomentOfInertia", &pyBEAM::computeOutOfPlaneMomentOfInertia)
     .def("shearAndBending", &pyBEAM::computeShearAndBending)
+    .def("loadCases", &pyBEAM::computeLoadCases)
+    .def("axialStrainLoadCases", &pyBEAM::computeAxialStrainLoadCases)
     ;
 
   py::class_<pyCurveFEM>(m, "CurveFEM")
@@ -564,6 +652,11 @@ PYBIND11_MODULE(_pBEAM, m)
     .def(py::init<int>())
     ;
 
+  py::class_<pyLoadCases>(m, "LoadCases")
+    .def(py::init<int, Matrix, Matrix, Matrix, Matrix, Matrix, Matrix, Matrix, Matrix, Matrix>())
+    .def(py::init<int, Matrix, Matrix, Matrix>())
+    ;
+
   py::class_<pyPolynomialLoads>(m, "PolyLoads")
     .def(py::init<int, Vector, Matrix, Matrix, Matrix, Vector, Vector, Vector, Vector, Vector, Vector>());
 }
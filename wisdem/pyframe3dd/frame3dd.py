@@ -10,7 +10,9 @@ Copyright (c) NREL. All rights reserved.
 from __future__ import print_function
 import numpy as np
 import math
-from ctypes import POINTER, c_int, c_double, Structure, pointer
+from scipy import sparse
+from scipy.sparse.linalg import eigsh
+from ctypes import POINTER, c_int, c_double, c_void_p, Structure, pointer
 from collections import namedtuple
 import os
 from distutils.sysconfig import get_config_var
@@ -337,6 +339,15 @@ class C_ModalResults(Structure):
                 ]
 
 
+class C_SparseMatrices(Structure):
+    _fields_ = [('nnz', c_int),
+                ('row', c_int_p),
+                ('col', c_int_p),
+                ('K', c_double_p),
+                ('M', c_double_p),
+                ]
+
+
 
 
 # inputs
@@ -366,12 +377,76 @@ class Frame(object):
     def __init__(self, nodes, reactions, elements, options):
         """docstring"""
 
-        self.nodes = nodes
-        self.reactions = reactions
-        self.elements = elements
+        # convert to C int size (not longs) and copy to prevent releasing (b/c address space is shared by c)
+        self.__setNodes(nodes)
+        self.__setReactions(reactions)
+        self.__setElements(elements)
+
         self.options = options
 
-        # convert to C int size (not longs) and copy to prevent releasing (b/c address space is shared by c)
+        # options
+        exagg_static = 1.0  # not used
+        self.c_other = C_OtherElementData(options.shear, options.geom, exagg_static, options.dx)
+
+        # leave off dynamics by default
+        self.nM = 0              # number of desired dynamic modes of vibration (below only necessary if nM > 0)
+        self.Mmethod = 1         # 1: subspace Jacobi     2: Stodola     3: sparse shift-invert Lanczos
+                                 #    (3 still assembles dense [K] and [M] in the C code)
+        self.lump = 0            # 0: consistent mass ... 1: lumped mass matrix
+        self.tol = 1e-9          # mode shape tolerance
+        self.shift = 0.0         # shift value ... for unrestrained structures
+
+        # create list for load cases
+        self.loadCases = []
+
+        # initialize extra mass data
+        i = np.array([], dtype=np.int32)
+        d = np.array([])
+        self.changeExtraNodeMass(i, d, d, d, d, d, d, d, d, d, d, False)
+        self.changeExtraElementMass(i, d, False)
+        self.changeCondensationData(0, i, d, d, d, d, d, d, i)
+
+
+        # load c module
+        mydir = os.path.dirname(os.path.realpath(__file__))  # get path to this file
+        try:
+            self._frame3dd = np.ctypeslib.load_library(libname, mydir)
+        except:
+            mydir = os.path.abspath(os.path.dirname(mydir))
+            self._frame3dd = np.ctypeslib.load_library(libname, mydir)
+
+        args = [POINTER(C_Nodes), POINTER(C_Reactions), POINTER(C_Elements),
+            POINTER(C_OtherElementData), c_int, POINTER(C_LoadCase),
+            POINTER(C_DynamicData), POINTER(C_ExtraInertia), POINTER(C_ExtraMass),
+            POINTER(C_Condensation),
+            POINTER(C_Displacements), POINTER(C_Forces), POINTER(C_ReactionForces),
+            POINTER(POINTER(C_InternalForces)), POINTER(C_MassResults), POINTER(C_ModalResults)]
+
+        self._frame3dd.run.argtypes = args
+        self._frame3dd.run.restype = c_int
+
+        # the factored stiffness matrix is kept in C memory between runs, and only
+        # assembled and factored again when the nodes, reactions or elements change
+        self._frame3dd.run_state.argtypes = [c_void_p] + args + [POINTER(C_SparseMatrices)]
+        self._frame3dd.run_state.restype = c_int
+        self._frame3dd.new_state.restype = c_void_p
+        self._frame3dd.free_state.argtypes = [c_void_p]
+        self._state = self._frame3dd.new_state()
+
+        # output arrays and their c structs, reused while the sizes do not change
+        self._workspace = None
+
+
+    def __del__(self):
+
+        if getattr(self, '_state', None) is not None:
+            self._frame3dd.free_state(self._state)
+            self._state = None
+
+
+    def __setNodes(self, nodes):
+
+        self.nodes = nodes
 
         # nodes
         self.nnode = nodes.node.astype(np.int32)
@@ -380,6 +455,14 @@ class Frame(object):
         self.nz = np.copy(nodes.z)
         self.nr = np.copy(nodes.r)
 
+        self.c_nodes = C_Nodes(len(self.nnode), ip(self.nnode), dp(self.nx),
+            dp(self.ny), dp(self.nz), dp(self.nr))
+
+
+    def __setReactions(self, reactions):
+
+        self.reactions = reactions
+
         # reactions
         self.rnode = reactions.node.astype(np.int32)
         self.rKx = reactions.Kx.astype(np.float64)  # convert rather than copy to allow old syntax of integers
@@ -389,6 +472,15 @@ class Frame(object):
         self.rKty = reactions.Kty.astype(np.float64)
         self.rKtz = reactions.Ktz.astype(np.float64)
 
+        self.c_reactions = C_Reactions(len(self.rnode), ip(self.rnode),
+            dp(self.rKx), dp(self.rKy), dp(self.rKz),
+            dp(self.rKtx), dp(self.rKty), dp(self.rKtz), reactions.rigid)
+
+
+    def __setElements(self, elements):
+
+        self.elements = elements
+
         # elements
         self.eelement = elements.element.astype(np.int32)
         self.eN1 = elements.N1.astype(np.int32)
@@ -404,63 +496,51 @@ class Frame(object):
         self.eroll = np.copy(elements.roll)
         self.edensity = np.copy(elements.density)
 
+        self.c_elements = C_Elements(len(self.eelement), ip(self.eelement),
+            ip(self.eN1), ip(self.eN2), dp(self.eAx), dp(self.eAsy),
+            dp(self.eAsz), dp(self.eJx), dp(self.eIy), dp(self.eIz),
+            dp(self.eE), dp(self.eG), dp(self.eroll), dp(self.edensity))
+
         # Compute length of elements
         self.eL = np.sqrt( (self.nx[self.eN2-1]-self.nx[self.eN1-1])**2.0 +
                            (self.ny[self.eN2-1]-self.ny[self.eN1-1])**2.0 +
                            (self.nz[self.eN2-1]-self.nz[self.eN1-1])**2.0 )
-            
-        # create c objects
-        self.c_nodes = C_Nodes(len(self.nnode), ip(self.nnode), dp(self.nx),
-            dp(self.ny), dp(self.nz), dp(self.nr))
 
-        self.c_reactions = C_Reactions(len(self.rnode), ip(self.rnode),
-            dp(self.rKx), dp(self.rKy), dp(self.rKz),
-            dp(self.rKtx), dp(self.rKty), dp(self.rKtz), reactions.rigid)
 
-        self.c_elements = C_Elements(len(self.eelement), ip(self.eelement),
-            ip(self.eN1), ip(self.eN2), dp(self.eAx), dp(self.eAsy),
-            dp(self.eAsz), dp(self.eJx), dp(self.eIy), dp(self.eIz),
-            dp(self.eE), dp(self.eG), dp(self.eroll), dp(self.edensity))
+    def sameTopology(self, nodes, reactions, elements, options):
+        """True if the frame has the same node, reaction and element numbering,
+        connectivity and options, so the change methods below can be used
+        instead of creating a new Frame"""
 
+        return (np.array_equal(nodes.node, self.nodes.node) and
+                np.array_equal(reactions.node, self.reactions.node) and
+                np.array_equal(elements.element, self.elements.element) and
+                np.array_equal(elements.N1, self.elements.N1) and
+                np.array_equal(elements.N2, self.elements.N2) and
+                tuple(options) == tuple(self.options))
 
-        # options
-        exagg_static = 1.0  # not used
-        self.c_other = C_OtherElementData(options.shear, options.geom, exagg_static, options.dx)
 
-        # leave off dynamics by default
-        self.nM = 0              # number of desired dynamic modes of vibration (below only necessary if nM > 0)
-        self.Mmethod = 1         # 1: subspace Jacobi     2: Stodola
-        self.lump = 0            # 0: consistent mass ... 1: lumped mass matrix
-        self.tol = 1e-9          # mode shape tolerance
-        self.shift = 0.0         # shift value ... for unrestrained structures
+    def changeNodeData(self, nodes):
 
-        # create list for load cases
-        self.loadCases = []
+        if not np.array_equal(nodes.node, self.nodes.node):
+            raise ValueError('the node numbering of a Frame cannot be changed')
+        self.__setNodes(nodes)
+        self.__setElements(self.elements)  # element lengths
 
-        # initialize extra mass data
-        i = np.array([], dtype=np.int32)
-        d = np.array([])
-        self.changeExtraNodeMass(i, d, d, d, d, d, d, d, d, d, d, False)
-        self.changeExtraElementMass(i, d, False)
-        self.changeCondensationData(0, i, d, d, d, d, d, d, i)
 
+    def changeReactionData(self, reactions):
 
-        # load c module
-        mydir = os.path.dirname(os.path.realpath(__file__))  # get path to this file
-        try:
-            self._frame3dd = np.ctypeslib.load_library(libname, mydir)
-        except:
-            mydir = os.path.abspath(os.path.dirname(mydir))
-            self._frame3dd = np.ctypeslib.load_library(libname, mydir)
+        if not np.array_equal(reactions.node, self.reactions.node):
+            raise ValueError('the reaction nodes of a Frame cannot be changed')
+        self.__setReactions(reactions)
 
-        self._frame3dd.run.argtypes = [POINTER(C_Nodes), POINTER(C_Reactions), POINTER(C_Elements),
-            POINTER(C_OtherElementData), c_int, POINTER(C_LoadCase),
-            POINTER(C_DynamicData), POINTER(C_ExtraInertia), POINTER(C_ExtraMass),
-            POINTER(C_Condensation),
-            POINTER(C_Displacements), POINTER(C_Forces), POINTER(C_ReactionForces),
-            POINTER(POINTER(C_InternalForces)), POINTER(C_MassResults), POINTER(C_ModalResults)]
 
-        self._frame3dd.run.restype = c_int
+    def changeElementData(self, elements):
+
+        if not (np.array_equal(elements.element, self.elements.element) and
+                np.array_equal(elements.N1, self.elements.N1) and np.array_equal(elements.N2, self.elements.N2)):
+            raise ValueError('the element numbering and connectivity of a Frame cannot be changed')
+        self.__setElements(elements)
 
 
 
@@ -469,6 +549,11 @@ class Frame(object):
         self.loadCases.append(loadCase)
 
 
+    def clearLoadCases(self):
+
+        self.loadCases = []
+
+
     def changeExtraNodeMass(self, node, mass, Ixx, Iyy, Izz, Ixy, Ixz, Iyz, rhox, rhoy, rhoz, addGravityLoad):
 
         self.ENMnode = node.astype(np.int32)
@@ -518,6 +603,10 @@ class Frame(object):
 
 
     def enableDynamics(self, nM, Mmethod, lump, tol, shift):
+        """Mmethod 3 solves for the modes with sparse shift-invert Lanczos
+        iterations in python.  The C code still assembles the dense DoF x DoF
+        [K] and [M] and scans them in O(DoF^2) to export their non-zeros, so
+        only the eigensolve scales with the number of non-zeros."""
 
         self.nM = nM
         self.Mmethod = Mmethod
@@ -663,35 +752,18 @@ class Frame(object):
 
 
         # initialize output arrays
+        ws = self.__workspace(nCases, nN, nE, nR)
+        dout, fout, rout = ws['dout'], ws['fout'], ws['rout']
+        for a in list(dout) + list(fout) + list(rout) + [ws['ifout']]:
+            a.fill(0)
 
-        dout = NodeDisplacements(np.zeros((nCases, nN), dtype=np.int32),
-            np.zeros((nCases, nN)), np.zeros((nCases, nN)), np.zeros((nCases, nN)),
-            np.zeros((nCases, nN)), np.zeros((nCases, nN)), np.zeros((nCases, nN))
-        )
-        fout = ElementEndForces(np.zeros((nCases, 2*nE), dtype=np.int32),
-            np.zeros((nCases, 2*nE), dtype=np.int32),
-            np.zeros((nCases, 2*nE)), np.zeros((nCases, 2*nE)), np.zeros((nCases, 2*nE)),
-            np.zeros((nCases, 2*nE)), np.zeros((nCases, 2*nE)), np.zeros((nCases, 2*nE))
-        )
-        rout = NodeReactions(np.zeros((nCases, nR), dtype=np.int32),
-            np.zeros((nCases, nR)), np.zeros((nCases, nR)), np.zeros((nCases, nR)),
-            np.zeros((nCases, nR)), np.zeros((nCases, nR)), np.zeros((nCases, nR))
-        )
-
-        dx = self.options.dx
-
-        ifout = [0]*nE
-        for i in range(nE):
-            L = self.eL[i]
-
-            nIF = int(max(math.floor(L/dx), 1)) + 1
-
-            ifout[i] = InternalForces(np.zeros((nCases, nIF)), np.zeros((nCases, nIF)),
-                np.zeros((nCases, nIF)), np.zeros((nCases, nIF)), np.zeros((nCases, nIF)),
-                np.zeros((nCases, nIF)), np.zeros((nCases, nIF)), np.zeros((nCases, nIF)),
-                np.zeros((nCases, nIF)), np.zeros((nCases, nIF)), np.zeros((nCases, nIF))
-            )
+        # create c structs
 
+        c_loadcases = (C_LoadCase * nCases)()
+        for i in range(nCases):
+            lci = self.loadCases[i]
+            c_loadcases[i] = C_LoadCase(lci.gx, lci.gy, lci.gz, lci.pL,
+                lci.uL, lci.tL, lci.eL, lci.tempL, lci.pD)
 
         mout = NodeMasses(0.0, 0.0, np.zeros(nN, dtype=np.int32),
             np.zeros(nN), np.zeros(nN), np.zeros(nN),
@@ -703,38 +775,6 @@ class Frame(object):
             np.zeros((nM, nN))
         )
 
-
-
-        # create c structs
-
-        c_loadcases = (C_LoadCase * nCases)()
-        c_disp = (C_Displacements * nCases)()
-        c_forces = (C_Forces * nCases)()
-        c_reactions = (C_ReactionForces * nCases)()
-        c_internalForces = (POINTER(C_InternalForces) * nCases)()
-
-
-        for i in range(nCases):
-            lci = self.loadCases[i]
-            c_loadcases[i] = C_LoadCase(lci.gx, lci.gy, lci.gz, lci.pL,
-                lci.uL, lci.tL, lci.eL, lci.tempL, lci.pD)
-            c_disp[i] = C_Displacements(ip(dout.node[i, :]),
-                dp(dout.dx[i, :]), dp(dout.dy[i, :]), dp(dout.dz[i, :]),
-                dp(dout.dxrot[i, :]), dp(dout.dyrot[i, :]), dp(dout.dzrot[i, :]))
-            c_forces[i] = C_Forces(ip(fout.element[i, :]), ip(fout.node[i, :]),
-                dp(fout.Nx[i, :]), dp(fout.Vy[i, :]), dp(fout.Vz[i, :]),
-                dp(fout.Txx[i, :]), dp(fout.Myy[i, :]), dp(fout.Mzz[i, :]))
-            c_reactions[i] = C_ReactionForces(ip(rout.node[i, :]),
-                dp(rout.Fx[i, :]), dp(rout.Fy[i, :]), dp(rout.Fz[i, :]),
-                dp(rout.Mxx[i, :]), dp(rout.Myy[i, :]), dp(rout.Mzz[i, :]))
-
-            c_internalForces[i] = (C_InternalForces * nE)()
-            for j in range(nE):
-                (c_internalForces[i])[j] = C_InternalForces(dp(ifout[j].x[i, :]), dp(ifout[j].Nx[i, :]),
-                    dp(ifout[j].Vy[i, :]), dp(ifout[j].Vz[i, :]), dp(ifout[j].Tx[i, :]),
-                    dp(ifout[j].My[i, :]), dp(ifout[j].Mz[i, :]), dp(ifout[j].Dx[i, :]),
-                    dp(ifout[j].Dy[i, :]), dp(ifout[j].Dz[i, :]), dp(ifout[j].Rx[i, :]))
-
         total_mass = c_double()
         struct_mass = c_double()
 
@@ -767,10 +807,31 @@ class Frame(object):
         exagg_modal = 1.0  # not used
         c_dynamicData = C_DynamicData(self.nM, self.Mmethod, self.lump, self.tol, self.shift, exagg_modal)
 
-        exitCode = self._frame3dd.run(self.c_nodes, self.c_reactions, self.c_elements, self.c_other,
-                                      nCases, c_loadcases, c_dynamicData, self.c_extraInertia,
-                                      self.c_extraMass, self.c_condensation,
-                                      c_disp, c_forces, c_reactions, c_internalForces, c_massResults, c_modalResults)
+        # sparse [K] and [M] returned instead of the modes, at most the upper
+        # triangles of the element and node blocks are non-zero.  The C side
+        # still assembles the dense DoF x DoF [K] and [M] and scans them in
+        # O(DoF^2) to export the triplets, only the eigensolve is sparse.
+        nnz = 78*nE + 21*nN if nM > 0 and self.Mmethod == 3 else 0
+        for attempt in range(2):
+            if nnz > 0:
+                matrices = (np.zeros(nnz, dtype=np.int32), np.zeros(nnz, dtype=np.int32), np.zeros(nnz), np.zeros(nnz))
+                c_matrices = C_SparseMatrices(nnz, ip(matrices[0]), ip(matrices[1]), dp(matrices[2]), dp(matrices[3]))
+            else:
+                c_matrices = None
+
+            exitCode = self._frame3dd.run_state(self._state, self.c_nodes, self.c_reactions, self.c_elements, self.c_other,
+                                          nCases, c_loadcases, c_dynamicData, self.c_extraInertia,
+                                          self.c_extraMass, self.c_condensation,
+                                          ws['c_disp'], ws['c_forces'], ws['c_reactions'], ws['c_internalForces'],
+                                          c_massResults, c_modalResults, c_matrices)
+
+            # on overflow the C side returns the number of entries needed,
+            # run once more with that capacity (the factored [K] is reused)
+            if c_matrices is None or c_matrices.nnz <= nnz or attempt > 0:
+                break
+            nnz = c_matrices.nnz
+            for a in list(dout) + list(fout) + list(rout) + [ws['ifout']]:
+                a.fill(0)
 
         nantest = np.isnan( np.c_[fout.Nx, fout.Vy, fout.Vz, fout.Txx, fout.Myy, fout.Mzz] )
         if (exitCode == 182 or exitCode == 183) and not np.any(nantest):
@@ -778,21 +839,123 @@ class Frame(object):
         elif exitCode != 0 or np.any(nantest):
             raise RuntimeError('Frame3DD did not exit gracefully')
 
+        # copy the results out of the workspace
+        dout = NodeDisplacements(*[np.copy(a) for a in dout])
+        fout = ElementEndForces(*[np.copy(a) for a in fout])
+        rout = NodeReactions(*[np.copy(a) for a in rout])
+        ifbuf = np.copy(ws['ifout'])
+        ifout = [InternalForces(*ifbuf[:, :, i0:i1]) for i0, i1 in ws['ifslice']]
+
         # put mass values back in since tuple is read only
         mout = NodeMasses(total_mass.value, struct_mass.value, mout.node,
             mout.xmass, mout.ymass, mout.zmass,
             mout.xinrta, mout.yinrta, mout.zinrta)
         
         # put modal results back in
-        for i in range(nM):
-            modalout.freq[i] = freq[i].value
-            modalout.xmpf[i] = xmpf[i].value
-            modalout.ympf[i] = ympf[i].value
-            modalout.zmpf[i] = zmpf[i].value
+        if c_matrices is not None:
+            self.__sparseModes(modalout, [a[:c_matrices.nnz] for a in matrices], nN)
+        else:
+            for i in range(nM):
+                modalout.freq[i] = freq[i].value
+                modalout.xmpf[i] = xmpf[i].value
+                modalout.ympf[i] = ympf[i].value
+                modalout.zmpf[i] = zmpf[i].value
 
         return dout, fout, rout, ifout, mout, modalout
 
 
+    def __sparseModes(self, modalout, matrices, nN):
+        # lowest modes of the dynamic [K] and [M] by shift-invert Lanczos
+        # iterations, with the same normalization and participation factors
+        # as the subspace and Stodola methods
+
+        DoF = 6*nN
+        nM = min(self.nM, DoF-1)
+        row, col, Kv, Mv = matrices
+
+        # full symmetric matrices from the upper triangles
+        off = row != col
+        row, col = np.r_[row, col[off]], np.r_[col, row[off]]
+        K = sparse.csc_matrix((np.r_[Kv, Kv[off]], (row, col)), shape=(DoF, DoF))
+        M = sparse.csc_matrix((np.r_[Mv, Mv[off]], (row, col)), shape=(DoF, DoF))
+
+        # shifted by -shift like Frame3DD, for structures with rigid body modes
+        w, V = eigsh(K, k=nM, M=M, sigma=-self.shift, which='LM', tol=self.tol, v0=np.ones(DoF))
+        isort = np.argsort(np.abs(w))
+        w, V = np.abs(w[isort]), V[:, isort]
+        V /= np.sqrt(np.sum(V * (M @ V), axis=0))
+
+        # mass of each degree of freedom moving with a unit translation
+        ms = [M @ (np.arange(DoF) % 6 == k) for k in range(3)]
+
+        modalout.freq[:nM] = np.sqrt(w) / (2*np.pi)
+        modalout.xmpf[:nM] = ms[0] @ V
+        modalout.ympf[:nM] = ms[1] @ V
+        modalout.zmpf[:nM] = ms[2] @ V
+        modalout.node[:nM, :] = np.arange(1, nN+1)
+        for k, field in enumerate(['xdsp', 'ydsp', 'zdsp', 'xrot', 'yrot', 'zrot']):
+            getattr(modalout, field)[:nM, :] = V[k::6, :].T
+
+
+
+    def __workspace(self, nCases, nN, nE, nR):
+        # static output arrays and the c structs pointing to them, rebuilt
+        # only when the number of cases, nodes, elements or output points changes
+
+        dx = self.options.dx
+        nIF = [int(max(math.floor(L/dx), 1)) + 1 for L in self.eL]
+
+        key = (nCases, nN, nE, nR, tuple(nIF))
+        if self._workspace is not None and self._workspace['key'] == key:
+            return self._workspace
+
+        dout = NodeDisplacements(np.zeros((nCases, nN), dtype=np.int32),
+            np.zeros((nCases, nN)), np.zeros((nCases, nN)), np.zeros((nCases, nN)),
+            np.zeros((nCases, nN)), np.zeros((nCases, nN)), np.zeros((nCases, nN))
+        )
+        fout = ElementEndForces(np.zeros((nCases, 2*nE), dtype=np.int32),
+            np.zeros((nCases, 2*nE), dtype=np.int32),
+            np.zeros((nCases, 2*nE)), np.zeros((nCases, 2*nE)), np.zeros((nCases, 2*nE)),
+            np.zeros((nCases, 2*nE)), np.zeros((nCases, 2*nE)), np.zeros((nCases, 2*nE))
+        )
+        rout = NodeReactions(np.zeros((nCases, nR), dtype=np.int32),
+            np.zeros((nCases, nR)), np.zeros((nCases, nR)), np.zeros((nCases, nR)),
+            np.zeros((nCases, nR)), np.zeros((nCases, nR)), np.zeros((nCases, nR))
+        )
+
+        # internal forces of all elements in one block, (field, case, output point)
+        ioff = np.r_[0, np.cumsum(nIF)]
+        ifslice = list(zip(ioff[:-1], ioff[1:]))
+        ifbuf = np.zeros((len(InternalForces._fields), nCases, ioff[-1]))
+        ifout = [InternalForces(*ifbuf[:, :, i0:i1]) for i0, i1 in ifslice]
+
+        c_disp = (C_Displacements * nCases)()
+        c_forces = (C_Forces * nCases)()
+        c_reactions = (C_ReactionForces * nCases)()
+        c_internalForces = (POINTER(C_InternalForces) * nCases)()
+
+        for i in range(nCases):
+            c_disp[i] = C_Displacements(ip(dout.node[i, :]),
+                dp(dout.dx[i, :]), dp(dout.dy[i, :]), dp(dout.dz[i, :]),
+                dp(dout.dxrot[i, :]), dp(dout.dyrot[i, :]), dp(dout.dzrot[i, :]))
+            c_forces[i] = C_Forces(ip(fout.element[i, :]), ip(fout.node[i, :]),
+                dp(fout.Nx[i, :]), dp(fout.Vy[i, :]), dp(fout.Vz[i, :]),
+                dp(fout.Txx[i, :]), dp(fout.Myy[i, :]), dp(fout.Mzz[i, :]))
+            c_reactions[i] = C_ReactionForces(ip(rout.node[i, :]),
+                dp(rout.Fx[i, :]), dp(rout.Fy[i, :]), dp(rout.Fz[i, :]),
+                dp(rout.Mxx[i, :]), dp(rout.Myy[i, :]), dp(rout.Mzz[i, :]))
+
+            c_internalForces[i] = (C_InternalForces * nE)()
+            for j in range(nE):
+                (c_internalForces[i])[j] = C_InternalForces(dp(ifout[j].x[i, :]), dp(ifout[j].Nx[i, :]),
+                    dp(ifout[j].Vy[i, :]), dp(ifout[j].Vz[i, :]), dp(ifout[j].Tx[i, :]),
+                    dp(ifout[j].My[i, :]), dp(ifout[j].Mz[i, :]), dp(ifout[j].Dx[i, :]),
+                    dp(ifout[j].Dy[i, :]), dp(ifout[j].Dz[i, :]), dp(ifout[j].Rx[i, :]))
+
+        self._workspace = dict(key=key, dout=dout, fout=fout, rout=rout, ifout=ifbuf, ifslice=ifslice,
+            c_disp=c_disp, c_forces=c_forces, c_reactions=c_reactions, c_internalForces=c_internalForces)
+        return self._workspace
+
 
     def write(self, fname):
         f = open(fname, 'w')
@@ -886,7 +1049,8 @@ class Frame(object):
         f.write('\n')
         f.write('\n')
         f.write(str(self.nM)+'    # number of desired dynamic modes of vibration\n')
-        f.write(str(self.Mmethod)+'    # 1: subspace Jacobi     2: Stodola\n')
+        # the sparse method is only available through run, Frame3DD input files use subspace Jacobi
+        f.write(str(1 if self.Mmethod == 3 else self.Mmethod)+'    # 1: subspace Jacobi     2: Stodola\n')
         f.write(str(self.lump)+'    # 0: consistent mass ... 1: lumped mass matrix\n')
         f.write(str(self.tol)+' # mode shape tolerance\n')
         f.write(str(self.shift)+'  # shift value ... for unrestrained structures\n')
@@ -368,13 +368,28 @@ void solve_system(
 ){
 	double	*diag;		/* diagonal vector of the L D L' decomp. */
 
-	verbose = 0;		/* suppress verbose output		*/
-
 	diag = dvector ( 1, DoF );
 
+	solve_system_ldl ( K, diag, D, F, R, DoF, q, r, 1, ok, verbose, rms_resid );
+
+	free_dvector( diag, 1, DoF );
+}
+
+
+/*
+ * SOLVE_SYSTEM_LDL  -  solve {F} =   [K]{D} via L D L' decomposition
+ * with reduce = 0, [K] and diag already hold the L D L' factors and ok the
+ * number of negative terms on the diagonal returned by the decomposition
+ */
+void solve_system_ldl(
+	double **K, double *diag, double *D, double *F, double *R, int DoF, int *q, int *r,
+	int reduce, int *ok, int verbose, double *rms_resid
+){
+	verbose = 0;		/* suppress verbose output		*/
+
 	/*  L D L' decomposition of K[q,q] into lower triangle of K[q,q] and diag[q] */
 	/*  vectors F and D are unchanged */
-	ldl_dcmp_pm ( K, DoF, diag, F, D, R, q,r, 1, 0, ok );
+	if ( reduce ) ldl_dcmp_pm ( K, DoF, diag, F, D, R, q,r, 1, 0, ok );
 	if ( *ok < 0 ) {
 	  //fprintf(stderr," Make sure that all six");
 	  //fprintf(stderr," rigid body translations are restrained!\n");
@@ -389,8 +404,6 @@ void solve_system(
 		} while ( *ok );
 	        if ( verbose ) fprintf(stdout,"\n");
 	}
-	
-	free_dvector( diag, 1, DoF );
 }
 
 
@@ -72,6 +72,24 @@ void solve_system(
 );
 
 
+/** solve {F} =   [K]{D} with the L D L' factors of [K] in K and diag,
+ * the decomposition is computed first if reduce is 1 */
+void solve_system_ldl(
+	double **K,	/**< stiffness matrix, L D L' factors in the lower triangle */
+	double *diag,	/**< diagonal of D in the L D L' decomposition	*/
+	double *D,	/**< displacement vector to be solved		*/
+	double *F,	/**< external load vector			*/
+	double *R,	/**< reaction vector				*/
+	int DoF,	/**< number of degrees of freedom		*/
+	int *q,		/**< 1: not a reaction; 0: a reaction coordinate */
+	int *r,		/**< 0: not a reaction; 1: a reaction coordinate */
+	int reduce,	/**< 1: decompose [K]; 0: K and diag are already factored */
+	int *ok,	/**< indicates positive definite stiffness matrix */
+	int verbose,	/**< 1: copious screen output; 0: none		*/
+	double *rms_resid /**< the RMS error of the solution residual */
+);
+
+
 /*
  * COMPUTE_REACTION_FORCES : R(r) = [K(r,q)]*{D(q)} + [K(r,r)]*{D(r)} - F(r)
  * reaction forces satisfy equilibrium in the solved system
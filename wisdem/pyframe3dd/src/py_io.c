@@ -961,6 +961,7 @@ int read_mass_data (
     dots(stdout,30);    fprintf(stdout," %3d ",*Mmethod);
     if ( *Mmethod == 1 ) fprintf(stdout," (Subspace-Jacobi)\n");
     if ( *Mmethod == 2 ) fprintf(stdout," (Stodola)\n");
+    if ( *Mmethod == 3 ) fprintf(stdout," (sparse matrices, solved by the caller)\n");
   }
 
   *lump = dynamic->lump;
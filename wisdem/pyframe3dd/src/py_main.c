@@ -73,6 +73,130 @@
 void init_pyframe3dd() { }
 void PyInit__pyframe3dd() { }
 
+/*
+ * State kept between runs of the same frame: the factored linear stiffness
+ * matrix is reused as long as the inputs it depends on are unchanged.
+ */
+ALLOW_DLL_CALL FrameState* new_state() {
+  FrameState *state = (FrameState *)malloc(sizeof(FrameState));
+  state->DoF = 0;
+  state->nS = 0;
+  state->S = NULL;
+  state->K = NULL;
+  state->diag = NULL;
+  state->ok = 0;
+  return state;
+}
+
+static void clear_state(FrameState *state) {
+  if ( state->DoF > 0 ) {
+    free_dmatrix(state->K, 1, state->DoF, 1, state->DoF);
+    free_dvector(state->diag, 1, state->DoF);
+  }
+  free(state->S);
+  state->DoF = state->nS = 0;
+  state->S = NULL;
+}
+
+ALLOW_DLL_CALL void free_state(FrameState *state) {
+  if ( state == NULL ) return;
+  clear_state(state);
+  free(state);
+}
+
+static void pack(char *S, int *pos, void *x, int n) {
+  memcpy(S + *pos, x, n);
+  *pos += n;
+}
+
+/*
+ * EXPORT_SPARSE - the non-zero entries of the upper triangles of [K] and [M]
+ * as (row, col, K, M) triplets, returns 1 if they do not fit in matrices
+ */
+static int export_sparse( double **K, double **M, int DoF, SparseMatrices *matrices ) {
+  int i, j, n = 0;
+
+  for (i=1; i<=DoF; i++)
+    for (j=i; j<=DoF; j++)
+      if ( K[i][j] != 0.0 || M[i][j] != 0.0 ) n++;
+
+  if ( matrices == NULL || n > matrices->nnz ) {
+    if ( matrices != NULL ) matrices->nnz = n;
+    return 1;
+  }
+
+  n = 0;
+  for (i=1; i<=DoF; i++)
+    for (j=i; j<=DoF; j++)
+      if ( K[i][j] != 0.0 || M[i][j] != 0.0 ) {
+	matrices->row[n] = i-1;
+	matrices->col[n] = j-1;
+	matrices->K[n] = K[i][j];
+	matrices->M[n] = M[i][j];
+	n++;
+      }
+  matrices->nnz = n;
+  return 0;
+}
+
+/*
+ * STIFFNESS_SIGNATURE - all of the inputs of assemble_K for a linear analysis
+ * and of the reaction coordinates, as one block of bytes.  Mass and
+ * condensation data are not part of it: they only enter the modal analysis
+ * and the condensation of [K] and [M] after the static solve, and the stored
+ * factored [K] is the same as the one the static solve would compute.
+ */
+static char* stiffness_signature( int *nS, int nN, int nE, int DoF,
+				  vec3 *xyz, float *rj, double *L, double *Le, int *N1, int *N2,
+				  float *Ax, float *Asy, float *Asz, float *Jx, float *Iy, float *Iz,
+				  float *E, float *G, float *p, int shear, int *q, int *r,
+				  float *EKx, float *EKy, float *EKz, float *EKtx, float *EKty, float *EKtz ) {
+  char *S;
+  int pos = 0;
+
+  *nS = 3*sizeof(int) + nN*(sizeof(vec3) + 7*sizeof(float))
+    + nE*(2*sizeof(double) + 2*sizeof(int) + 9*sizeof(float)) + 2*DoF*sizeof(int);
+  S = (char *)malloc(*nS);
+
+  pack(S, &pos, &nN, sizeof(int));
+  pack(S, &pos, &nE, sizeof(int));
+  pack(S, &pos, &shear, sizeof(int));
+  pack(S, &pos, xyz+1, nN*sizeof(vec3));
+  pack(S, &pos, rj+1, nN*sizeof(float));
+  pack(S, &pos, EKx+1, nN*sizeof(float));
+  pack(S, &pos, EKy+1, nN*sizeof(float));
+  pack(S, &pos, EKz+1, nN*sizeof(float));
+  pack(S, &pos, EKtx+1, nN*sizeof(float));
+  pack(S, &pos, EKty+1, nN*sizeof(float));
+  pack(S, &pos, EKtz+1, nN*sizeof(float));
+  pack(S, &pos, L+1, nE*sizeof(double));
+  pack(S, &pos, Le+1, nE*sizeof(double));
+  pack(S, &pos, N1+1, nE*sizeof(int));
+  pack(S, &pos, N2+1, nE*sizeof(int));
+  pack(S, &pos, Ax+1, nE*sizeof(float));
+  pack(S, &pos, Asy+1, nE*sizeof(float));
+  pack(S, &pos, Asz+1, nE*sizeof(float));
+  pack(S, &pos, Jx+1, nE*sizeof(float));
+  pack(S, &pos, Iy+1, nE*sizeof(float));
+  pack(S, &pos, Iz+1, nE*sizeof(float));
+  pack(S, &pos, E+1, nE*sizeof(float));
+  pack(S, &pos, G+1, nE*sizeof(float));
+  pack(S, &pos, p+1, nE*sizeof(float));
+  pack(S, &pos, q+1, DoF*sizeof(int));
+  pack(S, &pos, r+1, DoF*sizeof(int));
+
+  return S;
+}
+
+
+ALLOW_DLL_CALL int run_state(FrameState *state, Nodes* nodes, Reactions* reactions, Elements* elements,
+		       OtherElementData* other, int nL, LoadCase* loadcases,
+		       DynamicData *dynamic, ExtraInertia *extraInertia, ExtraMass *extraMass,
+		       Condensation *condensation,
+		       Displacements* displacements, Forces* forces, ReactionForces* reactionForces,
+		       InternalForces** internalForces, MassResults *massResults, ModalResults *modalResults,
+		       SparseMatrices *matrices);
+
 ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 		       OtherElementData* other, int nL, LoadCase* loadcases,
 		       DynamicData *dynamic, ExtraInertia *extraInertia, ExtraMass *extraMass,
@@ -80,6 +204,28 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 		       Displacements* displacements, Forces* forces, ReactionForces* reactionForces,
 		       InternalForces** internalForces, MassResults *massResults, ModalResults *modalResults){
 
+  return run_state(NULL, nodes, reactions, elements, other, nL, loadcases,
+		   dynamic, extraInertia, extraMass, condensation,
+		   displacements, forces, reactionForces, internalForces, massResults, modalResults, NULL);
+}
+
+
+/*
+ * RUN_STATE - run with the state of previous runs of the same frame, or
+ * without if state is NULL.  For linear analyses (no geometric stiffness)
+ * [K] is assembled and factored once for all load cases, and reused from
+ * state when its inputs are the same as in the run that stored it.
+ * With Mmethod 3 the modes are not computed, the upper triangles of the
+ * dynamic [K] and [M] are returned in matrices for an external eigen-solver.
+ */
+ALLOW_DLL_CALL int run_state(FrameState *state, Nodes* nodes, Reactions* reactions, Elements* elements,
+		       OtherElementData* other, int nL, LoadCase* loadcases,
+		       DynamicData *dynamic, ExtraInertia *extraInertia, ExtraMass *extraMass,
+		       Condensation *condensation, // end of inputs, rest are outputs
+		       Displacements* displacements, Forces* forces, ReactionForces* reactionForces,
+		       InternalForces** internalForces, MassResults *massResults, ModalResults *modalResults,
+		       SparseMatrices *matrices){
+
 
   char	errMsg[MAXL];		// the text of an error message
 
@@ -116,6 +262,7 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     ***eqF_temp=NULL,// equivalent end forces from temp loads global
     **F_mech=NULL,	// mechanical load vectors, all load cases	
     **F_temp=NULL,	// thermal load vectors, all load cases
+    *diag = NULL,	// diagonal of the L D L' decomp. of a linear [K]
     *F  = NULL, 	// total load vectors for a load case
     *R  = NULL,	// total reaction force vector
     *dR = NULL,	// incremental reaction force vector 
@@ -164,11 +311,14 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     anlyz=1,	// 1: stiffness analysis, 0: data check	
     *q=NULL,*r=NULL,sumR,	// reaction data, total no. of reactions
     nM=0,		// number of desired modes
-    Mmethod,	// 1: Subspace Jacobi, 2: Stodola
+    Mmethod,	// 1: Subspace Jacobi, 2: Stodola, 3: sparse [K] and [M] out
     nM_calc,	// number of modes to calculate
     lump=1,		// 1: lumped, 0: consistent mass matrix
     iter=0,		// number of iterations	
     ok=1,		// number of (-ve) diag. terms of L D L'
+    ok_K=0,		// ok of the factored linear [K]
+    factored=0,	// 1: K and diag hold the factored linear [K]
+    nS=0,		// size of the stiffness input signature
     anim[128],	// the modes to be animated
     Cdof=0,		// number of condensed degrees o freedom
     Cmethod=0,	// matrix condensation method
@@ -180,6 +330,8 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     axial_strain_warning = 0, // 0: "ok", 1: strain > 0.001
     ExitCode = 0;	// error code returned by Frame3DD
 
+  char	*S = NULL;	// stiffness input signature
+
   if ( verbose ) { /*  display program name, version and license type */
     textColor('w','b','b','x');
     fprintf(stdout,"\n FRAME3DD version: %s\n", VERSION);
@@ -285,6 +437,7 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
   eqF_temp =  D3dmatrix(1,nL,1,nE,1,12); /* eqF due to temp loads */
 
   K   = dmatrix(1,DoF,1,DoF);	/* global stiffness matrix	*/
+  diag = dvector(1,DoF);	/* diagonal of L D L' of a linear [K] */
   Q   = dmatrix(1,nE,1,12);	/* end forces for each member	*/
 
   D   = dvector(1,DoF);	/* displacments of each node		*/
@@ -373,10 +526,41 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     for (i=1; i<=nE; i++)	for (j=1;j<=12;j++)	Q[i][j] = 0.0;
 
     /*  elastic stiffness matrix  [K({D}^(i))], {D}^(0)={0} (i=0) */
-    assemble_K ( K, DoF, nE, nN, xyz, rj, L, Le, N1, N2,
-		 Ax, Asy, Asz, Jx,Iy,Iz, E, G, p,
-		 shear, geom, Q, debug,
-		 EKx, EKy, EKz, EKtx, EKty, EKtz);
+    /*  without geometric stiffness it is the same for all load cases, */
+    /*  and for the next runs as long as its inputs do not change */
+    if ( !geom && !factored && state != NULL ) {
+      S = stiffness_signature( &nS, nN, nE, DoF, xyz, rj, L, Le, N1, N2,
+			       Ax, Asy, Asz, Jx, Iy, Iz, E, G, p, shear, q, r,
+			       EKx, EKy, EKz, EKtx, EKty, EKtz );
+      if ( state->DoF == DoF && state->nS == nS && memcmp(state->S, S, nS) == 0 ) {
+	memcpy(K[1]+1, state->K[1]+1, (size_t)DoF*DoF*sizeof(double));
+	memcpy(diag+1, state->diag+1, DoF*sizeof(double));
+	ok_K = state->ok;
+	factored = 1;
+      }
+    }
+    if ( geom || !factored ) {
+      assemble_K ( K, DoF, nE, nN, xyz, rj, L, Le, N1, N2,
+		   Ax, Asy, Asz, Jx,Iy,Iz, E, G, p,
+		   shear, geom, Q, debug,
+		   EKx, EKy, EKz, EKtx, EKty, EKtz);
+    }
+    if ( !geom && !factored ) {
+      ldl_dcmp_pm ( K, DoF, diag, F, D, R, q,r, 1, 0, &ok_K );
+      factored = 1;
+      if ( state != NULL ) {	/* store the factored [K] for the next runs */
+	clear_state(state);
+	state->DoF = DoF;
+	state->nS = nS;
+	state->S = S;
+	state->K = dmatrix(1,DoF,1,DoF);
+	state->diag = dvector(1,DoF);
+	memcpy(state->K[1]+1, K[1]+1, (size_t)DoF*DoF*sizeof(double));
+	memcpy(state->diag+1, diag+1, DoF*sizeof(double));
+	state->ok = ok_K;
+	S = NULL;
+      }
+    }
 
 #ifdef MATRIX_DEBUG
     save_dmatrix ( "Ku", K, 1,DoF, 1,DoF, 0, "w" ); // unloaded stiffness matrix
@@ -388,7 +572,8 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 	fprintf(stdout," Linear Elastic Analysis ... Temperature Loads\n");
 
       /*  solve {F_t} = [K({D=0})] * {D_t} */
-      solve_system(K,dD,F_temp[lc],dR,DoF,q,r,&ok,verbose,&rms_resid);
+      ok = ok_K;
+      solve_system_ldl(K,diag,dD,F_temp[lc],dR,DoF,q,r,geom,&ok,verbose,&rms_resid);
 
       /* increment {D_t} = {0} + {D_t} temp.-induced displ */
       for (i=1; i<=DoF; i++)	if (q[i]) D[i] += dD[i];
@@ -419,7 +604,8 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
       for (i=1; i<=DoF; i++)	if (r[i]>0) dD[i] = Dp[lc][i];
 
       /*  solve {F_m} = [K({D_t})] * {D_m}	*/
-      solve_system(K,dD,F_mech[lc],dR,DoF,q,r,&ok,verbose,&rms_resid);
+      ok = ok_K;
+      solve_system_ldl(K,diag,dD,F_mech[lc],dR,DoF,q,r,geom,&ok,verbose,&rms_resid);
 
       /* combine {D} = {D_t} + {D_m}	*/
       for (i=1; i<=DoF; i++) {
@@ -622,7 +808,18 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
       save_ut_dmatrix ( "Md", M, DoF, "w" );/* dynamic mass matx */
     }
 
-    if ( anlyz ) {	/* subspace or stodola methods */
+    if ( anlyz && Mmethod == 3 ) {	/* sparse matrices, modes solved by the caller */
+      if ( export_sparse ( K, M, DoF, matrices ) ) {
+	sprintf(errMsg,"\n  error: %d entries are needed for the sparse [K] and [M]\n", matrices ? matrices->nnz : 0);
+	errorMsg(errMsg);
+	ExitCode += 1;
+      }
+
+      write_modal_results ( massResults, modalResults,
+			    nN, nE, nI, DoF, M, f, V,
+			    total_mass, struct_mass,
+			    iter, sumR, 0, shift, lump, tol, ok );
+    } else if ( anlyz ) {	/* subspace or stodola methods */
       if( Mmethod == 1 )
 	ExitCode += subspace( K, M, DoF, nM_calc, f, V, tol,shift,&iter,&ok, verbose );
       if( Mmethod == 2 )
@@ -710,6 +907,9 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 	       pkDx, pkDy, pkDz, pkRx, pkSy, pkSz,
 	       EKx, EKy, EKz, EKtx, EKty, EKtz);
 
+  free_dvector(diag, 1, DoF);
+  free(S);
+
   if ( verbose ) fprintf(stdout,"\n");
 
   color(0);
@@ -218,3 +218,24 @@ typedef struct {
 } ModalResults;
 
 
+typedef struct {
+    int nnz;           // capacity of the arrays on input, number of entries on output
+    int *row, *col;    // 0-based indices of the entries in the upper triangle
+    double *K, *M;     // dynamic stiffness and mass matrices
+
+} SparseMatrices;
+
+
+
+// --------------
+// State kept between runs
+// --------------
+
+typedef struct {
+    int DoF;           // size of the stored stiffness matrix, 0 if none
+    int nS;            // size of the stiffness input signature, bytes
+    char *S;           // stiffness inputs of the stored factorization
+    double **K;        // linear stiffness matrix, with its L D L' factors in the lower triangle
+    double *diag;      // diagonal of D in the L D L' decomposition
+    int ok;            // number of negative terms on the diagonal of D
+} FrameState;
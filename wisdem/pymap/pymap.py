@@ -490,6 +490,26 @@ class pyMAP(object):
         return fx.value, fy.value, fz.value
 
 
+    def get_fairlead_forces_3d(self, nlines):
+        """Gets the fairlead forces of the first nlines lines in a 3D frame along the
+        reference global axis, with the same C function as get_fairlead_force_3d but
+        writing into one c_double array of size 3*nlines allocated once per call.
+
+        :param nlines: The number of lines the fairlead forces are being requested for
+        :returns: list of [fx, fy, fz] fairlead forces for each line [N]
+
+        >>> F = get_fairlead_forces_3d(3)
+        """
+        F = (c_double * (3*nlines))(*([-999.9] * (3*nlines)))
+        address = addressof(F)
+        size = sizeof(c_double)
+        ierr = byref(self.ierr)
+        for k in range(nlines):
+            fx, fy, fz = [cast(address + (3*k+i)*size, POINTER(c_double)) for i in range(3)]
+            libexec.map_get_fairlead_force_3d( fx, fy, fz, self.f_type_d, k, self.status, ierr)
+        return [F[3*k:3*k+3] for k in range(nlines)]
+
+
     def get_anchor_force_2d(self, index):
         """Gets the horizontal and vertical anchor force in a 2D plane along the 
         straight-line line. Must ensure update_states() is called before accessing 
@@ -1027,6 +1027,95 @@ contains
 
 
 
+    !++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    ! properties of all the blade stations in one call.  The airfoil nodes and
+    ! the layups of every station are zero padded along the first dimension;
+    ! n_af, n_sct*, nweb and n_laminaTotal* give the used length for each station.
+    ! The GIL is released so stations can be split across Python threads.
+    !++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    subroutine properties_batch(chord, tw_aero_d, tw_prime_d, le_loc, &
+        n_af, xnode, ynode, e1, e2, g12, anu12, density, &
+        n_sctU, xsec_nodeU, n_laminaU, n_laminaTotalU, n_pliesU, t_lamU, tht_lamU, mat_lamU, &
+        n_sctL, xsec_nodeL, n_laminaL, n_laminaTotalL, n_pliesL, t_lamL, tht_lamL, mat_lamL, &
+        nweb, loc_web, n_laminaW, n_laminaTotalW, n_pliesW, t_lamW, tht_lamW, mat_lamW, &
+        results, nsec, max_af, n_materials, max_sctU, max_sctL, max_web, &
+        max_laminaU, max_laminaL, max_laminaW)
+
+        !f2py threadsafe
+
+        implicit none
+        integer, parameter :: dbp = kind(0.d0)
+
+        ! ----- inputs ------
+        ! section geometry, one value per station
+        real(dbp), intent(in), dimension(nsec) :: chord, tw_aero_d, tw_prime_d, le_loc
+
+        ! airfoil coordinates, as in properties, padded to max_af nodes
+        integer, intent(in), dimension(nsec) :: n_af
+        real(dbp), intent(in), dimension(max_af, nsec) :: xnode, ynode
+
+        ! materials, shared by all stations
+        real(dbp), intent(in), dimension(n_materials) :: e1, e2, g12, anu12, density
+
+        ! laminates of the upper surface, as in properties, padded to the largest station
+        integer, intent(in), dimension(nsec) :: n_sctU, n_laminaTotalU
+        real(dbp), intent(in), dimension(max_sctU+1, nsec) :: xsec_nodeU
+        integer, intent(in), dimension(max_sctU, nsec) :: n_laminaU
+        integer, intent(in), dimension(max_laminaU, nsec) :: n_pliesU, mat_lamU
+        real(dbp), intent(in), dimension(max_laminaU, nsec) :: t_lamU, tht_lamU
+
+        ! lower surface
+        integer, intent(in), dimension(nsec) :: n_sctL, n_laminaTotalL
+        real(dbp), intent(in), dimension(max_sctL+1, nsec) :: xsec_nodeL
+        integer, intent(in), dimension(max_sctL, nsec) :: n_laminaL
+        integer, intent(in), dimension(max_laminaL, nsec) :: n_pliesL, mat_lamL
+        real(dbp), intent(in), dimension(max_laminaL, nsec) :: t_lamL, tht_lamL
+
+        ! webs, max_web and max_laminaW are at least 1 even without any web
+        integer, intent(in), dimension(nsec) :: nweb, n_laminaTotalW
+        real(dbp), intent(in), dimension(max_web, nsec) :: loc_web
+        integer, intent(in), dimension(max_web, nsec) :: n_laminaW
+        integer, intent(in), dimension(max_laminaW, nsec) :: n_pliesW, mat_lamW
+        real(dbp), intent(in), dimension(max_laminaW, nsec) :: t_lamW, tht_lamW
+
+        integer, intent(in) :: nsec, max_af, n_materials, max_sctU, max_sctL, max_web
+        integer, intent(in) :: max_laminaU, max_laminaL, max_laminaW
+
+        ! ----- outputs ------
+        ! outputs of properties, eifbar to ycm_ref, for each station
+        real(dbp), intent(out), dimension(20, nsec) :: results
+
+        ! local
+        integer :: i, nw, nlU, nlL, nlW
+
+        do i = 1, nsec
+
+            nw = max(nweb(i), 1)
+            nlU = max(n_laminaTotalU(i), 1)
+            nlL = max(n_laminaTotalL(i), 1)
+            nlW = max(n_laminaTotalW(i), 1)
+
+            call properties(chord(i), tw_aero_d(i), tw_prime_d(i), le_loc(i), &
+                xnode(1:n_af(i), i), ynode(1:n_af(i), i), e1, e2, g12, anu12, density, &
+                xsec_nodeU(1:n_sctU(i)+1, i), n_laminaU(1:n_sctU(i), i), n_pliesU(1:nlU, i), &
+                t_lamU(1:nlU, i), tht_lamU(1:nlU, i), mat_lamU(1:nlU, i), &
+                xsec_nodeL(1:n_sctL(i)+1, i), n_laminaL(1:n_sctL(i), i), n_pliesL(1:nlL, i), &
+                t_lamL(1:nlL, i), tht_lamL(1:nlL, i), mat_lamL(1:nlL, i), &
+                nweb(i), loc_web(1:nw, i), n_laminaW(1:nw, i), n_pliesW(1:nlW, i), &
+                t_lamW(1:nlW, i), tht_lamW(1:nlW, i), mat_lamW(1:nlW, i), &
+                results(1, i), results(2, i), results(3, i), results(4, i), results(5, i), &
+                results(6, i), results(7, i), results(8, i), results(9, i), results(10, i), &
+                results(11, i), results(12, i), results(13, i), results(14, i), results(15, i), &
+                results(16, i), results(17, i), results(18, i), results(19, i), results(20, i), &
+                n_af(i), n_materials, n_sctU(i), n_sctL(i), nw, nlU, nlL, nlW)
+
+        end do
+
+    end subroutine properties_batch
+
+
+
 
 
 
@@ -13,6 +13,7 @@ import numpy as np
 import math
 import copy
 import os
+from multiprocessing.pool import ThreadPool
 
 # from rotorstruc import SectionStrucInterface
 # from wisdem.common import sind, cosd
@@ -91,109 +92,72 @@ class PreComp():
         # twist rate
         self.th_prime = _precomp.tw_rate(self.r, self.theta)
 
-    def sectionProperties(self):
-        """see meth:`SectionStrucInterface.sectionProperties`"""
+    def sectionProperties(self, threads=1):
+        """see meth:`SectionStrucInterface.sectionProperties`
+
+        All stations are packed into zero padded arrays and evaluated by one
+        compiled call; with threads > 1 the stations are split in contiguous
+        chunks evaluated concurrently (the compiled code releases the GIL).
+
+        """
 
         # radial discretization
         nsec = len(self.r)
 
-        # initialize variables
-        beam_z = self.r
-        beam_EA = np.zeros(nsec)
-        beam_EIxx = np.zeros(nsec)
-        beam_EIyy = np.zeros(nsec)
-        beam_EIxy = np.zeros(nsec)
-        beam_GJ = np.zeros(nsec)
-        beam_rhoA = np.zeros(nsec)
-        beam_rhoJ = np.zeros(nsec)
-        beam_Tw_iner = np.zeros(nsec)
+        # arrange materials into array
+        mat  = self.materials
+        E1   = [m.E1 for m in mat]
+        E2   = [m.E2 for m in mat]
+        G12  = [m.G12 for m in mat]
+        nu12 = [m.nu12 for m in mat]
+        rho  = [m.rho for m in mat]
+
+        # airfoil nodes and layups of all stations, padded to the largest one
+        nodes = [p._preCompFormat() for p in self.profile]
+        n_af  = np.array([len(x) for x, y in nodes], dtype=np.int32)
+        xnode = _pad([x for x, y in nodes])
+        ynode = _pad([y for x, y in nodes])
+        lamU  = _preCompBatchFormat(self.upperCS, 1)
+        lamL  = _preCompBatchFormat(self.lowerCS, 1)
+        lamW  = _preCompBatchFormat(self.websCS, 0)
+
+        def batch(s):
+            # stations in the slice s; station is the last (Fortran) dimension
+            return _precomp.properties_batch(self.chord[s], self.theta[s], self.th_prime[s], self.leLoc[s],
+                n_af[s], xnode[s].T, ynode[s].T, E1, E2, G12, nu12, rho,
+                *[a[s].T for a in lamU + lamL + lamW]).T
+
+        threads = max(min(threads, nsec), 1)
+        chunks  = [slice(idx[0], idx[-1]+1) for idx in np.array_split(np.arange(nsec), threads)]
+        if threads > 1:
+            pool    = ThreadPool(threads)
+            results = np.vstack(pool.map(batch, chunks))
+            pool.close()
+            pool.join()
+        else:
+            results = batch(chunks[0])
 
-        beam_flap_iner = np.zeros(nsec)
-        beam_edge_iner = np.zeros(nsec)
+        beam_EIxx = results[:, 1]  # EIedge
+        beam_EIyy = results[:, 0]  # EIflat
+        beam_GJ = results[:, 2]
+        beam_EA = results[:, 3]
+        beam_EIxy = results[:, 4]  # EIflapedge
 
         # distance to elastic center from point about which structural properties are computed
         # using airfoil coordinate system
-        beam_x_ec = np.zeros(nsec)
-        beam_y_ec = np.zeros(nsec)
+        beam_x_ec = results[:, 12] - results[:, 10]
+        beam_y_ec = results[:, 13] - results[:, 11]
+        beam_rhoA = results[:, 14]
+        beam_rhoJ = results[:, 15] + results[:, 16]  # perpindicular axis theorem
+        beam_Tw_iner = results[:, 17]
+
+        beam_flap_iner = results[:, 15]
+        beam_edge_iner = results[:, 16]
 
         # distance to elastic center from airfoil nose
         # using profile coordinate system
-        self.x_ec_nose = np.zeros(nsec)
-        self.y_ec_nose = np.zeros(nsec)
-
-        profile = self.profile
-        mat = self.materials
-        csU = self.upperCS
-        csL = self.lowerCS
-        csW = self.websCS
-
-        # arrange materials into array
-        n = len(mat)
-        E1 = [0]*n
-        E2 = [0]*n
-        G12 = [0]*n
-        nu12 = [0]*n
-        rho = [0]*n
-
-        for i in range(n):
-            E1[i] = mat[i].E1
-            E2[i] = mat[i].E2
-            G12[i] = mat[i].G12
-            nu12[i] = mat[i].nu12
-            rho[i] = mat[i].rho
-
-
-
-        for i in range(nsec):
-            # print(i)
-
-            xnode, ynode = profile[i]._preCompFormat()
-            locU, n_laminaU, n_pliesU, tU, thetaU, mat_idxU = csU[i]._preCompFormat()
-            locL, n_laminaL, n_pliesL, tL, thetaL, mat_idxL = csL[i]._preCompFormat()
-            locW, n_laminaW, n_pliesW, tW, thetaW, mat_idxW = csW[i]._preCompFormat()
-
-            nwebs = len(locW)
-
-            # address a bug in f2py (need to pass in length 1 arrays even though they are not used)
-            if nwebs == 0:
-                locW = [0]
-                n_laminaW = [0]
-                n_pliesW = [0]
-                tW = [0]
-                thetaW = [0]
-                mat_idxW = [0]
-
-            # print(np.c_[xnode, ynode])
-            # import matplotlib.pyplot as plt
-            # plt.plot(xnode, ynode, '.')
-            # plt.plot(xnode, ynode)
-            # plt.show()
-            # if i == 2:
-            #     exit()
-
-            results = _precomp.properties(self.chord[i], self.theta[i],
-                self.th_prime[i], self.leLoc[i],
-                xnode, ynode, E1, E2, G12, nu12, rho,
-                locU, n_laminaU, n_pliesU, tU, thetaU, mat_idxU,
-                locL, n_laminaL, n_pliesL, tL, thetaL, mat_idxL,
-                nwebs, locW, n_laminaW, n_pliesW, tW, thetaW, mat_idxW)
-
-            beam_EIxx[i] = results[1]  # EIedge
-            beam_EIyy[i] = results[0]  # EIflat
-            beam_GJ[i] = results[2]
-            beam_EA[i] = results[3]
-            beam_EIxy[i] = results[4]  # EIflapedge
-            beam_x_ec[i] = results[12] - results[10]
-            beam_y_ec[i] = results[13] - results[11]
-            beam_rhoA[i] = results[14]
-            beam_rhoJ[i] = results[15] + results[16]  # perpindicular axis theorem
-            beam_Tw_iner[i] = results[17]
-
-            beam_flap_iner[i] = results[15]
-            beam_edge_iner[i] = results[16]
-
-            self.x_ec_nose[i] = results[13] + self.leLoc[i]*self.chord[i]
-            self.y_ec_nose[i] = results[12]  # switch b.c of coordinate system used
+        self.x_ec_nose = results[:, 13] + self.leLoc*self.chord
+        self.y_ec_nose = results[:, 12]  # switch b.c of coordinate system used
 
         return beam_EIxx, beam_EIyy, beam_GJ, beam_EA, beam_EIxy, beam_x_ec, beam_y_ec, beam_rhoA, beam_rhoJ, beam_Tw_iner, beam_flap_iner, beam_edge_iner
 
@@ -288,6 +252,39 @@ class PreComp():
 
 
 
+def _pad(rows, n=1, dtype=float):
+    # stack variable length rows in a zero padded (len(rows), >= n) array
+    out = np.zeros((len(rows), max([n] + [len(row) for row in rows])), dtype=dtype)
+    for i, row in enumerate(rows):
+        out[i, :len(row)] = row
+    return out
+
+
+def _preCompBatchFormat(sections, nloc):
+    """Layups of all stations in the padded layout of properties_batch:
+    number of sectors, sector boundaries, number of lamina in each sector,
+    total number of lamina, plies, thickness, orientation and (1-based)
+    material of each lamina.  Sectors are bounded by nloc+n locations, so
+    nloc is 1 for the surfaces and 0 for the webs.
+
+    """
+
+    n_lamina = [[len(theta) for theta in cs.theta] for cs in sections]
+    lamina   = [[np.concatenate(v) if len(v) > 0 else [] for v in (cs.n_plies, cs.t, cs.theta, cs.mat_idx)]
+                for cs in sections]
+    n_sct    = np.array([len(n) for n in n_lamina], dtype=np.int32)
+    n_total  = np.array([len(lam[0]) for lam in lamina], dtype=np.int32)
+
+    n_lamina = _pad(n_lamina, dtype=np.int32)
+    loc      = _pad([cs.loc for cs in sections], n_lamina.shape[1] + nloc)[:, :n_lamina.shape[1] + nloc]
+    n_plies  = _pad([lam[0] for lam in lamina], dtype=np.int32)
+    t        = _pad([lam[1] for lam in lamina])
+    theta    = _pad([lam[2] for lam in lamina])
+    mat_idx  = _pad([np.asarray(lam[3], dtype=np.int32) + 1 for lam in lamina], dtype=np.int32)  # 1-based indexing in Fortran
+
+    return [n_sct, loc, n_lamina, n_total, n_plies, t, theta, mat_idx]
+
+
 def skipLines(f, n):
     for i in range(n):
         f.readline()
@@ -12,10 +12,11 @@ import numpy as np
 import os
 from openmdao.api import IndepVarComp, ExplicitComponent, Group, Problem
 from scipy.optimize import minimize_scalar, minimize, brentq
-from scipy.interpolate import PchipInterpolator
+from scipy.interpolate import PchipInterpolator, RectBivariateSpline
 
 from wisdem.ccblade.ccblade_component import CCBladeGeometry, CCBladePower
 from wisdem.ccblade import CCAirfoil, CCBlade
+from wisdem.ccblade.ccblade import _brentq
 
 from wisdem.commonse.distribution import RayleighCDF, WeibullWithMeanCDF
 from wisdem.commonse.utilities import vstack, trapz_deriv, linspace_with_deriv, smooth_min, smooth_abs
@@ -27,6 +28,8 @@ from wisdem.rotorse.rotor_geometry_yaml import ReferenceBlade
 from wisdem.rotorse.rotor_fast import eval_unsteady
 
 import time
+import hashlib
+import multiprocessing as mp
 # ---------------------
 # Components
 # ---------------------
@@ -40,10 +43,17 @@ class RegulatedPowerCurve(ExplicitComponent):
         self.options.declare('n_pc_spline')
         self.options.declare('regulation_reg_II5',default=True)
         self.options.declare('regulation_reg_III',default=False)
+        self.options.declare('cores',default=1) # processes used for the Region 2.5 and 3 pitch solves
+        self.options.declare('pitch_chunk',default=4) # wind speeds solved together, warm started from the pitch just below them
+        self.options.declare('regulation_table',default=False) # interpolate a cached Cp/Ct/Cq surface for the Region 2.5 and 3 solves, tabulated at a fixed Reynolds number
+        self.options.declare('regulation_table_tol',default=1e-3) # relative error in rated power above which table mode falls back to BEM
 
         self.options.declare('n_aoa_grid')
         self.options.declare('n_Re_grid')
 
+        self._surface     = None
+        self._surface_key = None
+
     
     def setup(self):
         naero       = self.naero = self.options['naero']
@@ -128,10 +138,20 @@ class RegulatedPowerCurve(ExplicitComponent):
         # Create Airfoil class instances
         af = [None]*self.naero
         for i in range(self.naero):
-            af[i] = CCAirfoil(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
+            af[i] = CCAirfoil.cached(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
         
 
-        self.ccblade = CCBlade(inputs['r'], inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'], inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'], discrete_inputs['nSector'], inputs['precurve'], inputs['precurveTip'],inputs['presweep'], inputs['presweepTip'], discrete_inputs['tiploss'], discrete_inputs['hubloss'],discrete_inputs['wakerotation'], discrete_inputs['usecd'])
+        self.ccblade = CCBlade(inputs['r'], inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'], inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'], discrete_inputs['nSector'], inputs['precurve'], inputs['precurveTip'],inputs['presweep'], inputs['presweepTip'], discrete_inputs['tiploss'], discrete_inputs['hubloss'],discrete_inputs['wakerotation'], discrete_inputs['usecd'], vectorized=True)
+
+        # One process pool for all the pitch solves of this call, each worker receives CCBlade once
+        if self.options['cores'] > 1:
+            with mp.Pool(self.options['cores'], initializer=_set_worker_ccblade, initargs=(self.ccblade,)) as pool:
+                self._compute(inputs, outputs, discrete_inputs, discrete_outputs, pool)
+        else:
+            self._compute(inputs, outputs, discrete_inputs, discrete_outputs, None)
+
+
+    def _compute(self, inputs, outputs, discrete_inputs, discrete_outputs, pool):
 
         npc      = self.options['n_pc']
         Uhub     = np.linspace(inputs['control_Vin'],inputs['control_Vout'], npc).flatten()
@@ -195,38 +215,64 @@ class RegulatedPowerCurve(ExplicitComponent):
             U_rated = Uhub[-1]
         i_rated = np.nonzero(U_rated <= Uhub)[0][0]
         
-        # Function to be used inside of power maximization until Region 3
-        def maximizePower(pitch, Uhub, Omega_rpm):
-            P, _, _, _ = self.ccblade.evaluate([Uhub], [Omega_rpm], [pitch], coefficients=False)
-            return -P
+        # Coefficient surface reused across calls while the blade is unchanged. It is tabulated
+        # at a single wind speed, so table results are checked against BEM below
+        surface = self._table(inputs, discrete_inputs, U_rated) if self.options['regulation_table'] else None
 
-        # Maximize power until Region 3
+        # Maximize power until Region 3, solving all wind speeds below rated speed together
         region2p5 = False
-        for i in range(i_3):
-            # No need to optimize if already doing well
-            if Omega[i] == Omega_tsr[i]: continue
-
-            # Find pitch value that gives highest power rating
-            pitch0   = pitch[i] if i==0 else pitch[i-1]
-            bnds     = [pitch0-10., pitch0+10.]
-            pitch[i] = minimize_scalar(lambda x: maximizePower(x, Uhub[i], Omega_rpm[i]),
-                                       bounds=bnds, method='bounded', options={'disp':False, 'xatol':1e-2, 'maxiter':40})['x']
+        idx = np.array([i for i in range(i_3) if Omega[i] != Omega_tsr[i]], dtype=int)
+        if idx.size > 0:
+            # Find pitch values that give highest power rating, within 10 deg of the lower neighbour
+            if surface is not None:
+                def solve(k, pitch0):
+                    tsr_k = Omega[k] * R_tip / Uhub[k]
+                    return _golden_section(lambda x: -surface(tsr_k, x)[0], pitch0-10., pitch0+10.,
+                                           xatol=1e-2, maxiter=40)
+            else:
+                def solve(k, pitch0):
+                    return self._map(pool, _max_power_pitch, [Uhub[k], Omega_rpm[k], pitch0], np.arange(k.size))
+            pitch_opt = self._warm_start(solve, idx, pitch, pool)
 
             # Find associated power
-            P_aero[i], T[i], Q[i], M[i], Cp_aero[i], Ct_aero[i], Cq_aero[i], Cm_aero[i] = self.ccblade.evaluate([Uhub[i]], [Omega_rpm[i]], [pitch[i]], coefficients=True)
-            P[i], eff  = CSMDrivetrain(P_aero[i], P_rated, driveType, driveEta)
-            Cp[i]      = Cp_aero[i]*eff
-
-            # Note if we find Region 2.5
-            if ( (not region2p5) and (Omega[i] == Omega_max) and (P[i] < P_rated) ):
-                region2p5 = True
-                i_2p5     = i
-
-            # Stop if we find Region 3 early
-            if P[i] > P_rated:
-                i_3     = i+1
-                i_rated = i
-                break
+            out = list(self.ccblade.evaluate(Uhub[idx], Omega_rpm[idx], pitch_opt, coefficients=True))
+
+            # Check the interpolated optimum against BEM. Where the table misses the BEM power
+            # coefficient, solve again on the surface refined there, and then directly with BEM
+            if surface is not None:
+                tol = self.options['regulation_table_tol']
+                for attempt in ['table', 'bem']:
+                    tsr_opt = Omega[idx] * R_tip / Uhub[idx]
+                    miss    = np.abs(surface(tsr_opt, pitch_opt)[0] - out[4]) > tol * np.abs(out[4])
+                    if not np.any(miss): break
+
+                    k = idx[miss]
+                    if attempt == 'table':
+                        surface.refine(tsr_opt[miss], pitch_opt[miss])
+                        pitch_opt[miss] = solve(k, pitch_opt[miss])
+                    else:
+                        pitch_opt[miss] = self._map(pool, _max_power_pitch, [Uhub[k], Omega_rpm[k], pitch_opt[miss]], np.arange(k.size))
+                    for x, y in zip(out, self.ccblade.evaluate(Uhub[k], Omega_rpm[k], pitch_opt[miss], coefficients=True)):
+                        x[miss] = y
+            P_opt, eff_opt = CSMDrivetrain(out[0], P_rated, driveType, driveEta)
+            eff_opt = eff_opt*np.ones(idx.size)
+
+            for k, i in enumerate(idx):
+                pitch[i] = pitch_opt[k]
+                P_aero[i], T[i], Q[i], M[i], Cp_aero[i], Ct_aero[i], Cq_aero[i], Cm_aero[i] = [x[k] for x in out]
+                P[i]  = P_opt[k]
+                Cp[i] = Cp_aero[i]*eff_opt[k]
+
+                # Note if we find Region 2.5
+                if ( (not region2p5) and (Omega[i] == Omega_max) and (P[i] < P_rated) ):
+                    region2p5 = True
+                    i_2p5     = i
+
+                # Stop if we find Region 3 early
+                if P[i] > P_rated:
+                    i_3     = i+1
+                    i_rated = i
+                    break
 
             
         # Solve for rated velocity
@@ -242,7 +288,7 @@ class RegulatedPowerCurve(ExplicitComponent):
 
             if region2p5 and self.options['regulation_reg_II5']:
                 # Have to search over both pitch and speed
-                x0            = [0.0, Uhub[i]]
+                x0            = [pitch[i-1], Uhub[i]] # warm start from the neighbouring wind speed
                 bnds          = [ np.sort([pitch[i-1], pitch[i+1]]), [Uhub[i-1], Uhub[i+1]] ]
                 const         = {}
                 const['type'] = 'eq'
@@ -285,30 +331,45 @@ class RegulatedPowerCurve(ExplicitComponent):
 
         
         if region3:
-            # Function to be used to stay at rated power in Region 3
-            def rated_power_dist(pitch, Uhub, Omega_rpm):
-                P_aero, _, _, _ = self.ccblade.evaluate([Uhub], [Omega_rpm], [pitch], coefficients=False)
-                P, eff          = CSMDrivetrain(P_aero, P_rated, driveType, driveEta)
-                return (P - P_rated)
-
-            # Solve for Region 3 pitch
-            options = {'disp':False}
-            if self.options['regulation_reg_III']:
-                for i in range(i_3, npc):
-                    pitch0   = pitch[i-1]
-                    try:
-                        pitch[i] = brentq(lambda x: rated_power_dist(x, Uhub[i], Omega_rpm[i]), pitch0, pitch0+10.,
-                                          xtol = 1e-4, rtol = 1e-5, maxiter=40, disp=False)
-                    except ValueError:
-                        pitch[i] = minimize_scalar(lambda x: np.abs(rated_power_dist(x, Uhub[i], Omega_rpm[i])), bounds=[pitch0-5., pitch0+15.],
-                                                  method='bounded', options={'disp':False, 'xatol':1e-3, 'maxiter':40})['x']
-
-                    P_aero[i], T[i], Q[i], M[i], Cp_aero[i], Ct_aero[i], Cq_aero[i], Cm_aero[i] = self.ccblade.evaluate([Uhub[i]], [Omega_rpm[i]], [pitch[i]], coefficients=True)
-                    P[i], eff  = CSMDrivetrain(P_aero[i], P_rated, driveType, driveEta)
-                    Cp[i]      = Cp_aero[i]*eff
-                    #P[i]       = P_rated
-
-            else:
+            # Solve for Region 3 pitch at all wind speeds together
+            if self.options['regulation_reg_III'] and i_3 < npc:
+                def operate(idx):
+                    out = self.ccblade.evaluate(Uhub[idx], Omega_rpm[idx], pitch[idx], coefficients=True)
+                    P_aero[idx], T[idx], Q[idx], M[idx], Cp_aero[idx], Ct_aero[idx], Cq_aero[idx], Cm_aero[idx] = out
+                    P[idx], eff = CSMDrivetrain(P_aero[idx], P_rated, driveType, driveEta)
+                    Cp[idx]     = Cp_aero[idx]*eff
+
+                idx = np.arange(i_3, npc)
+                if surface is not None:
+                    def solve(k, pitch0):
+                        tsr_k      = Omega[k] * R_tip / Uhub[k]
+                        P_wind     = 0.5 * inputs['rho'] * np.pi * self.ccblade.rotorR**2 * Uhub[k]**3
+                        aero_power = lambda x, j=slice(None): surface(tsr_k[j], x)[0] * P_wind[j]
+                        return _solve_rated_pitch(aero_power, pitch0, P_rated, driveType, driveEta)
+                else:
+                    def solve(k, pitch0):
+                        return self._map(pool, _rated_power_pitch, [Uhub[k], Omega_rpm[k], pitch0], np.arange(k.size),
+                                         P_rated, driveType, driveEta)
+                pitch[idx] = self._warm_start(solve, idx, pitch, pool)
+                operate(idx)
+
+                # Check the interpolated schedule against BEM. Where rated power is missed,
+                # solve again on the surface refined there, and then directly with BEM
+                if surface is not None:
+                    tol = self.options['regulation_table_tol']
+                    for attempt in ['table', 'bem']:
+                        k = idx[np.abs(P[idx] - P_rated) > tol * P_rated]
+                        if k.size == 0: break
+
+                        if attempt == 'table':
+                            surface.refine(Omega[k] * R_tip / Uhub[k], pitch[k])
+                            pitch[k] = solve(k, pitch[k]-1.)
+                        else:
+                            pitch[k] = self._map(pool, _rated_power_pitch, [Uhub[k], Omega_rpm[k], pitch[k]-1.], np.arange(k.size),
+                                                 P_rated, driveType, driveEta)
+                        operate(k)
+
+            elif not self.options['regulation_reg_III']:
                 P[i_3:]       = P_rated
                 T[i_3:]       = 0
                 Q[i_3:]       = P[i_3:] / Omega[i_3:]
@@ -352,6 +413,65 @@ class RegulatedPowerCurve(ExplicitComponent):
         outputs['cd_cutin']          = cd_regII
 
 
+    def _table(self, inputs, discrete_inputs, U):
+        # Return the Cp/Ct/Cq surface, rebuilding it only when an input that
+        # defines the rotor aerodynamics has changed since the last call. The
+        # surface keeps the reference wind speed U of the call that built it:
+        # U is deliberately not part of the key, as the rated speed guess moves
+        # with every design iteration
+        h = hashlib.sha1()
+        for k in ['r', 'chord', 'theta', 'Rhub', 'Rtip', 'hub_height', 'precone', 'tilt', 'yaw',
+                  'precurve', 'precurveTip', 'presweep', 'presweepTip', 'rho', 'mu', 'shearExp',
+                  'airfoils_aoa', 'airfoils_Re', 'airfoils_cl', 'airfoils_cd', 'airfoils_cm']:
+            h.update(np.ascontiguousarray(inputs[k], dtype=np.float64).tobytes())
+        for k in ['nBlades', 'nSector', 'tiploss', 'hubloss', 'wakerotation', 'usecd']:
+            h.update(str(discrete_inputs[k]).encode())
+        key = h.hexdigest()
+
+        if key != self._surface_key:
+            self._surface     = CpCtCqSurface(self.ccblade, inputs['Rtip'], U)
+            self._surface_key = key
+        else:
+            self._surface.ccblade = self.ccblade
+
+        return self._surface
+
+
+    def _warm_start(self, solve, idx, pitch, pool=None):
+        # Solve for the pitch at the wind speeds in idx by increasing wind speed, in chunks of
+        # 'pitch_chunk' points solved together by solve(k, pitch0). Every point of a chunk starts
+        # from the pitch at the wind speed just below the chunk, the last one solved, so that
+        # with chunks of one point each wind speed starts from its lower neighbour. With a process
+        # pool the chunks hold at least one point per core
+        pitch = np.array(pitch, dtype=float)
+        n     = max(int(self.options['pitch_chunk']), 1)
+        if pool is not None:
+            n = max(n, self.options['cores'])
+        for j in range(0, idx.size, n):
+            k        = idx[j:j+n]
+            pitch0   = pitch[k[0]-1] if k[0] > 0 else pitch[k[0]]
+            pitch[k] = solve(k, np.full(k.size, pitch0))
+
+        return pitch[idx]
+
+
+    def _map(self, pool, solver, arrays, idx, *args):
+        # Apply a batched pitch solver to the wind speeds in idx, splitting
+        # them across the process pool of compute, if any. The workers hold
+        # the CCBlade instance already, so it is not sent with the jobs
+        cores  = min(self.options['cores'], idx.size) if pool is not None else 1
+        chunks = np.array_split(idx, max(cores, 1))
+        ccblade = None if pool is not None else self.ccblade
+        jobs   = [[ccblade] + [np.asarray(x)[k] for x in arrays] + list(args) for k in chunks]
+
+        if pool is not None:
+            out = pool.map(solver, jobs)
+        else:
+            out = [solver(job) for job in jobs]
+
+        return np.concatenate(out)
+
+
 class Cp_Ct_Cq_Tables(ExplicitComponent):
     def initialize(self):
         self.options.declare('naero')
@@ -417,7 +537,7 @@ class Cp_Ct_Cq_Tables(ExplicitComponent):
         # Create Airfoil class instances
         af = [None]*self.naero
         for i in range(self.naero):
-            af[i] = CCAirfoil(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
+            af[i] = CCAirfoil.cached(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
        
 
         n_pitch  = self.options['n_pitch']
@@ -430,7 +550,7 @@ class Cp_Ct_Cq_Tables(ExplicitComponent):
         tsr_vector = inputs['tsr_vector_in']
         pitch_vector = inputs['pitch_vector_in']
         
-        self.ccblade = CCBlade(inputs['r'], inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'], inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'], discrete_inputs['nSector'], inputs['precurve'], inputs['precurveTip'],inputs['presweep'], inputs['presweepTip'], discrete_inputs['tiploss'], discrete_inputs['hubloss'],discrete_inputs['wakerotation'], discrete_inputs['usecd'])
+        self.ccblade = CCBlade(inputs['r'], inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'], inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'], discrete_inputs['nSector'], inputs['precurve'], inputs['precurveTip'],inputs['presweep'], inputs['presweepTip'], discrete_inputs['tiploss'], discrete_inputs['hubloss'],discrete_inputs['wakerotation'], discrete_inputs['usecd'], vectorized=True)
         
         if max(U_vector) == 0.:
             U_vector    = np.linspace(V_in[0],V_out[0], n_U)
@@ -445,15 +565,132 @@ class Cp_Ct_Cq_Tables(ExplicitComponent):
                 
         R = inputs['Rtip']
         
-        Cp_aero_table = np.zeros((n_tsr, n_pitch, n_U))
-        Ct_aero_table = np.zeros((n_tsr, n_pitch, n_U))
-        Cq_aero_table = np.zeros((n_tsr, n_pitch, n_U))
-        
-        for i in range(n_U):
-            for j in range(n_tsr):
-                U     =  U_vector[i] * np.ones(n_pitch)
-                Omega = tsr_vector[j] *  U_vector[i] / R * 30. / np.pi * np.ones(n_pitch)
-                _, _, _, _, outputs['Cp_aero_table'][j,:,i], outputs['Ct_aero_table'][j,:,i], outputs['Cq_aero_table'][j,:,i], _ = self.ccblade.evaluate(U, Omega, pitch_vector, coefficients=True)
+        # Evaluate the whole (tsr, pitch, U) grid in a single batched call
+        tsr_grid, pitch_grid, U_grid = np.meshgrid(tsr_vector, pitch_vector, U_vector, indexing='ij')
+        U     = U_grid.flatten()
+        Omega = tsr_grid.flatten() * U / R * 30. / np.pi
+        _, _, _, _, Cp, Ct, Cq, _ = self.ccblade.evaluate(U, Omega, pitch_grid.flatten(), coefficients=True)
+
+        outputs['Cp_aero_table'] = Cp.reshape((n_tsr, n_pitch, n_U))
+        outputs['Ct_aero_table'] = Ct.reshape((n_tsr, n_pitch, n_U))
+        outputs['Cq_aero_table'] = Cq.reshape((n_tsr, n_pitch, n_U))
+
+
+class CpCtCqSurface(object):
+    """Rotor aerodynamic power, thrust and torque coefficients tabulated over
+    tip-speed ratio and pitch at a reference wind speed.  The grid starts
+    empty and is extended and refined on demand, so CCBlade is only run over
+    the part of the surface that the controller actually visits.
+
+    All coefficients are evaluated at the reference wind speed U, i.e. at the
+    blade Reynolds numbers of that speed.  Their change with Reynolds number
+    at other wind speeds is neglected, with no error bound of its own; callers
+    should check the operating points they take from the surface against
+    CCBlade, as RegulatedPowerCurve does with 'regulation_table_tol'."""
+
+    def __init__(self, ccblade, Rtip, U, dtsr=0.5, dpitch=1.0):
+        """
+        Parameters
+        ----------
+        ccblade : CCBlade
+            rotor used to evaluate the coefficients
+        Rtip : float (m)
+            tip radius used to define the tip-speed ratio
+        U : float (m/s)
+            reference hub-height wind speed
+        dtsr, dpitch : float
+            initial grid spacing in tip-speed ratio and pitch (deg)
+        """
+
+        self.ccblade = ccblade
+        self.Rtip    = float(Rtip)
+        self.U       = float(U)
+        self.dtsr    = dtsr
+        self.dpitch  = dpitch
+        self.tsr     = np.zeros(0)
+        self.pitch   = np.zeros(0)
+        self.tables  = np.zeros((3, 0, 0))
+
+
+    def __call__(self, tsr, pitch):
+        """interpolate Cp, Ct and Cq, extending the grid to cover the requested points
+
+        Parameters
+        ----------
+        tsr : array_like
+            tip-speed ratio
+        pitch : array_like (deg)
+            blade pitch angle
+
+        Returns
+        -------
+        Cp, Ct, Cq : ndarray
+            aerodynamic power, thrust and torque coefficients
+        """
+
+        tsr, pitch = np.broadcast_arrays(np.asarray(tsr, dtype=float), np.asarray(pitch, dtype=float))
+        self.extend(tsr, pitch)
+        return [spline.ev(tsr, pitch) for spline in self.splines]
+
+
+    def extend(self, tsr, pitch):
+        """add grid nodes so that every point lies at least one cell inside the surface"""
+
+        tsr_nodes   = self.__cover(self.tsr, tsr, self.dtsr)
+        pitch_nodes = self.__cover(self.pitch, pitch, self.dpitch)
+        if tsr_nodes.size > self.tsr.size or pitch_nodes.size > self.pitch.size:
+            self.__evaluate(tsr_nodes, pitch_nodes)
+
+
+    def refine(self, tsr, pitch):
+        """halve the grid spacing of the cells containing the given points"""
+
+        self.extend(tsr, pitch)
+        i = np.clip(np.searchsorted(self.tsr, tsr), 1, self.tsr.size-1)
+        j = np.clip(np.searchsorted(self.pitch, pitch), 1, self.pitch.size-1)
+        tsr_nodes   = np.union1d(self.tsr, 0.5*(self.tsr[i-1] + self.tsr[i]))
+        pitch_nodes = np.union1d(self.pitch, 0.5*(self.pitch[j-1] + self.pitch[j]))
+        self.__evaluate(tsr_nodes, pitch_nodes)
+
+
+    def __cover(self, nodes, x, h):
+        # uniform extension of nodes (spacing h) past the range of x
+
+        lower = np.min(x) - h
+        upper = np.max(x) + h
+        if nodes.size == 0:
+            n0 = np.floor(lower / h)
+            n1 = max(np.ceil(upper / h), n0 + 3.)  # cubic splines need 4 nodes
+            return h * np.arange(n0, n1 + 1.)
+
+        below = nodes[0] - h * np.arange(np.ceil((nodes[0] - lower) / h), 0., -1.)
+        above = nodes[-1] + h * np.arange(1., np.ceil((upper - nodes[-1]) / h) + 1.)
+        return np.concatenate((below, nodes, above))
+
+
+    def __evaluate(self, tsr, pitch):
+        # run CCBlade at the nodes of the new grid not already tabulated
+
+        tables = np.zeros((3, tsr.size, pitch.size))
+        known  = np.zeros((tsr.size, pitch.size), dtype=bool)
+        i = np.searchsorted(tsr, self.tsr)
+        j = np.searchsorted(pitch, self.pitch)
+        tables[:, i[:, np.newaxis], j] = self.tables
+        known[i[:, np.newaxis], j]     = True
+
+        tsr_grid, pitch_grid = np.meshgrid(tsr, pitch, indexing='ij')
+        missing = ~known
+        U       = self.U * np.ones(np.count_nonzero(missing))
+        Omega   = tsr_grid[missing] * U / self.Rtip * 30. / np.pi
+        _, _, _, _, Cp, Ct, Cq, _ = self.ccblade.evaluate(U, Omega, pitch_grid[missing], coefficients=True)
+        tables[0][missing] = Cp
+        tables[1][missing] = Ct
+        tables[2][missing] = Cq
+
+        self.tsr     = tsr
+        self.pitch   = pitch
+        self.tables  = tables
+        self.splines = [RectBivariateSpline(tsr, pitch, x, kx=3, ky=3, s=0) for x in tables]
 
 
 # Class to define a constraint so that the blade cannot operate in stall conditions
@@ -542,6 +779,91 @@ class AEP(ExplicitComponent):
         '''
 
 
+def _golden_section(f, a, b, xatol=1e-2, maxiter=40):
+    # Bounded golden-section minimization applied elementwise, so that every
+    # interval is narrowed with a single batched evaluation of f per iteration
+    gr = 0.5*(3.0 - np.sqrt(5.0))
+    a  = np.array(a, dtype=float)
+    b  = np.array(b, dtype=float)
+    c  = a + gr*(b - a)
+    d  = b - gr*(b - a)
+    fc = f(c)
+    fd = f(d)
+    for _ in range(maxiter):
+        if np.all(b - a < xatol): break
+
+        left  = fc < fd
+        b     = np.where(left, d, b)
+        a     = np.where(left, a, c)
+        x     = np.where(left, a + gr*(b - a), b - gr*(b - a))
+        fx    = f(x)
+        c, d  = np.where(left, x, d), np.where(left, c, x)
+        fc, fd = np.where(left, fx, fd), np.where(left, fc, fx)
+
+    return np.where(fc < fd, c, d)
+
+
+# CCBlade instance of a pool worker, set once when the pool is created
+_worker_ccblade = None
+
+
+def _set_worker_ccblade(ccblade):
+    global _worker_ccblade
+    _worker_ccblade = ccblade
+
+
+def _max_power_pitch(args):
+    # Region 2.5: pitch that maximizes aerodynamic power within 10 deg of pitch0
+    ccblade, Uhub, Omega_rpm, pitch0 = args
+    ccblade = _worker_ccblade if ccblade is None else ccblade
+    def negPower(pitch):
+        P, _, _, _ = ccblade.evaluate(Uhub, Omega_rpm, pitch, coefficients=False)
+        return -P
+    return _golden_section(negPower, pitch0-10., pitch0+10., xatol=1e-2, maxiter=40)
+
+
+def _rated_power_pitch(args):
+    # Region 3: pitch that holds rated electrical power, starting from pitch0
+    ccblade, Uhub, Omega_rpm, pitch0, P_rated, driveType, driveEta = args
+    ccblade = _worker_ccblade if ccblade is None else ccblade
+    def aero_power(pitch, k=slice(None)):
+        P_aero, _, _, _ = ccblade.evaluate(Uhub[k], Omega_rpm[k], pitch, coefficients=False)
+        return P_aero
+    return _solve_rated_pitch(aero_power, pitch0, P_rated, driveType, driveEta)
+
+
+def _solve_rated_pitch(aero_power, pitch0, P_rated, driveType, driveEta):
+    # Root solve of aero_power(pitch, k) for rated electrical power, where k
+    # optionally selects a subset of the operating points
+    def rated_power_dist(pitch, k=slice(None)):
+        P, eff = CSMDrivetrain(aero_power(pitch, k), P_rated, driveType, driveEta)
+        return (P - P_rated)
+
+    # Bracket each root by stepping up from pitch0, the pitch solved at a lower
+    # wind speed (see RegulatedPowerCurve._warm_start); pitch rises with wind speed in Region 3
+    lower  = np.array(pitch0, dtype=float)
+    upper  = lower + 10.
+    f_low  = rated_power_dist(lower)
+    f_up   = rated_power_dist(upper)
+    for _ in range(8):
+        step = (f_low > 0.) & (f_up > 0.)
+        if not np.any(step): break
+        lower = np.where(step, upper, lower)
+        f_low = np.where(step, f_up, f_low)
+        upper = np.where(step, upper + 10., upper)
+        f_up  = np.where(step, rated_power_dist(upper), f_up)
+
+    pitch = _brentq(rated_power_dist, lower, upper, xtol=1e-4, rtol=1e-5, maxiter=40)
+
+    # Fall back to minimizing the residual where no sign change was found
+    for k in np.nonzero(np.isnan(pitch))[0]:
+        pitch[k] = minimize_scalar(lambda x: np.abs(rated_power_dist(np.array([x]), [k])[0]),
+                                   bounds=[pitch0[k]-5., pitch0[k]+15.], method='bounded',
+                                   options={'disp':False, 'xatol':1e-3, 'maxiter':40})['x']
+
+    return pitch
+
+
 def CSMDrivetrain(aeroPower, ratedPower, drivetrainType, drivetrainEff):
 
     if drivetrainEff == 0.0:
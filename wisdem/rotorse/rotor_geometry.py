@@ -40,6 +40,20 @@ class BladeGeometry(ExplicitComponent):
         NAFgrid = len(self.refBlade['airfoils_aoa'])
         NRe     = len(self.refBlade['airfoils_Re'])
 
+        # Kept between calls, so update stages whose inputs did not change are skipped
+        self.updater = refBlade = ReferenceBlade()
+        refBlade.verbose             = False
+        refBlade.NINPUT              = NINPUT
+        refBlade.NPTS                = npts
+        refBlade.analysis_level      = self.refBlade['analysis_level']
+        refBlade.apply_stall_delay   = self.refBlade['apply_stall_delay']
+        refBlade.user_update_routine = self.options['user_update_routine']
+        if self.refBlade['analysis_level'] < 3:
+            refBlade.spar_var        = self.refBlade['precomp']['spar_var']
+            refBlade.te_var          = self.refBlade['precomp']['te_var']
+            # if 'le_var' in self.refBlade['precomp']:
+            #     refBlade.le_var     = self.refBlade['precomp']['le_var']
+
         self.add_input('bladeLength',   val=0.0, units='m', desc='blade length (if not precurved or swept) otherwise length of blade before curvature')
         self.add_input('r_max_chord',   val=0.0, desc='location of max chord on unit radius')
         self.add_input('chord_in',      val=np.zeros(NINPUT), units='m', desc='chord at control points')  # defined at hub, then at linearly spaced locations from r_max_chord to tip
@@ -122,7 +136,10 @@ class BladeGeometry(ExplicitComponent):
         # if discrete_inputs['blade_in_overwrite'] != {}:
         #     blade = copy.deepcopy(discrete_inputs['blade_in_overwrite'])
         # else:
-        blade = copy.deepcopy(self.refBlade)
+        # the reference airfoils are only read by the update, share them instead of copying
+        # unless a user routine could modify them
+        AFref = self.refBlade['AFref']
+        blade = copy.deepcopy(self.refBlade, {} if self.options['user_update_routine'] else {id(AFref): AFref})
         NINPUT = len(blade['ctrl_pts']['r_in'])
 
         # Set inputs to update blade geometry
@@ -162,20 +179,7 @@ class BladeGeometry(ExplicitComponent):
             blade['outer_shape_bem']['airfoil_position']['grid'] = inputs['airfoil_position'].tolist()
         
         # Update
-        refBlade = ReferenceBlade()
-        refBlade.verbose             = False
-        refBlade.NINPUT              = len(outputs['r_in'])
-        refBlade.NPTS                = len(blade['pf']['s'])
-        refBlade.analysis_level      = blade['analysis_level']
-        refBlade.apply_stall_delay   = blade['apply_stall_delay']
-        refBlade.user_update_routine = self.options['user_update_routine']
-        if blade['analysis_level'] < 3:
-            refBlade.spar_var        = blade['precomp']['spar_var']
-            refBlade.te_var          = blade['precomp']['te_var']
-            # if 'le_var' in blade['precomp']:
-            #     refBlade.le_var     = blade['precomp']['le_var']
-        
-        blade_out = refBlade.update(blade)
+        blade_out = self.updater.update(blade)
         
         # Get geometric outputs
         outputs['hub_diameter'] = 2.0*Rhub
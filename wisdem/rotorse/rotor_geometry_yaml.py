@@ -1,6 +1,7 @@
 from __future__ import print_function
 import os, sys, copy, time, warnings
 import operator
+import hashlib
 
 try:
     import ruamel_yaml as ry
@@ -12,8 +13,8 @@ except:
 
 from scipy.interpolate import PchipInterpolator, Akima1DInterpolator, interp1d, RectBivariateSpline
 import numpy as np
-import jsonschema as json
 
+from wisdem.commonse.yaml_loader import load_yaml, to_lists
 from wisdem.ccblade.ccblade_component import CCBladeGeometry
 from wisdem.ccblade import CCAirfoil
 from wisdem.airfoilprep.airfoilprep import Airfoil, Polar
@@ -23,6 +24,21 @@ from wisdem.rotorse.geometry_tools.geometry import AirfoilShape, Curve
 
 # import matplotlib.pyplot as plt
 
+def update_roundtrip(node, data):
+    # update a ruamel round-trip structure in place with the values of data (plain dicts and lists),
+    # so comments, key order and formatting of the loaded file are kept for the entries that remain
+    if isinstance(node, dict) and isinstance(data, dict):
+        for k in [k for k in node if k not in data]:
+            del node[k]
+        for k, v in data.items():
+            node[k] = update_roundtrip(node[k], v) if k in node else v
+        return node
+    if isinstance(node, list) and isinstance(data, list) and len(node) == len(data):
+        for i, v in enumerate(data):
+            node[i] = update_roundtrip(node[i], v)
+        return node
+    return data
+
 def remap2grid(x_ref, y_ref, x, spline=PchipInterpolator):
 
 
@@ -66,17 +82,81 @@ def remapAirfoil(x_ref, y_ref, x0):
     return remap2grid(x, y, x_in)
 
 def arc_length(x, y, z=[]):
-    npts = len(x)
-    arc = np.array([0.]*npts)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
     if len(z) == len(x):
-        for k in range(1, npts):
-            arc[k] = arc[k-1] + np.sqrt((x[k] - x[k-1])**2 + (y[k] - y[k-1])**2 + (z[k] - z[k-1])**2)
+        ds = np.sqrt(np.diff(x)**2 + np.diff(y)**2 + np.diff(np.asarray(z, dtype=float))**2)
     else:
-        for k in range(1, npts):
-            arc[k] = arc[k-1] + np.sqrt((x[k] - x[k-1])**2 + (y[k] - y[k-1])**2)
+        ds = np.sqrt(np.diff(x)**2 + np.diff(y)**2)
+    arc = np.zeros(len(x))
+    arc[1:] = np.cumsum(ds)
 
     return arc
 
+def calc_axis_intersections(profile, n, idx_le, arc, station, rotation, offset, side):
+    # Arc positions where lines perpendicular to rotated and offset axes through the pitch
+    # axis cross the airfoil surface, for any number of stations and axes at once.
+    #   profile, arc : (n stations, n points) dimensional profiles, TE to TE starting on the
+    #                  suction side, and their normalized arc length, padded beyond n points
+    #   idx_le       : leading edge point of each station
+    #   station, rotation (rad), offset (m), side (0 suction, 1 pressure) : for each axis
+    station  = np.asarray(station, dtype=int)
+    rotation = np.asarray(rotation, dtype=float)
+    offset   = np.asarray(offset, dtype=float)
+    side     = np.asarray(side, dtype=int)
+    nq       = station.size
+    if nq == 0:
+        return np.zeros(0)
+
+    x    = profile[station,:,0]
+    y    = profile[station,:,1]
+    rows = np.arange(nq)
+    pts  = np.arange(x.shape[1])
+
+    # line perpendicular to the rotated axis at the offset, y = m*x + b
+    offset_x = offset*np.cos(rotation)
+    offset_y = offset*np.sin(rotation)
+    m = np.sin(rotation+np.pi/2.)/np.cos(rotation+np.pi/2.)
+    b = -1*m*offset_x + offset_y
+
+    # index of the profile segments crossed by each line, the first crossing is on the suction side
+    crossed = np.diff(np.sign(y - (m[:,np.newaxis]*x + b[:,np.newaxis])), axis=1) != 0.
+    crossed = np.cumsum(crossed & (pts[np.newaxis,:-1] < n[station,np.newaxis]-1), axis=1)
+    if np.any(crossed[:,-1] <= side):
+        raise ValueError('Composite layer axis does not cross the airfoil surface at stations %s' % sorted(set(station[crossed[:,-1] <= side])))
+    seg = np.argmax(crossed > side[:,np.newaxis], axis=1)
+
+    # intersection with the crossed segment
+    x0, x1 = x[rows,seg], x[rows,seg+1]
+    y0, y1 = y[rows,seg], y[rows,seg+1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope      = (y1 - y0)/(x1 - x0)
+        midpoint_x = np.where(x1 != x0, (y0 - slope*x0 - b)/(m - slope), x0)
+
+    # linear interpolation of the arc length along the half of the surface
+    lo      = np.where(side == 0, 0, idx_le[station])
+    hi      = np.where(side == 0, idx_le[station]+1, n[station])
+    in_half = (pts >= lo[:,np.newaxis]) & (pts < hi[:,np.newaxis])
+    x_half  = np.where(in_half, x, np.inf)
+    order   = np.argsort(x_half, axis=1, kind='mergesort')
+    x_half  = np.take_along_axis(x_half, order, axis=1)
+    a_half  = np.take_along_axis(arc[station], order, axis=1)
+    n_half  = hi - lo
+
+    x_max      = x_half[rows,n_half-1]
+    x_last     = x[rows,hi-1]
+    midpoint_x = np.where(np.isclose(midpoint_x, 0.), 0., midpoint_x)
+    midpoint_x = np.where((midpoint_x > x_max) & np.isclose(midpoint_x, x_last), x_last, midpoint_x)
+    if np.any((midpoint_x < x_half[:,0]) | (midpoint_x > x_max)):
+        raise ValueError('Composite layer axis crosses the airfoil outside of its surface at stations %s' % sorted(set(station[(midpoint_x < x_half[:,0]) | (midpoint_x > x_max)])))
+
+    j      = np.clip(np.sum(x_half < midpoint_x[:,np.newaxis], axis=1), 1, n_half-1)
+    xa, xb = x_half[rows,j-1], x_half[rows,j]
+    ya, yb = a_half[rows,j-1], a_half[rows,j]
+    midpoint_arc = (yb - ya)/(xb - xa)*(midpoint_x - xa) + ya
+
+    a_half = np.where(in_half, arc[station], np.nan)
+    return np.clip(midpoint_arc, np.nanmin(a_half, axis=1), np.nanmax(a_half, axis=1))
 
 def rotate(xo, yo, xp, yp, angle):
     ## Rotate a point clockwise by a given angle around a given origin.
@@ -122,6 +202,64 @@ def trailing_edge_smoothing(data):
 
     return data
 
+def digest(*values):
+    # hash of nested dicts, lists, arrays and plain objects, used to detect
+    # whether the inputs of an update stage have changed
+    h = hashlib.sha1()
+    for value in values:
+        _hash_value(h, value)
+    return h.hexdigest()
+
+def _hash_value(h, value):
+    if isinstance(value, dict):
+        h.update(b'{')
+        for k in value:
+            h.update(repr(k).encode())
+            _hash_value(h, value[k])
+        h.update(b'}')
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        h.update(('%s%r' % (value.dtype.str, value.shape)).encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        if len(value) > 0 and all(isinstance(v, (float, int)) for v in value):
+            _hash_value(h, np.array(value, dtype=float))
+        else:
+            h.update(b'[')
+            for v in value:
+                _hash_value(h, v)
+            h.update(b']')
+    elif value is None or isinstance(value, (float, int, str, np.generic)):
+        h.update(repr(value).encode())
+    elif hasattr(value, '__dict__') and not callable(value):
+        h.update(type(value).__name__.encode())
+        _hash_value(h, vars(value))
+    else:
+        h.update(repr(value).encode())
+
+def _copy(value):
+    # deep copy of the blade containers and arrays; much faster than
+    # copy.deepcopy for the ruamel maps read from the ontology
+    if isinstance(value, dict):
+        return type(value)((k, _copy(v)) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_copy(v) for v in value)
+    elif isinstance(value, np.ndarray):
+        return value.copy()
+    elif value is None or isinstance(value, (float, int, str, np.generic)):
+        return value
+    else:
+        return copy.deepcopy(value)
+
+def _get_path(blade, path):
+    # blade entry at a key or a tuple of nested keys
+    for k in (path if isinstance(path, tuple) else (path,)):
+        blade = blade[k]
+    return blade
+
+def _set_path(blade, path, value):
+    path = path if isinstance(path, tuple) else (path,)
+    _get_path(blade, path[:-1])[path[-1]] = value
+
 class ReferenceBlade(object):
     def __init__(self):
 
@@ -151,6 +289,9 @@ class ReferenceBlade(object):
 
         # 
         self.user_update_routine = None    # Optional additional routine, provided by user, to modify the blade geometry at the beginning of update()
+
+        # Inputs and outputs of the last run of each update() stage
+        self.memo            = {}
         
 
     def initialize(self, fname_input):
@@ -200,17 +341,37 @@ class ReferenceBlade(object):
         return blade
 
     def update(self, blade):
+        # Each stage is skipped when the parts of the blade it reads are the same
+        # as on the previous call of this instance; its outputs are restored instead
         t1 = time.time()
 
         # Option for user to provide additional logic modifying the blade goemetry, useful for setting properties that change relative to another
         if self.user_update_routine != None:
             blade = self.user_update_routine(blade)
 
-        blade = self.calc_spanwise_grid(blade)
-        blade = self.update_planform(blade)
-        blade = self.remap_profiles(blade, blade['AFref'])
-        blade = self.remap_polars(blade, blade['AFref'])
-        blade = self.calc_composite_bounds(blade)
+        st_key = 'st' if 'st' in blade else 'internal_structure_2d_fem'
+        labels = blade['outer_shape_bem']['airfoil_position']['labels']
+        AFref  = blade['AFref']
+        thk    = [AFref[af]['relative_thickness'] for af in labels]
+
+        blade = self.memoize('calc_spanwise_grid', blade, [st_key],
+            lambda: (blade[st_key], blade['outer_shape_bem']['airfoil_position']['grid'], self.r_in, self.NPTS),
+            self.calc_spanwise_grid)
+        blade = self.memoize('update_planform', blade, ['ctrl_pts', 'pf', 'st'],
+            lambda: (blade['ctrl_pts'], blade['pf'], blade['st'], blade['outer_shape_bem']['airfoil_position'], thk,
+                     self.spar_var, self.te_var, self.NINPUT),
+            self.update_planform)
+        blade = self.memoize('remap_profiles', blade, ['profile', 'profile_spline'],
+            lambda: (blade['pf']['rthick'], labels, [AFref[af]['coordinates'] for af in labels], thk,
+                     self.NPTS, self.NPTS_AfProfile),
+            lambda blade: self.remap_profiles(blade, AFref))
+        blade = self.memoize('remap_polars', blade, ['airfoils_cl', 'airfoils_cd', 'airfoils_cm', 'airfoils_aoa', 'airfoils_Re', ('pf', 'rthick')],
+            lambda: (blade['pf']['rthick'], labels, thk, [(af, AFref[af]['polars']) for af in AFref], self.NPTS, self.apply_stall_delay,
+                     [blade['pf']['s'], blade['pf']['chord'], blade['pf']['r'], blade['config']['tsr']] if self.apply_stall_delay else []),
+            lambda blade: self.remap_polars(blade, AFref))
+        blade = self.memoize('calc_composite_bounds', blade, ['st'],
+            lambda: (blade['profile'], blade['pf'], blade['st'], self.NPTS),
+            self.calc_composite_bounds)
 
         if self.verbose:
             print('Complete: Geometry Update: \t%f s'%(time.time()-t1))
@@ -218,40 +379,46 @@ class ReferenceBlade(object):
         # Conversion
         if self.analysis_level < 3:
             t2 = time.time()
-            blade = self.convert_precomp(blade)
+            precomp = blade.get('precomp', {})
+            blade = self.memoize('convert_precomp', blade, ['precomp'],
+                lambda: (blade['profile'], blade['pf'], blade['st'], precomp.get('materials'), precomp.get('material_dict'),
+                         self.spar_var, self.te_var, self.NPTS),
+                self.convert_precomp)
             if self.verbose:
                 print('Complete: Precomp Conversion: \t%f s'%(time.time()-t2))
 
 
         return blade
 
+    def memoize(self, stage, blade, outputs, inputs, func):
+        # Run func(blade) unless the values returned by inputs() hash the same as
+        # on the last run of this stage; outputs are the blade entries (keys or
+        # key paths) written by the stage, copied so later stages can modify them
+        key  = digest(inputs())
+        last = self.memo.get(stage)
+        if last is not None and last[0] == key:
+            for path, value in zip(outputs, last[1]):
+                _set_path(blade, path, _copy(value))
+            self.s = copy.copy(last[2])
+            if self.verbose:
+                print('Skipped: %s, inputs unchanged' % stage)
+            return blade
+
+        blade = func(blade)
+        self.memo[stage] = (key, [_copy(_get_path(blade, path)) for path in outputs], copy.copy(self.s))
+        return blade
+
     def load_ontology(self, fname_input, validate=False, fname_schema=''):
         """ Load inputs IEA turbine ontology yaml inputs, optional validation """
-        # Read IEA turbine ontology yaml input file
+        # Read IEA turbine ontology yaml input file, numeric lists are returned as arrays.  Validated
+        # inputs are cached, repeated runs on the same files skip parsing and validation
         t_load = time.time()
-        with open(fname_input, 'r') as myfile:
-            inputs = myfile.read()
-
-        # Validate the turbine input with the IEA turbine ontology schema
-        yaml = ry.YAML()
-        if validate:
-            t_validate = time.time()
-
-            with open(fname_schema, 'r') as myfile:
-                schema = myfile.read()
-            json.validate(yaml.load(inputs), yaml.load(schema))
-
-            t_validate = time.time()-t_validate
-            if self.verbose:
-                print('Complete: Schema "%s" validation: \t%f s'%(fname_schema, t_validate))
-        else:
-            t_validate = 0.
+        wt = load_yaml(fname_input, fname_schema=fname_schema if validate else '', arrays=True)
 
         if self.verbose:
-            t_load = time.time() - t_load - t_validate
-            print('Complete: Load Input File: \t%f s'%(t_load))
-        
-        return yaml.load(inputs)
+            print('Complete: Load Input File: \t%f s'%(time.time() - t_load))
+
+        return wt
 
     def write_ontology(self, fname, blade, wt_out):
 
@@ -370,12 +537,19 @@ class ReferenceBlade(object):
             else:
                 wt_out['assembly']['global'][var] = blade_out['config'][var]
 
-        # try:
-        f = open(fname, "w")
+        # The inputs were loaded without comments (see load_ontology), reload the input file with the
+        # ruamel round-trip loader and update it so its comments and formatting are kept in the output
         yaml=ry.YAML()
         yaml.default_flow_style = None
         yaml.width = float("inf")
         yaml.indent(mapping=4, sequence=6, offset=3)
+        wt_out = to_lists(wt_out)
+        if getattr(self, 'fname_input', '') and os.path.isfile(self.fname_input):
+            with open(self.fname_input, 'r') as f:
+                wt_out = update_roundtrip(yaml.load(f), wt_out)
+
+        # try:
+        f = open(fname, "w")
         yaml.dump(wt_out, f)
         # except:
         #     ontology_out_warning = "WARNING! Ontology output write with ruamel.yaml failed.\n Attemping to write with pyyaml.  All file formatting will be lost (comments and dictionary ordering)."
@@ -801,112 +975,41 @@ class ReferenceBlade(object):
 
     def calc_composite_bounds(self, blade):
 
-        #######
-        def calc_axis_intersection(rotation, offset, p_le_d, side, thk=0.):
-            # dimentional analysis that takes a rotation and offset from the pitch axis and calculates the airfoil intersection
-            # rotation
-            offset_x   = offset*np.cos(rotation) + p_le_d[0]
-            offset_y   = offset*np.sin(rotation) + p_le_d[1]
-
-            m_rot      = np.sin(rotation)/np.cos(rotation)       # slope of rotated axis
-            plane_rot  = [m_rot, -1*m_rot*p_le_d[0]+ p_le_d[1]]  # coefficients for rotated axis line: a1*x + a0
-
-            m_intersection     = np.sin(rotation+np.pi/2.)/np.cos(rotation+np.pi/2.)   # slope perpendicular to rotated axis
-            plane_intersection = [m_intersection, -1*m_intersection*offset_x+offset_y] # coefficients for line perpendicular to rotated axis line at the offset: a1*x + a0
-            
-            # intersection between airfoil surface and the line perpendicular to the rotated/offset axis
-            y_intersection = np.polyval(plane_intersection, profile_i[:,0])
-            
-            
-            try:
-                idx_inter      = np.argwhere(np.diff(np.sign(profile_i[:,1] - y_intersection))).flatten() # find closest airfoil surface points to intersection 
-            except:
-                for xi,yi in zip(profile_i[:,0], profile_i[:,1]):
-                    print(xi, yi)
-                print(rotation, offset, p_le_d, side)
-                print('chord', blade['pf']['chord'][i])
-                import matplotlib.pyplot as plt
-                plt.plot(profile_i[:,0], profile_i[:,1])
-                plt.plot(profile_i[:,0], y_intersection)
-                plt.show()
-
-                idx_inter      = np.argwhere(np.diff(np.sign(profile_i[:,1] - y_intersection))).flatten() # find closest airfoil surface points to intersection 
-
-            midpoint_arc = []
-            for sidei in side:
-                if sidei.lower() == 'suction':
-                    tangent_line = np.polyfit(profile_i[idx_inter[0]:idx_inter[0]+2, 0], profile_i[idx_inter[0]:idx_inter[0]+2, 1], 1)
-                elif sidei.lower() == 'pressure':
-                    tangent_line = np.polyfit(profile_i[idx_inter[1]:idx_inter[1]+2, 0], profile_i[idx_inter[1]:idx_inter[1]+2, 1], 1)
-
-                midpoint_x = (tangent_line[1]-plane_intersection[1])/(plane_intersection[0]-tangent_line[0])
-                midpoint_y = plane_intersection[0]*(tangent_line[1]-plane_intersection[1])/(plane_intersection[0]-tangent_line[0]) + plane_intersection[1]
-
-                # convert to arc position
-                if sidei.lower() == 'suction':
-                    x_half = profile_i[:idx_le+1,0]
-                    arc_half = profile_i_arc[:idx_le+1]
-                elif sidei.lower() == 'pressure':
-                    x_half = profile_i[idx_le:,0]
-                    arc_half = profile_i_arc[idx_le:]
-
-                midpoint_arc.append(remap2grid(x_half, arc_half, midpoint_x, spline=interp1d))
-
-            # if len(idx_inter) == 0:
-            # print(blade['pf']['s'][i], blade['pf']['r'][i], blade['pf']['chord'][i], thk)
-            # import matplotlib.pyplot as plt
-            # plt.plot(profile_i[:,0], profile_i[:,1])
-            # plt.axis('equal')
-            # ymin, ymax = plt.gca().get_ylim()
-            # xmin, xmax = plt.gca().get_xlim()
-            # plt.plot(profile_i[:,0], y_intersection)
-            # plt.plot(p_le_d[0], p_le_d[1], '.')
-            # plt.axis([xmin, xmax, ymin, ymax])
-            # plt.show()
-
-            return midpoint_arc
-        ########
-
         # Format profile for interpolation
         profile_d = copy.copy(blade['profile'])
         profile_d[:,0,:] = profile_d[:,0,:] - blade['pf']['p_le'][np.newaxis, :]
         profile_d = np.flip(profile_d*blade['pf']['chord'][np.newaxis, np.newaxis, :], axis=0)
-        
-        LE_loc = np.zeros(self.NPTS)
+
+        # Close the trailing edge, stack all stations in nan padded arrays (station, point)
+        n_af      = profile_d.shape[0] + 2
+        profiles  = np.full((self.NPTS, n_af, 2), np.nan)
+        arcs      = np.full((self.NPTS, n_af), np.nan)
+        n_profile = np.zeros(self.NPTS, dtype=int)
+        idx_les   = np.zeros(self.NPTS, dtype=int)
+        arc_Ls    = np.zeros(self.NPTS)
         for i in range(self.NPTS):
-            profile_i = copy.copy(profile_d[:,:,i])
+            profile_i = profile_d[:,:,i]
             if list(profile_i[-1,:]) != list(profile_i[0,:]):
                 TE = np.mean((profile_i[-1,:], profile_i[0,:]), axis=0)
                 profile_i = np.row_stack((TE, profile_i, TE))
-            idx_le = np.argmin(profile_i[:,0])
             profile_i_arc = arc_length(profile_i[:,0], profile_i[:,1])
-            arc_L = profile_i_arc[-1]
-            profile_i_arc /= arc_L
-            LE_loc[i] = profile_i_arc[idx_le]
-            
 
+            n_profile[i] = len(profile_i)
+            idx_les[i]   = np.argmin(profile_i[:,0])
+            arc_Ls[i]    = profile_i_arc[-1]
+            profiles[i,:n_profile[i],:] = profile_i
+            arcs[i,:n_profile[i]]       = profile_i_arc / arc_Ls[i]
 
-        
-        for i in range(self.NPTS):
-            s_all = []
+        LE_loc = arcs[np.arange(self.NPTS), idx_les]
 
-            profile_i = copy.copy(profile_d[:,:,i])
-            if list(profile_i[-1,:]) != list(profile_i[0,:]):
-                TE = np.mean((profile_i[-1,:], profile_i[0,:]), axis=0)
-                profile_i = np.row_stack((TE, profile_i, TE))
-                # import matplotlib.pyplot as plt
-                # plt.plot(profile_i[:,0], profile_i[:,1])
-                # plt.plot(TE[0], TE[1], 'o')
-                # plt.axis('equal')
-                # plt.title(i)
-                # plt.show()
+        # Layers and webs positioned with a rotation and offset about the pitch axis, their
+        # intersections with the airfoil surfaces are found for all stations at once below:
+        # (type_sec, idx_sec, station, rotation, offset, side, half width)
+        axis_layers = []
 
-            idx_le = np.argmin(profile_i[:,0])
+        for i in range(self.NPTS):
+            arc_L = arc_Ls[i]
 
-            profile_i_arc = arc_length(profile_i[:,0], profile_i[:,1])
-            arc_L = profile_i_arc[-1]
-            profile_i_arc /= arc_L
-            
             # loop through composite layups
             for type_sec, idx_sec, sec in zip(['webs']*len(blade['st']['webs'])+['layers']*len(blade['st']['layers']), list(range(len(blade['st']['webs'])))+list(range(len(blade['st']['layers']))), blade['st']['webs']+blade['st']['layers']):
                 # for idx_sec, sec in enumerate(blade['st'][type_sec]):
@@ -972,7 +1075,6 @@ class ReferenceBlade(object):
                         # layer midpoint definied with a rotation and offset about the pitch axis
                         rotation   = sec['rotation']['values'][i] # radians
                         width      = sec['width']['values'][i]    # meters
-                        p_le_d     = [0., 0.]                     # pitch axis for dimentional profile
                         side       = sec['side']
                         if 'offset_x_pa' in blade['st'][type_sec][idx_sec].keys():
                             offset = sec['offset_x_pa']['values'][i]
@@ -1009,19 +1111,15 @@ class ReferenceBlade(object):
 
                         if side.lower() != 'suction' and side.lower() != 'pressure':
                             warning_invalid_side_value = 'Invalid airfoil value give: side = "%s" for layer = "%s" at r[%d] = %f. Must be set to "suction" or "pressure".'%(side, sec['name'], i, blade['pf']['r'][i])
-                            warnings.warn(warning_invalid_side_value)
+                            raise ValueError(warning_invalid_side_value)
 
-                        midpoint = calc_axis_intersection(rotation, offset, p_le_d, [side], thk=sec['thickness']['values'][i])[0]
-                        
-                        blade['st'][type_sec][idx_sec]['start_nd_arc']['values'][i] = midpoint-width/arc_L/2.
-                        blade['st'][type_sec][idx_sec]['end_nd_arc']['values'][i]   = midpoint+width/arc_L/2.
+                        axis_layers.append((type_sec, idx_sec, i, rotation, offset, ['suction', 'pressure'].index(side.lower()), width/arc_L/2.))
 
                     elif 'rotation' in blade['st'][type_sec][idx_sec].keys():
                         # web defined with a rotation and offset about the pitch axis
                         # if 'fixed' in sec['rotation'].keys():
                         #     sec['rotation']['values']
                         rotation   = sec['rotation']['values'][i] # radians
-                        p_le_d     = [0., 0.]                     # pitch axis for dimentional profile
                         if 'offset_x_pa' in blade['st'][type_sec][idx_sec].keys():
                             offset = sec['offset_x_pa']['values'][i]
                         else:
@@ -1042,7 +1140,7 @@ class ReferenceBlade(object):
                             blade['st'][type_sec][idx_sec]['offset_x_pa']['values'][i] = offset
                             layer_resize_warning = 'WARNING: Layer "%s" may be too large to fit within chord. "offset_x_pa" changed from %f to %f at R=%f (i=%d)'%(sec['name'], offset_old, offset, blade['pf']['r'][i], i)
                             print(layer_resize_warning)
-                        [blade['st'][type_sec][idx_sec]['start_nd_arc']['values'][i], blade['st'][type_sec][idx_sec]['end_nd_arc']['values'][i]] = sorted(calc_axis_intersection(rotation, offset, p_le_d, ['suction', 'pressure']))
+                        axis_layers.append((type_sec, idx_sec, i, rotation, offset, None, 0.))
 
                     elif 'midpoint_nd_arc' in blade['st'][type_sec][idx_sec].keys():
                         # fixed to LE or TE
@@ -1050,7 +1148,7 @@ class ReferenceBlade(object):
                         if blade['st'][type_sec][idx_sec]['midpoint_nd_arc']['fixed'].lower() == 'te' or blade['st'][type_sec][idx_sec]['midpoint_nd_arc']['fixed'].lower() == 'TE':
                             midpoint = 1.
                         elif blade['st'][type_sec][idx_sec]['midpoint_nd_arc']['fixed'].lower() == 'le' or blade['st'][type_sec][idx_sec]['midpoint_nd_arc']['fixed'].lower() == 'LE':
-                            midpoint = profile_i_arc[idx_le]
+                            midpoint = LE_loc[i]
                         else:
                             warning_invalid_side_value = 'Invalid fixed midpoint give: midpoint_nd_arc[fixed] = "%s" for layer = "%s" at r[%d] = %f. Must be set to "LE" or "TE".'%(blade['st'][type_sec][idx_sec]['midpoint_nd_arc']['fixed'], sec['name'], i, blade['pf']['r'][i])
                             warnings.warn(warning_invalid_side_value)
@@ -1080,6 +1178,26 @@ class ReferenceBlade(object):
         
         
         
+        # Intersections of the rotated axes with the airfoil surfaces, a web spans both surfaces
+        station, rotation, offset, side = [], [], [], []
+        first = []
+        for _, _, i, rotation_k, offset_k, side_k, _ in axis_layers:
+            first.append(len(side))
+            for sidei in ([0, 1] if side_k is None else [side_k]):
+                station.append(i)
+                rotation.append(rotation_k)
+                offset.append(offset_k)
+                side.append(sidei)
+        midpoint_arc = calc_axis_intersections(profiles, n_profile, idx_les, arcs, station, rotation, offset, side)
+
+        for (type_sec, idx_sec, i, _, _, side_k, half_width), k in zip(axis_layers, first):
+            if side_k is None:
+                start, end = sorted(midpoint_arc[k:k+2])
+            else:
+                start, end = midpoint_arc[k]-half_width, midpoint_arc[k]+half_width
+            blade['st'][type_sec][idx_sec]['start_nd_arc']['values'][i] = start
+            blade['st'][type_sec][idx_sec]['end_nd_arc']['values'][i]   = end
+
         # Set any end points that are fixed to other sections, loop through composites again
         for idx_sec, sec in enumerate(blade['st']['layers']):
             if 'fixed' in blade['st']['layers'][idx_sec]['start_nd_arc'].keys():
@@ -356,9 +356,10 @@ class RotorWithpBEAM(ExplicitComponent):
         self.sa = np.sin(alpha)
 
 
-    def strain(self, blade, xu, yu, xl, yl):
+    def strain(self, loads, xu, yu, xl, yl):
 
-        Vx, Vy, Fz, Mx, My, Tz = blade.shearAndBending()
+        # loads: (Vx, Vy, Fz, Mx, My, Tz) from shearAndBending
+        Vx, Vy, Fz, Mx, My, Tz = loads
 
         # use profile c.s. to use Hansen's notation
         Vx, Vy = Vy, Vx
@@ -463,16 +464,16 @@ class RotorWithpBEAM(ExplicitComponent):
         p_base = _pBEAM.BaseData(np.ones(6), 1.0)  # rigid base
 
 
-        # ----- tip deflection -----
-
-        # evaluate displacements
-        p_loads = _pBEAM.Loads(nsec, Px_defl, Py_defl, Pz_defl)
-        blade = _pBEAM.Beam(p_section, p_loads, p_tip, p_base)
-        dx_defl, dy_defl, dz_defl, dtheta_r1, dtheta_r2, dtheta_z = blade.displacement()
+        # ----- deflection and strain load cases, one stiffness factorization -----
+        blade = _pBEAM.Beam(p_section, _pBEAM.Loads(nsec), p_tip, p_base)
+        p_cases = _pBEAM.LoadCases(nsec, np.vstack((Px_defl, Px_pc_defl, Px_strain)),
+                                   np.vstack((Py_defl, Py_pc_defl, Py_strain)),
+                                   np.vstack((Pz_defl, Pz_pc_defl, Pz_strain)))
+        dx, dy, dz, dtheta_r1, dtheta_r2, dtheta_z, Vx, Vy, Fz, Mx, My, Tz = blade.loadCases(p_cases)
 
-        p_loads = _pBEAM.Loads(nsec, Px_pc_defl, Py_pc_defl, Pz_pc_defl)
-        blade = _pBEAM.Beam(p_section, p_loads, p_tip, p_base)
-        dx_pc_defl, dy_pc_defl, dz_pc_defl, dtheta_r1, dtheta_r2, dtheta_z = blade.displacement()
+        # ----- tip deflection -----
+        dx_defl, dy_defl, dz_defl = dx[0], dy[0], dz[0]
+        dx_pc_defl, dy_pc_defl, dz_pc_defl = dx[1], dy[1], dz[1]
 
 
         # --- mass ---
@@ -487,13 +488,11 @@ class RotorWithpBEAM(ExplicitComponent):
         # ----- strain -----
         self.principalCS(inputs['EIyy'], inputs['EIxx'], inputs['y_ec'], inputs['x_ec'], inputs['EA'], inputs['EIxy'])
 
-        p_loads = _pBEAM.Loads(nsec, Px_strain, Py_strain, Pz_strain)
-
-        blade = _pBEAM.Beam(p_section, p_loads, p_tip, p_base)
+        loads_strain = (Vx[2], Vy[2], Fz[2], Mx[2], My[2], Tz[2])
 
-        strainU_spar, strainL_spar = self.strain(blade, xu_strain_spar, yu_strain_spar, xl_strain_spar, yl_strain_spar)
+        strainU_spar, strainL_spar = self.strain(loads_strain, xu_strain_spar, yu_strain_spar, xl_strain_spar, yl_strain_spar)
 
-        strainU_te, strainL_te = self.strain(blade, xu_strain_te, yu_strain_te, xl_strain_te, yl_strain_te)
+        strainU_te, strainL_te = self.strain(loads_strain, xu_strain_te, yu_strain_te, xl_strain_te, yl_strain_te)
 
         damageU_spar, damageL_spar = self.damage(Mx_damage, My_damage, xu_strain_spar, yu_strain_spar, xl_strain_spar, yl_strain_spar,
                                                  emax=strain_ult_spar, eta=gamma_fatigue, m=m_damage, N=N_damage)
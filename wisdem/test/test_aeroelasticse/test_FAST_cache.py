@@ -0,0 +1,147 @@
+import os
+import shutil
+import tempfile
+import unittest
+import functools
+import numpy as np
+
+from wisdem.aeroelasticse.FAST_cache import FASTCache, _post_name
+from wisdem.aeroelasticse.runFAST_pywrapper import runFAST_pywrapper
+
+
+def post_max(FAST_Output):
+    return 1.
+
+def post_min(FAST_Output):
+    return 0.
+
+def make_post(channel):
+    def post(FAST_Output):
+        return channel
+    return post
+
+def post_channel(FAST_Output, channel='RootMyb1'):
+    return channel
+
+class ChannelPost(object):
+    def __init__(self, channel):
+        self.channel = channel
+    def max(self, FAST_Output):
+        return self.channel
+
+class Writer(object):
+    # stands in for the input writer of an already set up case
+    def __init__(self, fst_vt):
+        self.fst_vt = fst_vt
+
+
+class TestFASTCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp   = tempfile.mkdtemp()
+        self.cache = FASTCache(os.path.join(self.tmp, 'cache'), keep_outb=True)
+
+        self.discon = os.path.join(self.tmp, 'DISCON.IN')
+        with open(self.discon, 'w') as f:
+            f.write('1 ! F_LPFType\n')
+
+        self.fst_vt = {'Fst': {'TMax': 10., 'EDFile': 'case1_ElastoDyn.dat'},
+                       'ElastoDyn': {'BlPitch1': 0., 'TipRad': np.array([63.])},
+                       'ServoDyn': {'DLL_InFile': 'DISCON.IN'}}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def testKey(self):
+        key = self.cache.key(self.fst_vt, FAST_ver='OpenFAST', FAST_directory=self.tmp)
+        self.assertEqual(key, self.cache.key(dict(self.fst_vt), FAST_ver='openfast', FAST_directory=self.tmp))
+        self.assertNotEqual(key, self.cache.key(self.fst_vt, FAST_ver='FAST7', FAST_directory=self.tmp))
+
+        # Input values change the key, file names the writers regenerate don't
+        self.fst_vt['ElastoDyn']['BlPitch1'] = 1.
+        key1 = self.cache.key(self.fst_vt, FAST_ver='OpenFAST', FAST_directory=self.tmp)
+        self.assertNotEqual(key, key1)
+
+        self.fst_vt['Fst']['EDFile'] = 'case2_ElastoDyn.dat'
+        self.assertEqual(key1, self.cache.key(self.fst_vt, FAST_ver='OpenFAST', FAST_directory=self.tmp))
+
+        # So do the contents of referenced files
+        with open(self.discon, 'a') as f:
+            f.write('0 ! F_NotchType\n')
+        self.assertNotEqual(key1, self.cache.key(self.fst_vt, FAST_ver='OpenFAST', FAST_directory=self.tmp))
+
+    def testLoadStore(self):
+        key = self.cache.key(self.fst_vt)
+        self.assertEqual(self.cache.load(key, post_max), (False, None))
+
+        self.cache.store(key, post_max, {'mean': 1.})
+        self.assertEqual(self.cache.load(key, post_max), (True, {'mean': 1.}))
+        self.assertEqual(self.cache.load(key, post_min), (False, None))
+
+    def testPostName(self):
+        # post-processors with the same name but a different code or configuration get their own entry
+        posts = [post_max, post_min, lambda out: 1., lambda out: 2.,
+                 make_post('RootMyb1'), make_post('TwrBsMyt'),
+                 ChannelPost('RootMyb1').max, ChannelPost('TwrBsMyt').max,
+                 functools.partial(post_channel, channel='TwrBsMyt'), post_channel]
+        names = [_post_name(post) for post in posts]
+        self.assertEqual(len(set(names)), len(posts))
+
+        # and the same one when rebuilt identically
+        self.assertEqual(_post_name(make_post('RootMyb1')), names[4])
+        self.assertEqual(_post_name(ChannelPost('TwrBsMyt').max), names[7])
+        self.assertEqual(_post_name(functools.partial(post_channel, channel='TwrBsMyt')), names[8])
+
+    def testRestore(self):
+        key  = self.cache.key(self.fst_vt)
+        outb = os.path.join(self.tmp, 'case1.outb')
+        with open(outb, 'wb') as f:
+            f.write(b'outb')
+
+        restored = os.path.join(self.tmp, 'run', 'case1.outb')
+        self.assertFalse(self.cache.restore(key, restored))
+        self.cache.store(key, None, None, outb)
+        self.assertTrue(self.cache.restore(key, restored))
+        with open(restored, 'rb') as f:
+            self.assertEqual(f.read(), b'outb')
+
+        self.assertFalse(FASTCache(self.cache.cache_dir).restore(key, restored))
+
+    def testExecuteRestore(self):
+        key  = self.cache.key(self.fst_vt, 'openfast', 'OpenFAST')
+        outb = os.path.join(self.tmp, 'case1.outb')
+        with open(outb, 'wb') as f:
+            f.write(b'outb')
+        self.cache.store(key, None, None, outb)
+
+        fast = runFAST_pywrapper(FAST_ver='OpenFAST', FAST_exe='openfast', FAST_runDirectory=os.path.join(self.tmp, 'run'),
+                                 FAST_namingOut='case2', cache=self.cache)
+        FAST_Output = fast.execute(Writer(self.fst_vt))
+        self.assertTrue(fast.restored)
+        self.assertEqual(FAST_Output, os.path.join(self.tmp, 'run', 'case2.outb'))
+        self.assertTrue(os.path.exists(FAST_Output))
+
+    def testEvict(self):
+        keys = []
+        for i in range(3):
+            self.fst_vt['ElastoDyn']['BlPitch1'] = float(i)
+            keys.append(self.cache.key(self.fst_vt))
+            self.cache.store(keys[-1], post_max, np.zeros(100))
+            os.utime(os.path.join(self.cache.cache_dir, keys[-1]), (i, i))
+
+        # Loading marks an entry as recently used
+        self.assertTrue(self.cache.load(keys[0], post_max)[0])
+
+        size = sum(os.path.getsize(os.path.join(self.cache.cache_dir, keys[2], f)) for f in os.listdir(os.path.join(self.cache.cache_dir, keys[2])))
+        self.cache.max_size = 2*size
+        self.cache.evict()
+        self.assertEqual(sorted(os.listdir(self.cache.cache_dir)), sorted([keys[0], keys[2]]))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestFASTCache))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,137 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+
+from wisdem.aeroelasticse.FAST_post import StreamingStats, RainflowCounter, aggregate_stats
+from wisdem.aeroelasticse.runFAST_pywrapper import runFAST_pywrapper_batch
+
+
+def reference_rainflow(x, m):
+    # damage sum of a whole signal: ASTM E1049 three point count of its reversals
+    x   = x[np.concatenate(([True], np.diff(x) != 0.))]
+    rev = [x[0]] + [x[i] for i in range(1, x.size-1) if (x[i]-x[i-1]) * (x[i+1]-x[i]) < 0.] + [x[-1]]
+
+    damage = 0.
+    stack  = []
+    for r in rev:
+        stack.append(r)
+        while len(stack) >= 3 and abs(stack[-1] - stack[-2]) >= abs(stack[-2] - stack[-3]):
+            Y = abs(stack[-2] - stack[-3])
+            if len(stack) == 3:
+                damage += 0.5 * Y**m
+                del stack[0]
+            else:
+                damage += Y**m
+                del stack[-3:-1]
+    return damage + 0.5 * np.sum(np.abs(np.diff(stack))**m)
+
+def stream(data, blocks, **kwargs):
+    # StreamingStats of data, added in the given blocks of time steps
+    time  = 0.1 * np.arange(data.shape[0])
+    stats = StreamingStats(['a', 'b'], **kwargs)
+    for k in np.split(np.arange(data.shape[0]), blocks):
+        stats.update(time[k], data[k])
+    stats.finalize()
+    return stats
+
+
+class TestRainflowCounter(unittest.TestCase):
+
+    def testASTM(self):
+        # ASTM E1049 example: ranges 3, 4, 6, 8, 9 counted 0.5, 1.5, 0.5, 1, 0.5 times
+        x = np.array([-2., 1., -3., 5., -1., 3., -4., 4., -2.])
+        for m in [1., 3.]:
+            rainflow = RainflowCounter(m)
+            rainflow.update(x)
+            rainflow.finalize()
+            self.assertAlmostEqual(rainflow.damage, 0.5*3**m + 1.5*4**m + 0.5*6**m + 8**m + 0.5*9**m)
+
+    def testBlocks(self):
+        x = np.cumsum(np.random.RandomState(0).randn(5000))
+        for blocks in [[], [1, 2, 3], [1000, 1001, 2500, 4999], range(7, 5000, 7)]:
+            rainflow = RainflowCounter(4.)
+            for block in np.split(x, blocks):
+                rainflow.update(block)
+            rainflow.finalize()
+            self.assertAlmostEqual(rainflow.damage / reference_rainflow(x, 4.), 1., 12)
+
+
+class TestStreamingStats(unittest.TestCase):
+
+    def setUp(self):
+        rng       = np.random.RandomState(1)
+        self.data = np.c_[10. + 2.*rng.randn(4000), np.cumsum(rng.randn(4000))]
+
+    def testMoments(self):
+        stats = stream(self.data, [1, 500, 1700]).stats()
+        for k, chan in enumerate(['a', 'b']):
+            self.assertAlmostEqual(stats[chan]['mean'], np.mean(self.data[:,k]))
+            self.assertAlmostEqual(stats[chan]['std'], np.std(self.data[:,k]))
+            self.assertEqual(stats[chan]['min'], np.min(self.data[:,k]))
+            self.assertEqual(stats[chan]['max'], np.max(self.data[:,k]))
+            self.assertEqual(stats[chan]['absmax'], np.max(np.abs(self.data[:,k])))
+
+    def testPercentiles(self):
+        q     = [1., 10., 50., 90., 99.]
+        stats = stream(self.data, [100, 2000], percentiles=q)
+        for k, chan in enumerate(['a', 'b']):
+            # within a couple of histogram bins
+            span = np.ptp(self.data[:,k])
+            npt.assert_allclose([stats.stats()[chan]['percentiles'][p] for p in q],
+                                np.percentile(self.data[:,k], q), atol=4.*span/stats.nbins)
+
+    def testDEL(self):
+        stats = stream(self.data, [1000], DEL={'b': 10.}, f_eq=0.5)
+        self.assertAlmostEqual(stats.time, 400.)
+        self.assertAlmostEqual(stats.stats()['b']['DEL'], (reference_rainflow(self.data[:,1], 10.) / 200.)**0.1)
+        self.assertNotIn('DEL', stats.stats()['a'])
+
+    def testAggregate(self):
+        q     = [5., 50., 95.]
+        cases = [self.data[:1500], self.data[1500:1600], self.data[1600:]]
+        total = aggregate_stats([stream(x, [50], percentiles=q) for x in cases]).stats()
+        whole = stream(self.data, [], percentiles=q).stats()
+        for chan in ['a', 'b']:
+            for s in ['mean', 'std', 'min', 'max']:
+                self.assertAlmostEqual(total[chan][s], whole[chan][s])
+            span = np.ptp(self.data[:,['a', 'b'].index(chan)])
+            npt.assert_allclose([total[chan]['percentiles'][p] for p in q],
+                                [whole[chan]['percentiles'][p] for p in q], atol=8.*span/1024)
+
+    def testCollectOrder(self):
+        # the aggregate does not depend on the order in which the cases finish
+        batch = runFAST_pywrapper_batch(case_list=[{}]*4, case_name_list=['c%d' % i for i in range(4)], aggregate=True)
+        cases = [self.data[:100], self.data[100:1000], self.data[1000:1003], self.data[1003:]]
+
+        total = {}
+        for order in [[0, 1, 2, 3], [3, 1, 0, 2]]:
+            total[tuple(order)] = batch.collect((i, 1., stream(cases[i], [])) for i in order).stats()
+        self.assertEqual(total[(0, 1, 2, 3)], total[(3, 1, 0, 2)])
+
+    def testCasesUnchanged(self):
+        # merging leaves the per-case results, and their DELs, as they were
+        kept  = {}
+        batch = runFAST_pywrapper_batch(case_list=[{}]*3, case_name_list=['c%d' % i for i in range(3)], aggregate=True,
+                                        callback=lambda name, out: kept.setdefault(name, out))
+        cases = [self.data[:1000], self.data[1000:1500], self.data[1500:]]
+        DEL   = {'b': 10.}
+        before = [stream(x, [], DEL=DEL).stats() for x in cases]
+        total  = batch.collect((i, 1., stream(cases[i], [], DEL=DEL)) for i in range(3))
+        self.assertNotIn(total, kept.values())
+        for i in range(3):
+            self.assertEqual(kept['c%d' % i].stats(), before[i])
+
+        stats = [stream(x, [], DEL=DEL) for x in cases]
+        aggregate_stats(stats).merge(stream(self.data, [], DEL=DEL))
+        for s, b in zip(stats, before):
+            self.assertEqual(s.stats(), b)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestRainflowCounter))
+    suite.addTest(unittest.makeSuite(TestStreamingStats))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import numpy.testing as npt
+
+from wisdem.aeroelasticse.Util.ReadFASTout import ReadFASToutFormat, ReadFASTbinary, ReadFASTbinaryChunks
+from wisdem.aeroelasticse.FAST_post import return_stats
+
+
+def write_outb(fname, FileID, time, data, names, units, DescStr='Synthetic FAST output'):
+    # pack data (NT, channels) to int16 and write an .outb file, FileID 1 (packed time) or 2 (uniform time)
+    NT, nchan = data.shape
+    ColScl = (65535. / np.maximum(np.ptp(data, axis=0), 1e-6)).astype(np.float32)
+    ColOff = (-32768. - np.min(data, axis=0)*ColScl).astype(np.float32)
+    packed = np.clip(np.round(data*ColScl + ColOff), -32768, 32767).astype(np.int16)
+
+    with open(fname, 'wb') as f:
+        np.array([FileID], np.int16).tofile(f)
+        np.array([nchan, NT], np.int32).tofile(f)
+        if FileID == 1:
+            TimeScl = 2.**31 / (time[-1] - time[0])
+            TimeOff = -2.**30 - time[0]*TimeScl
+            np.array([TimeScl, TimeOff], np.float64).tofile(f)
+        else:
+            np.array([time[0], time[1] - time[0]], np.float64).tofile(f)
+        ColScl.tofile(f)
+        ColOff.tofile(f)
+        np.array([len(DescStr)], np.int32).tofile(f)
+        f.write(DescStr.encode())
+        f.write(''.join('%-10s' % s for s in names).encode())
+        f.write(''.join('%-10s' % s for s in units).encode())
+        if FileID == 1:
+            np.round(time*TimeScl + TimeOff).astype(np.int32).tofile(f)
+        packed.tofile(f)
+
+    # the values a reader should recover
+    return (packed - ColOff.astype(np.float64)) / ColScl.astype(np.float64)
+
+
+class TestReadFASTout(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp   = tempfile.mkdtemp()
+        rng        = np.random.RandomState(0)
+        self.time  = 0.0125*np.arange(2001)
+        self.data  = np.c_[8. + rng.randn(2001), 1e3*np.sin(self.time), -5.*np.ones(2001) + 1e-3*rng.randn(2001)]
+        self.names = ['Time', 'Wind1VelX', 'RootMyc1', 'BldPitch1']
+        self.units = ['(s)', '(m/s)', '(kN-m)', '(deg)']
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def testRoundTrip(self):
+        for FileID in [1, 2]:
+            fname  = os.path.join(self.tmp, 'case%d.outb' % FileID)
+            values = write_outb(fname, FileID, self.time, self.data, self.names, self.units)
+
+            Channels, ChanName, ChanUnit, FileID_out, DescStr = ReadFASTbinary(fname)
+            self.assertEqual(FileID_out, FileID)
+            self.assertEqual(ChanName, self.names)
+            self.assertEqual(ChanUnit, self.units)
+            self.assertEqual(DescStr, 'Synthetic FAST output')
+            npt.assert_allclose(Channels[:,0], self.time, atol=1e-6)
+            npt.assert_allclose(Channels[:,1:], values, rtol=1e-12)
+            self.assertTrue(np.all(np.abs(Channels[:,1:] - self.data) <= 1e-4*np.ptp(self.data, axis=0)))
+
+            # Selected channels, in blocks
+            blocks, ChanName, ChanUnit, _, _ = ReadFASTbinaryChunks(fname, OutList=['RootMyc1', 'Wind1VelX'], ChunkSize=300)
+            blocks = list(blocks)
+            self.assertEqual(len(blocks), 7)
+            self.assertEqual(ChanName, ['Time', 'RootMyc1', 'Wind1VelX'])
+            npt.assert_array_equal(np.concatenate(blocks), Channels[:, [0, 2, 1]])
+
+            data, meta = ReadFASToutFormat(fname, 2)
+            self.assertEqual(meta['FileID'], FileID)
+            self.assertEqual(meta['units']['RootMyc1'], '(kN-m)')
+            npt.assert_array_equal(data['BldPitch1'], Channels[:,3])
+
+            stats = return_stats(fname, ChunkSize=500)
+            self.assertEqual(sorted(stats.keys()), sorted(self.names))
+            self.assertAlmostEqual(stats['Time']['max'], Channels[-1,0])
+            self.assertAlmostEqual(stats['RootMyc1']['std'], np.std(Channels[:,2]))
+
+    def testMissingChannel(self):
+        fname = os.path.join(self.tmp, 'case.outb')
+        write_outb(fname, 2, self.time, self.data, self.names, self.units)
+        with self.assertRaises(ValueError):
+            ReadFASTbinary(fname, OutList=['GenPwr'])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestReadFASTout))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,137 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import numpy as np
+import numpy.testing as npt
+
+from wisdem.aeroelasticse.Util.TurbSimBTS import TurbSimBTS, ScaledView, WriteTurbSimBTS
+
+
+class TestTurbSimBTS(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        rng      = np.random.RandomState(0)
+        self.velocity = rng.randn(50, 3, 4, 5) + np.array([10., 0., 0.])[:, np.newaxis, np.newaxis]
+        self.tower    = rng.randn(50, 3, 2)
+        self.velocity[:, 2, 0, 0] = 4.     # extremes of w on the grid, of u on the tower
+        self.tower[:, 0, 1]       = 15.
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, velocity, **kwargs):
+        fname = os.path.join(self.tmp, name)
+        WriteTurbSimBTS(fname, velocity, 0.05, 10., 8., 70., 90., 10., DescStr='Test field', **kwargs)
+        return TurbSimBTS(fname)
+
+    def testRoundTrip(self):
+        bts = self.write('grid.bts', self.velocity, tower=self.tower, ChunkSize=7)
+
+        self.assertEqual((bts.FileID, bts.nt, bts.ny, bts.nz, bts.ntwr), (7, 50, 4, 5, 2))
+        self.assertFalse(bts.periodic)
+        self.assertEqual(bts.DescStr, 'Test field')
+        self.assertAlmostEqual(bts.dt, 0.05)
+        self.assertEqual((bts.dy, bts.dz, bts.z1, bts.zHub, bts.uHub), (10., 8., 70., 90., 10.))
+        npt.assert_allclose(bts.y, [-15., -5., 5., 15.])
+        npt.assert_allclose(bts.z, [70., 78., 86., 94., 102.])
+
+        # each component spans the full integer range, grid and tower together
+        vmin = np.minimum(self.velocity.min(axis=(0, 2, 3)), self.tower.min(axis=(0, 2)))
+        vmax = np.maximum(self.velocity.max(axis=(0, 2, 3)), self.tower.max(axis=(0, 2)))
+        npt.assert_allclose(bts.Vslope, 65535./(vmax - vmin), rtol=1e-6)
+        npt.assert_allclose(bts.Voffset, -32768. - bts.Vslope*vmin, rtol=1e-6)
+
+        tol = (vmax - vmin)/65535.
+        self.assertEqual(bts.velocity.shape, self.velocity.shape)
+        self.assertEqual(bts.tower.shape, self.tower.shape)
+        for k in range(3):
+            self.assertLessEqual(np.max(np.abs(bts.velocity[:, k] - self.velocity[:, k])), tol[k])
+            self.assertLessEqual(np.max(np.abs(bts.tower[:, k] - self.tower[:, k])), tol[k])
+        self.assertAlmostEqual(bts.velocity[3, 2, 0, 0], 4., 3)
+
+    def testScaledView(self):
+        bts = self.write('grid.bts', self.velocity)
+        full = np.asarray(bts.velocity)
+        npt.assert_array_equal(full, (bts.velocity.raw - bts.Voffset[:, np.newaxis, np.newaxis]) / bts.Vslope[:, np.newaxis, np.newaxis])
+        npt.assert_array_equal(bts.velocity[10:20, 1], full[10:20, 1])
+        npt.assert_array_equal(bts.velocity[:, :, [3, 0], 2], full[:, :, [3, 0], 2])
+        self.assertEqual(bts.velocity[5, 0, 1, 1], full[5, 0, 1, 1])
+        self.assertEqual(len(bts.velocity), 50)
+        self.assertEqual(bts.velocity.ndim, 4)
+
+        view = ScaledView(np.arange(12, dtype=np.int16).reshape(2, 3, 2), [2., 4., 8.], [0., 4., -8.])
+        npt.assert_array_equal(view[1], [[3., 3.5], [1., 1.25], [2.25, 2.375]])
+
+        # bilinear interpolation between grid points, and the hub point
+        npt.assert_allclose(bts.point(0., 82.), 0.25*(full[:, :, 1, 1] + full[:, :, 2, 1] + full[:, :, 1, 2] + full[:, :, 2, 2]), rtol=1e-5)
+        npt.assert_allclose(bts.hub(), 0.25*(full[:, :, 1, 2] + full[:, :, 2, 2] + full[:, :, 1, 3] + full[:, :, 2, 3]), rtol=1e-5)
+        with self.assertRaises(ValueError):
+            bts.point(0., 110.)
+
+    def testRewrite(self):
+        # writing a read field again, in blocks, reproduces the stored integers
+        bts  = self.write('grid.bts', self.velocity, tower=self.tower)
+        bts2 = self.write('copy.bts', bts.velocity, tower=bts.tower, periodic=True, ChunkSize=3)
+        self.assertTrue(bts2.periodic)
+        npt.assert_array_equal(bts2.velocity.raw, bts.velocity.raw)
+        npt.assert_array_equal(bts2.tower.raw, bts.tower.raw)
+
+        # a constant component keeps unit scaling
+        velocity = self.velocity.copy()
+        velocity[:, 1] = 0.
+        bts = self.write('const.bts', velocity)
+        self.assertEqual(bts.Vslope[1], 1.)
+        npt.assert_allclose(bts.velocity[:, 1], 0., atol=1.)
+
+    def testFileLayout(self):
+        # a file packed field by field as TurbSim writes it: slope and offset interleaved per component,
+        # the grid with z slowest and the component fastest, then the tower points
+        nt, ny, nz, ntwr = 2, 2, 3, 1
+        Vslope  = [100., 200., 300.]
+        Voffset = [-1000., 0., 10.]
+        desc    = b'Generated by TurbSim'
+        raw  = np.arange(nt*3*(ny*nz + ntwr), dtype='<i2') - 20
+        fname = os.path.join(self.tmp, 'turbsim.bts')
+        with open(fname, 'wb') as f:
+            f.write(struct.pack('<h4i6f', 7, nz, ny, ntwr, nt, 8., 10., 0.05, 11.4, 90., 82.))
+            for k in range(3):
+                f.write(struct.pack('<2f', Vslope[k], Voffset[k]))
+            f.write(struct.pack('<i', len(desc)) + desc)
+            f.write(raw.tobytes())
+
+        bts = TurbSimBTS(fname)
+        self.assertEqual((bts.nt, bts.ny, bts.nz, bts.ntwr, bts.zHub, bts.z1), (nt, ny, nz, ntwr, 90., 82.))
+        self.assertEqual(bts.DescStr, 'Generated by TurbSim')
+        npt.assert_array_equal(bts.Vslope, Vslope)
+        npt.assert_array_equal(bts.Voffset, Voffset)
+
+        ip = 0
+        for it in range(nt):
+            for iz in range(nz):
+                for iy in range(ny):
+                    for k in range(3):
+                        self.assertAlmostEqual(bts.velocity[it, k, iy, iz], (raw[ip] - Voffset[k])/Vslope[k], 6)
+                        ip += 1
+            for k in range(3):
+                self.assertAlmostEqual(bts.tower[it, k, 0], (raw[ip] - Voffset[k])/Vslope[k], 6)
+                ip += 1
+
+        # the writer produces the same header layout
+        bts2 = self.write('rewrite.bts', bts.velocity, tower=bts.tower)
+        with open(os.path.join(self.tmp, 'rewrite.bts'), 'rb') as f:
+            pairs = struct.unpack('<6f', f.read(70)[42:66])
+        npt.assert_array_equal(pairs[0::2], bts2.Vslope)
+        npt.assert_array_equal(pairs[1::2], bts2.Voffset)
+        npt.assert_allclose(bts2.velocity[...], bts.velocity[...], atol=1e-3)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestTurbSimBTS))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
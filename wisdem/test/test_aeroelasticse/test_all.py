@@ -0,0 +1,23 @@
+import unittest
+
+from wisdem.test.test_aeroelasticse import test_FAST_cache
+from wisdem.test.test_aeroelasticse import test_FAST_post
+from wisdem.test.test_aeroelasticse import test_pyVeers
+from wisdem.test.test_aeroelasticse import test_ReadFASTout
+from wisdem.test.test_aeroelasticse import test_runFAST_pywrapper
+from wisdem.test.test_aeroelasticse import test_TurbSimBTS
+
+
+def suite():
+    suite = unittest.TestSuite( (test_FAST_cache.suite(),
+                                 test_FAST_post.suite(),
+                                 test_pyVeers.suite(),
+                                 test_ReadFASTout.suite(),
+                                 test_runFAST_pywrapper.suite(),
+                                 test_TurbSimBTS.suite(),
+    ) )
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
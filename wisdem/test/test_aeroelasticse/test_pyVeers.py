@@ -0,0 +1,94 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import numpy as np
+import numpy.testing as npt
+
+from wisdem.aeroelasticse.pyVeers import VeersTurbulence
+
+
+class TestVeersTurbulence(unittest.TestCase):
+
+    def setUp(self):
+        self.turb  = VeersTurbulence(10., 1.8, 42., 90., 0.2, 5, 5, 40., 40., 0.25, 400.)
+        self.seeds = list(range(1, 9))
+        self.v     = list(self.turb.generate(self.seeds))
+
+    def coherence(self, v, i, p, q, band):
+        # magnitude coherence of component i between grid points p and q, over seeds and a band of frequencies
+        X = [np.fft.rfft(vs[:, i].reshape(self.turb.nt, -1), axis=0)[band] for vs in v]
+        X = np.concatenate(X)
+        return np.abs(np.mean(X[:, p]*np.conj(X[:, q]))) / np.sqrt(np.mean(np.abs(X[:, p])**2)*np.mean(np.abs(X[:, q])**2))
+
+    def testHub(self):
+        # hub point (2, 2): target standard deviations and mean wind speed
+        for v in self.v:
+            self.assertEqual(v.shape, (self.turb.nt, 3, 5, 5))
+            npt.assert_allclose(np.std(v[:, :, 2, 2], axis=0), 1.8*np.array([1., 0.8, 0.5]))
+            npt.assert_allclose(np.mean(v[:, :, 2, 2], axis=0), [10., 0., 0.], atol=1e-6)
+
+            # power law profile at the top and bottom of the grid
+            npt.assert_allclose(np.mean(v[:, 0, 2, [0, -1]], axis=0), 10.*(np.array([70., 110.])/90.)**0.2, atol=1e-6)
+
+    def testCoherence(self):
+        # hub and the point 10 m to its side, IEC exponential coherence of u only
+        hub, side = 12, 17
+        r = 10.
+        for f0, f1 in [(0.05, 0.15), (0.2, 0.4)]:
+            band  = np.arange(int(f0/self.turb.df), int(f1/self.turb.df))
+            f     = band*self.turb.df
+            coh_u = self.coherence(self.v, 0, hub, side, band)
+            iec   = np.mean(np.exp(-12.*np.sqrt((f*r/10.)**2 + (0.12*r/self.turb.Lc)**2)))
+            self.assertAlmostEqual(coh_u, iec, delta=0.1)
+            for i in [1, 2]:
+                self.assertLess(self.coherence(self.v, i, hub, side, band), 0.15)
+
+        self.assertGreater(self.coherence(self.v, 0, hub, side, np.arange(2, 20)),
+                           self.coherence(self.v, 0, hub, side, np.arange(100, 200)) + 0.2)
+
+        turb = VeersTurbulence(10., 1.8, 42., 90., 0.2, 5, 5, 40., 40., 0.25, 400., coherent_vw=True)
+        v    = list(turb.generate(self.seeds))
+        band = np.arange(2, 20)
+        self.assertAlmostEqual(self.coherence(v, 2, hub, side, band), self.coherence(v, 0, hub, side, band), delta=0.1)
+
+    def testBlocking(self):
+        # the same fields whatever the frequency blocks and seed batches
+        npt.assert_allclose(next(self.turb.generate([3], FreqBlock=7)), self.v[2], rtol=1e-5, atol=1e-5)
+        npt.assert_allclose(list(self.turb.generate([4, 5], FreqBlock=1000))[1], self.v[4], rtol=1e-5, atol=1e-5)
+
+    def testWriteBTS(self):
+        # header bytes in the TurbSim layout and the decoded hub height time series
+        tmp = tempfile.mkdtemp()
+        try:
+            fnames = [os.path.join(tmp, 'seed%d.bts' % i) for i in self.seeds[:2]]
+            self.turb.write_bts(fnames, self.seeds[:2])
+            for fname, v in zip(fnames, self.v):
+                with open(fname, 'rb') as f:
+                    header = struct.unpack('<h4i6f6fi', f.read(70))
+                    desc   = f.read(header[-1])
+                    raw    = np.frombuffer(f.read(), dtype='<i2').reshape(self.turb.nt, 5, 5, 3)
+                self.assertEqual(header[:5], (7, 5, 5, 0, self.turb.nt))
+                npt.assert_allclose(header[5:11], [10., 10., 0.25, 10., 90., 70.], rtol=1e-6)
+                self.assertEqual(desc, b'Generated by pyVeers')
+
+                # slope and offset of each component in pairs, spanning the component range
+                slope, offset = np.array(header[11:17:2]), np.array(header[12:17:2])
+                vmin, vmax    = v.min(axis=(0, 2, 3)), v.max(axis=(0, 2, 3))
+                npt.assert_allclose(slope, 65535./(vmax - vmin), rtol=1e-5)
+                npt.assert_allclose(offset, -32768. - slope*vmin, rtol=1e-5, atol=1e-2)
+
+                hub = (raw[:, 2, 2, :] - offset)/slope
+                npt.assert_allclose(hub, v[:, :, 2, 2], atol=np.max((vmax - vmin)/65535.))
+        finally:
+            shutil.rmtree(tmp)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestVeersTurbulence))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
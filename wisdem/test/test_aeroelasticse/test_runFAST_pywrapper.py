@@ -0,0 +1,33 @@
+import unittest
+
+from wisdem.aeroelasticse.runFAST_pywrapper import runFAST_pywrapper_batch
+
+
+class TestSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.batch = runFAST_pywrapper_batch(fst_vt={'Fst': {'TMax': 60.}, 'InflowWind': {'WindType': 1}})
+        self.batch.case_list      = [{}, {('Fst', 'TMax'): 600.}, {('InflowWind', 'WindType'): 3}, {('Fst', 'TMax'): 10.}]
+        self.batch.case_name_list = ['steady', 'long', 'turbulent', 'short']
+
+    def testCaseSize(self):
+        self.assertEqual([self.batch.case_size(case) for case in self.batch.case_list], [60., 600., 120., 10.])
+
+    def testSchedule(self):
+        # longest simulated time first, turbulent inflow counted double
+        self.assertEqual(self.batch.schedule(), [1, 2, 0, 3])
+
+        # measured run times take precedence, the others are scaled by their median rate
+        self.batch.run_times = {'long': 30., 'short': 50.}
+        self.assertEqual(self.batch.case_cost('steady', 60., 1.), 60.)
+        self.assertEqual(self.batch.case_cost('short', 10., 1.), 50.)
+        self.assertEqual(self.batch.schedule(), [2, 0, 3, 1])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSchedule))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
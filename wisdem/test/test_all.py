@@ -2,6 +2,7 @@ import unittest
 import pytest
 import sys
 
+import wisdem.test.test_aeroelasticse as test_aeroelasticse
 import wisdem.test.test_assemblies as test_assemblies
 import wisdem.test.test_airfoilprep as test_airfoilprep
 import wisdem.test.test_ccblade as test_ccblade
@@ -21,6 +22,7 @@ import wisdem.test.test_landbosse as test_landbosse
 
 def suite():
     suite = unittest.TestSuite( (
+        test_aeroelasticse.test_all.suite(),
         test_assemblies.test_all.suite(),
         test_airfoilprep.test_all.suite(),
         test_ccblade.test_all.suite(),
@@ -17,7 +17,7 @@ import numpy as np
 from os import path
 import math
 
-from wisdem.ccblade import CCAirfoil, CCBlade
+from wisdem.ccblade import CCAirfoil, CCAirfoilTable, CCBlade
 
 
 class TestNREL5MW(unittest.TestCase):
@@ -119,6 +119,151 @@ class TestNREL5MW(unittest.TestCase):
         np.testing.assert_allclose(T[idx]/1e6, Tref[idx]/1e3, atol=0.15)
 
 
+    def test_vectorized(self):
+
+        Uinf = np.array([3.0, 7.0, 11.0, 15.0, 25.0])
+        Omega = np.array([6.972, 8.469, 11.890, 12.100, 0.0])
+        pitch = np.array([0.000, 0.000, 0.000, 10.450, 23.469])
+
+        Np, Tp = self.rotor.distributedAeroLoads(Uinf[1], Omega[1], pitch[1], 90.0)
+        P, T, Q, M = self.rotor.evaluate(Uinf, Omega, pitch)
+
+        self.rotor.vectorized = True
+        Np2, Tp2 = self.rotor.distributedAeroLoads(Uinf[1], Omega[1], pitch[1], 90.0)
+        P2, T2, Q2, M2 = self.rotor.evaluate(Uinf, Omega, pitch)
+
+        np.testing.assert_allclose(Np2, Np, rtol=1e-8, atol=1e-6)
+        np.testing.assert_allclose(Tp2, Tp, rtol=1e-8, atol=1e-6)
+        np.testing.assert_allclose(P2, P, rtol=1e-8, atol=1e-6)
+        np.testing.assert_allclose(T2, T, rtol=1e-8, atol=1e-6)
+        np.testing.assert_allclose(Q2, Q, rtol=1e-8, atol=1e-6)
+        np.testing.assert_allclose(M2, M, rtol=1e-8, atol=1e-6)
+
+        # derivatives use the batched inflow solution too
+        self.rotor.derivatives = True
+        Np3, Tp3, dNp3, dTp3 = self.rotor.distributedAeroLoads(Uinf[1], Omega[1], pitch[1], 90.0)
+        self.rotor.vectorized = False
+        Np4, Tp4, dNp4, dTp4 = self.rotor.distributedAeroLoads(Uinf[1], Omega[1], pitch[1], 90.0)
+
+        for key in dNp4:
+            np.testing.assert_allclose(dNp3[key], dNp4[key], rtol=1e-6, atol=1e-6)
+            np.testing.assert_allclose(dTp3[key], dTp4[key], rtol=1e-6, atol=1e-6)
+
+
+    def test_batch(self):
+
+        Uinf = np.array([3.0, 7.0, 11.0, 15.0, 25.0])
+        Omega = np.array([6.972, 8.469, 11.890, 12.100, 0.0])
+        pitch = np.array([0.000, 0.000, 0.000, 10.450, 23.469])
+        nsec = self.rotor.nSector
+
+        self.rotor.vectorized = True
+        Np, Tp = self.rotor.batchAeroLoads(Uinf, Omega, pitch)
+        self.assertEqual(Np.shape, (len(Uinf), nsec, len(self.rotor.r)))
+
+        self.rotor.vectorized = False
+        for i in range(len(Uinf)):
+            for j in range(nsec):
+                Np_ij, Tp_ij = self.rotor.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], 360.0*j/nsec)
+                np.testing.assert_allclose(Np[i, j, :], Np_ij, rtol=1e-8, atol=1e-6)
+                np.testing.assert_allclose(Tp[i, j, :], Tp_ij, rtol=1e-8, atol=1e-6)
+
+        # batched Jacobians match the point-by-point ones
+        self.rotor.derivatives = True
+        out = self.rotor.evaluate(Uinf[:4], Omega[:4], pitch[:4], coefficients=True)
+        self.rotor.vectorized = True
+        out2 = self.rotor.evaluate(Uinf[:4], Omega[:4], pitch[:4], coefficients=True)
+
+        for x, x2 in zip(out, out2):
+            if isinstance(x, dict):
+                for key in x:
+                    np.testing.assert_allclose(x2[key], x[key], rtol=1e-6, atol=1e-6)
+            else:
+                np.testing.assert_allclose(x2, x, rtol=1e-8, atol=1e-6)
+
+
+
+    def test_lookup_table(self):
+
+        # table reproduces the airfoil splines
+        n = len(self.rotor.r)
+        table = CCAirfoilTable(self.rotor.af)
+        alpha = np.radians(np.linspace(-20.0, 30.0, 51))[:, np.newaxis]*np.ones(n)
+        Re = 5e6*np.ones_like(alpha)
+        cl, cd = table.evaluate(alpha, Re)
+        for i in range(n):
+            cl_i, cd_i = self.rotor.af[i].evaluate(alpha[:, i], Re[:, i])
+            np.testing.assert_allclose(cl[:, i], cl_i, atol=1e-4)
+            np.testing.assert_allclose(cd[:, i], cd_i, atol=1e-4)
+
+        Uinf = np.array([3.0, 7.0, 11.0, 15.0])
+        Omega = np.array([6.972, 8.469, 11.890, 12.100])
+        pitch = np.array([0.000, 0.000, 0.000, 10.450])
+
+        P, T, Q, M = self.rotor.evaluate(Uinf, Omega, pitch)
+        self.rotor.vectorized = True
+        self.rotor.lookup_table = True
+        P2, T2, Q2, M2 = self.rotor.evaluate(Uinf, Omega, pitch)
+
+        np.testing.assert_allclose(P2, P, rtol=1e-4)
+        np.testing.assert_allclose(T2, T, rtol=1e-4)
+        np.testing.assert_allclose(Q2, Q, rtol=1e-4)
+
+
+    def test_lookup_table_Re(self):
+
+        # polars at several Reynolds numbers, interpolated on the linearly spaced Re grid
+        alpha = np.linspace(-180.0, 180.0, 181)
+        Re = np.array([0.5e6, 1e6, 3e6, 6e6, 1e7])
+        a = np.radians(alpha)[:, np.newaxis]
+        f = 1.0 + 0.15*np.log10(Re/1e6)[np.newaxis, :]
+        cl = np.sin(2*a)*f
+        cd = 0.01/f + 1.0 - np.cos(2*a)
+        cm = -0.1*np.sin(a)*f
+        af = [CCAirfoil(alpha, Re, cl, cd, cm), CCAirfoil(alpha, Re, 1.1*cl, 1.2*cd, cm)]
+
+        table = CCAirfoilTable([af[0], af[1], af[0]])
+        self.assertFalse(table.one_Re)
+        self.assertEqual(table.n_Re, 8)
+        np.testing.assert_allclose(table.Re0, [0.5e6, 0.5e6])
+        np.testing.assert_allclose(table.dRe, [9.5e6/7, 9.5e6/7])
+
+        alpha_e, Re_e = np.meshgrid(np.radians(np.linspace(-20.0, 30.0, 51)), np.linspace(0.5e6, 1e7, 37), indexing='ij')
+        alpha_e = alpha_e[..., np.newaxis]*np.ones(3)
+        Re_e = Re_e[..., np.newaxis]*np.ones(3)
+        cl_t, cd_t, cm_t = table.evaluate(alpha_e, Re_e, return_cm=True)
+        for i, afi in enumerate([af[0], af[1], af[0]]):
+            cl_i, cd_i, cm_i = afi.evaluate(alpha_e[..., i].ravel(), Re_e[..., i].ravel(), return_cm=True)
+            np.testing.assert_allclose(cl_t[..., i].ravel(), cl_i, atol=1e-4)
+            np.testing.assert_allclose(cd_t[..., i].ravel(), cd_i, atol=1e-4)
+            np.testing.assert_allclose(cm_t[..., i].ravel(), cm_i, atol=1e-4)
+
+
+    def test_airfoil_cache(self):
+
+        alpha = np.linspace(-180.0, 180.0, 73)
+        Re = [1e6]
+        cl = np.sin(2*np.radians(alpha))[:, np.newaxis]
+        cd = 0.01 + 1.0 - np.cos(2*np.radians(alpha))[:, np.newaxis]
+
+        size = CCAirfoil.cache_size
+        CCAirfoil.cache_size = 2
+        try:
+            af1 = CCAirfoil.cached(alpha, Re, cl, cd)
+            self.assertIs(CCAirfoil.cached(alpha.copy(), Re, cl.copy(), cd.copy()), af1)
+
+            af2 = CCAirfoil.cached(alpha, Re, 1.1*cl, cd)
+            self.assertIsNot(af2, af1)
+            np.testing.assert_allclose(af2.evaluate(0.5, 1e6)[0], 1.1*af1.evaluate(0.5, 1e6)[0], rtol=1e-2)
+
+            # least recently used entry is evicted
+            CCAirfoil.cached(alpha, Re, cl, 1.1*cd)
+            self.assertIs(CCAirfoil.cached(alpha, Re, 1.1*cl, cd), af2)
+            self.assertIsNot(CCAirfoil.cached(alpha, Re, cl, cd), af1)
+        finally:
+            CCAirfoil.cache_size = size
+
+
 
 def suite():
     suite = unittest.TestSuite()
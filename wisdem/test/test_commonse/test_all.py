@@ -8,6 +8,7 @@ from wisdem.test.test_commonse import test_tube
 from wisdem.test.test_commonse import test_utilities
 from wisdem.test.test_commonse import test_utilizationSupplement
 from wisdem.test.test_commonse import test_vertical_cylinder
+from wisdem.test.test_commonse import test_yaml_loader
 
 import numpy as np
 import numpy.testing as npt
@@ -20,7 +21,8 @@ def suite():
                                  test_tube.suite(),
                                  test_utilities.suite(),
                                  test_utilizationSupplement.suite(),
-                                 test_vertical_cylinder.suite()
+                                 test_vertical_cylinder.suite(),
+                                 test_yaml_loader.suite()
     ) )
     return suite
 
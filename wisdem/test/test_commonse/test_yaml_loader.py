@@ -0,0 +1,95 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import os
+import shutil
+import tempfile
+import jsonschema
+import wisdem.commonse.yaml_loader as yl
+
+INPUT = '''
+name: test
+grid: [0.0, 0.5, 1.0]
+index: [1, 2, 3]
+table: [[1.0, 2.0], [3.0, 4.0]]
+ragged: [[1.0], [2.0, 3.0]]
+mixed: [1.0, on]
+modulus: 1e9
+'''
+
+SCHEMA = '''
+type: object
+properties:
+    grid:
+        type: array
+        items:
+            type: number
+'''
+
+
+class TestYamlLoader(unittest.TestCase):
+    def setUp(self):
+        self.path   = tempfile.mkdtemp()
+        self.fname  = os.path.join(self.path, 'input.yaml')
+        self.schema = os.path.join(self.path, 'schema.yaml')
+        self.sidecar = os.path.join(self.path, '.input.yaml.cache')
+        with open(self.fname, 'w') as f:
+            f.write(INPUT)
+        with open(self.schema, 'w') as f:
+            f.write(SCHEMA)
+        yl.clear_cache()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+        yl.clear_cache()
+
+    def testLoad(self):
+        data = yl.load_yaml(self.fname, sidecar=False)
+        self.assertEqual(data['grid'], [0.0, 0.5, 1.0])
+        self.assertEqual(data['modulus'], 1e9)
+        self.assertEqual(data['mixed'], [1.0, True])
+
+    def testArrays(self):
+        data = yl.load_yaml(self.fname, arrays=True, sidecar=False)
+        npt.assert_equal(data['grid'], [0.0, 0.5, 1.0])
+        self.assertEqual(data['index'].dtype, int)
+        self.assertEqual(data['table'].shape, (2, 2))
+        self.assertIsInstance(data['ragged'], list)
+        self.assertIsInstance(data['ragged'][1], np.ndarray)
+        self.assertIsInstance(data['mixed'], list)
+        self.assertEqual(yl.to_lists(data), yl.load_yaml(self.fname, sidecar=False))
+
+    def testMemoryCacheCopies(self):
+        data = yl.load_yaml(self.fname, arrays=True, sidecar=False)
+        data['grid'][0] = 10.
+        data['name'] = 'changed'
+        data = yl.load_yaml(self.fname, arrays=True, sidecar=False)
+        self.assertEqual(data['grid'][0], 0.)
+        self.assertEqual(data['name'], 'test')
+
+    def testSidecar(self):
+        data = yl.load_yaml(self.fname, fname_schema=self.schema, arrays=True, cache=False)
+        self.assertTrue(os.path.isfile(self.sidecar))
+
+        # the sidecar is read instead of the input
+        with open(self.sidecar, 'rb') as f:
+            cached = f.read()
+        data2 = yl.load_yaml(self.fname, fname_schema=self.schema, arrays=True, cache=False)
+        npt.assert_equal(data2['table'], data['table'])
+
+        # a modified input is parsed and validated again
+        with open(self.fname, 'w') as f:
+            f.write(INPUT.replace('grid: [0.0, 0.5, 1.0]', 'grid: [0.0, a, 1.0]'))
+        with self.assertRaises(jsonschema.ValidationError):
+            yl.load_yaml(self.fname, fname_schema=self.schema, arrays=True, cache=False)
+        with open(self.sidecar, 'rb') as f:
+            self.assertEqual(f.read(), cached)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestYamlLoader))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
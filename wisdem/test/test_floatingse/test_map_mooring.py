@@ -161,6 +161,32 @@ class TestMapMooring(unittest.TestCase):
         self.assertEqual(np.count_nonzero(self.outputs['operational_heel_restoring_force']), 9)
         self.assertGreater(np.count_nonzero(self.outputs['mooring_plot_matrix']), 9*20-3)
 
+    def testVesselDisplacements(self):
+        X = mapMooring.vessel_displacements(np.deg2rad([0.0, 90.0]), [5.0, 10.0], [0.0, 4.0])
+        self.assertEqual(X.shape, (8, 6))
+        npt.assert_almost_equal(X[3], [10.0, 0.0, 0.0, 0.0, 4.0, 0.0])
+        npt.assert_almost_equal(X[7], [0.0, 10.0, 0.0, -4.0, 0.0, 0.0])
+
+    def testSolveOffsets(self):
+        self.mymap.write_input_file(self.inputs, self.discrete_inputs)
+        X = mapMooring.vessel_displacements(np.deg2rad(np.arange(0.0, 360.0, 30.0)), [5.0, 10.0], [0.0, 5.0])
+        F, T = self.mymap.solve_offsets(self.inputs, X)
+        self.assertEqual(F.shape, (X.shape[0], 3, 3))
+        npt.assert_equal(T, np.sqrt(np.sum(F**2, axis=2)))
+
+        # Same forces one displacement at a time
+        for i in [0, 17, X.shape[0]-1]:
+            mymap = mapMooring._init_map(self.mymap.finput, self.inputs['water_depth'], self.inputs['water_density'])
+            mymap.displace_vessel(*X[i])
+            mymap.update_states(0.0, 0)
+            for k in range(3):
+                npt.assert_allclose(F[i,k,:], mymap.get_fairlead_force_3d(k), rtol=1e-6)
+            mymap.end()
+
+        # Worker processes, each with its own MAP++ instance
+        F2, T2 = self.mymap.solve_offsets(self.inputs, X, cores=2)
+        npt.assert_allclose(F2, F, rtol=1e-6, atol=1e-6*np.abs(F).max())
+
     def testCost(self):
         self.mymap.compute_cost(self.inputs, self.discrete_inputs, self.outputs)
     
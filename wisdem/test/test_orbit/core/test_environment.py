@@ -7,6 +7,7 @@ __email__ = "jake.nunemaker@nrel.gov"
 
 import pandas as pd
 import pytest
+from marmot import Environment as BaseEnvironment
 from marmot import le
 
 from wisdem.orbit.core import Environment
@@ -114,3 +115,38 @@ def test_extrap():
     valid = env2._find_valid_constraints(**constraints)
     assert (env.state["windspeed_100m"] == env2.state["windspeed_100m"]).all()
     assert (env.state["windspeed_120m"] < env2.state["windspeed_120m"]).all()
+
+
+@pytest.mark.parametrize("now", (0, 11.5, 1000, 20000))
+@pytest.mark.parametrize(
+    "constraints",
+    ({}, {"windspeed": le(8)}, {"windspeed": le(6), "waveheight": le(1)}),
+)
+def test_weather_window_index(now, constraints):
+    env = Environment(state=simple_weather)
+    env._now = now
+
+    for n in (0, 1, 8, 48):
+        assert env.find_operational_window(
+            n, constraints
+        ) == BaseEnvironment.find_operational_window(env, n, constraints)
+
+    for n in (0.5, 8, 47.2, 200):
+        assert env.calculate_operational_delays(
+            n, constraints
+        ) == BaseEnvironment.calculate_operational_delays(env, n, constraints)
+
+    # One index per constraint set
+    assert len(env._windows) == 1
+    env.find_operational_window(4, dict(constraints))
+    assert len(env._windows) == 1
+
+
+def test_interp_during_simulation():
+    env = Environment(state=weather)
+    env._now = 100
+
+    constraints = {"waveheight": le(2), "windspeed_20m": le(10)}
+    env.find_operational_window(4, constraints)
+    assert env._state.size == weather.size
+    assert "windspeed_20m" in env.state.dtype.names
@@ -0,0 +1,78 @@
+"""Tests for the `LogStore` class."""
+
+__author__ = "Jake Nunemaker"
+__copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
+__maintainer__ = "Jake Nunemaker"
+__email__ = "jake.nunemaker@nrel.gov"
+
+
+import numpy as np
+
+from wisdem.orbit.core import LogStore
+
+logs = [
+    {"message": "SIMULATION START", "level": "DEBUG", "time": 0},
+    {
+        "agent": "WTIV",
+        "action": "Mobilize",
+        "duration": 72.0,
+        "cost": 1e5,
+        "level": "ACTION",
+        "time": 72,
+        "site_depth": 20.0,
+    },
+    {"agent": "WTIV", "progress": "Turbine", "level": "DEBUG", "time": 80.5},
+    {
+        "agent": "WTIV",
+        "action": "Transit",
+        "duration": 8.0,
+        "cost": np.nan,
+        "level": "ACTION",
+        "time": 88.5,
+    },
+]
+
+
+def test_records():
+
+    store = LogStore()
+    store.extend(logs[:2])
+    store.extend(logs[2:], offset=10)
+    assert len(store) == 4
+
+    records = store.records()
+    assert records[:2] == logs[:2]
+    assert records[2]["time"] == 90.5
+    assert records[3]["agent"] == "WTIV"
+    assert np.isnan(records[3]["cost"])
+
+    # Input logs are not modified
+    assert logs[2]["time"] == 80.5
+
+    assert store.records([1]) == [logs[1]]
+
+
+def test_columns():
+
+    store = LogStore()
+    store.extend(logs)
+
+    assert store.categories("level") == ["DEBUG", "ACTION"]
+    assert list(store.column("level")) == [0, 1, 0, 1]
+    assert store.code("level", "ACTION") == 1
+    assert store.code("progress", "Array String") == -1
+
+    assert list(store.mask("cost")) == [False, True, False, True]
+    assert list(store.mask("progress")) == [False, False, True, False]
+    assert list(store.mask("site_depth")) == [False, True, False, False]
+
+    assert store.filter(["progress", "time"]) == [("Turbine", 80.5)]
+    assert store.filter(["site_depth", "time"]) == [(20.0, 72)]
+
+    df = store.frame
+    assert list(df["agent"].cat.categories) == ["WTIV"]
+    assert df["action"].isna().sum() == 2
+    assert df["cost"].sum() == 1e5
+
+    store.append(logs[0])
+    assert len(store.frame) == 5
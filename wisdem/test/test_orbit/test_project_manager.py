@@ -6,6 +6,7 @@ __email__ = "jake.nunemaker@nrel.gov"
 
 from copy import deepcopy
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -191,6 +192,69 @@ def test_chained_dependencies():
     assert min(tu) == (max(mp) - min(mp)) * 0.5 + min(mp)
 
 
+def test_dependency_order():
+
+    config_chained = deepcopy(config)
+    config_chained["spi_vessel"] = "test_scour_protection_vessel"
+    config_chained["scour_protection"] = {"tons_per_substructure": 200}
+    config_chained["install_phases"] = {
+        "TurbineInstallation": ("MonopileInstallation", 0.5),
+        "MonopileInstallation": ("ScourProtectionInstallation", 0.1),
+        "ScourProtectionInstallation": 0,
+    }
+
+    project = ProjectManager(config_chained)
+    project.run_project()
+
+    starts = project.phase_starts
+    times = project.phase_times
+    assert starts["MonopileInstallation"] == (
+        times["ScourProtectionInstallation"] * 0.1
+    )
+    assert starts["TurbineInstallation"] == (
+        starts["MonopileInstallation"] + times["MonopileInstallation"] * 0.5
+    )
+
+
+def test_dependent_phase_log_order():
+
+    config_deps = deepcopy(complete_project)
+    config_deps["install_phases"] = {
+        "ScourProtectionInstallation": 0,
+        "MonopileInstallation": ("ScourProtectionInstallation", 0.5),
+        "TurbineInstallation": ("MonopileInstallation", 0.1),
+        "ArrayCableInstallation": ("ScourProtectionInstallation", 0.5),
+    }
+
+    project = ProjectManager(config_deps)
+    project.run_project()
+
+    # Logs are merged in the order of 'install_phases', not the order ran
+    phases = project.project_logs_frame["phase"].dropna().unique()
+    assert list(phases) == list(config_deps["install_phases"])
+    assert project.project_time == project.project_logs[-1]["time"]
+
+
+def test_parallel_phases():
+
+    serial = ProjectManager(complete_project, weather=weather_df)
+    serial.run_project()
+
+    project = ProjectManager(complete_project, weather=weather_df)
+    project.run_project(cores=2)
+
+    assert project.phase_starts == serial.phase_starts
+    assert project.phase_times == serial.phase_times
+    assert project.phase_costs == serial.phase_costs
+    assert project.detailed_outputs == serial.detailed_outputs
+    assert project.project_logs == serial.project_logs
+    assert project.npv == serial.npv
+
+    with pytest.warns(UserWarning, match="worker processes"):
+        phases = project.phases
+    assert set(phases) < set(serial.phases)
+
+
 @pytest.mark.parametrize(
     "m_start, t_start", [(0, 0), (0, 100), (100, 100), (100, 200)]
 )
@@ -605,3 +669,132 @@ def test_npv():
     project = ProjectManager(config)
     project.run_project()
     assert project.npv != baseline
+
+
+def test_cash_flow_model():
+
+    project = ProjectManager(complete_project)
+    project.run_project()
+
+    model = project.cash_flow_model
+    assert project.cash_flow_model is model
+    assert len(model["months"]) == 12 * 25 - 1
+
+    # Reference, month by month
+    times, turbines = project.progress.energize_points
+    dig = np.digitize(times, project.month_bins)
+    for i in (1, 12, 60, 299):
+        generating = sum(turbines[: len([t for t in dig if i >= t])])
+        assert project.monthly_opex[i] == pytest.approx(
+            generating * project.turbine_rating * 150 * 1000 / 12
+        )
+        assert project.monthly_revenue[i] == pytest.approx(
+            generating * project.turbine_rating * 0.4 * 730 * 80
+        )
+
+    pr = (1 + 0.025) ** (1 / 12) - 1
+    cash_flow = project.cash_flow
+    assert project.npv == pytest.approx(
+        project.overnight_capex
+        - sum(v / (1 + pr) ** i for i, v in cash_flow.items())
+    )
+
+    # Recomputed when an input changes
+    project.config["ncf"] = 0.35
+    assert project.cash_flow_model is not model
+    assert project.monthly_revenue[299] == pytest.approx(
+        model["revenue"][-1] * 0.35 / 0.4
+    )
+    assert project.npv > model["npv"]
+
+    npv = project.npv
+    project.config["discount_rate"] = 0.05
+    assert project.npv != npv
+    assert project.cash_flow_model is project.cash_flow_model
+
+
+def test_project_logs_frame():
+
+    project = ProjectManager(complete_project)
+    project.run_project()
+
+    logs = project.project_logs
+    df = project.project_logs_frame
+    assert len(df) == len(logs)
+    assert df["cost"].sum() == pytest.approx(
+        sum(l["cost"] for l in logs if "cost" in l)
+    )
+
+    actions = df.loc[df["level"] == "ACTION"]
+    assert len(actions) == len(project.project_actions)
+    assert set(actions["phase"]) == set(complete_project["install_phases"])
+
+
+### Monte Carlo
+def test_monte_carlo():
+
+    results = ProjectManager.run_monte_carlo(
+        config, weather_df, starts=[0, "01/01/2011"], years=3, seed=1
+    )
+    samples = results["samples"]
+    assert len(samples) == 5
+
+    project = ProjectManager(config, weather=weather_df)
+    project.run_project()
+    assert samples["installation_time"][0] == project.installation_time
+    assert samples["total_capex"][0] == project.total_capex
+    assert samples["npv"][0] == project.npv
+
+    date = weather_df.index.get_loc(pd.Timestamp("2011-01-01"))
+    project = ProjectManager(config, weather=weather_df.iloc[date:])
+    project.run_project()
+    assert samples["installation_time"][1] == project.installation_time
+
+    assert results["P50"]["npv"] == samples["npv"].median()
+    assert (
+        results["P90"]["installation_time"]
+        >= results["P50"]["installation_time"]
+    )
+    assert results["P90"]["npv"] == samples["npv"].quantile(0.1)
+    assert results["quantiles"].loc[0.9, "npv"] == samples["npv"].quantile(0.9)
+
+    parallel = ProjectManager.run_monte_carlo(
+        config, weather_df, starts=[0, "01/01/2011"], years=3, seed=1, cores=2
+    )
+    pd.testing.assert_frame_equal(parallel["samples"], samples)
+
+
+def test_resample_weather_years():
+
+    rng = np.random.default_rng(1)
+    samples = ProjectManager._resample_weather_years(weather_df, 20, rng)
+    index = weather_df.index
+
+    for rows in samples:
+        src = index[rows]
+        assert len(src) == len(index)
+
+        # Same date and hour, whole years from one complete source year
+        feb29 = (index.month == 2) & (index.day == 29)
+        assert (src.hour == index.hour).all()
+        assert (src.month == index.month).all()
+        assert (src.day[~feb29] == index.day[~feb29]).all()
+        assert pd.Series(src.year).groupby(index.year).nunique().max() == 1
+        assert set(src.year) <= {2010, 2011, 2012, 2013}
+
+
+def test_monte_carlo_inputs():
+
+    with pytest.raises(ValueError):
+        ProjectManager.run_monte_carlo(config, None, starts=[0])
+
+    with pytest.raises(ValueError):
+        ProjectManager.run_monte_carlo(config, weather_df)
+
+    with pytest.raises(ValueError):
+        ProjectManager.run_monte_carlo(config, weather_df.iloc[:100], years=1)
+
+    with pytest.raises(WeatherProfileError):
+        ProjectManager.run_monte_carlo(
+            config, weather_df, starts=["01/01/1900"]
+        )
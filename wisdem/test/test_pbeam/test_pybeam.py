@@ -363,6 +363,42 @@ class TestPyBeam(unittest.TestCase):
         zv = np.linspace(z[0], z[-1], npts)
         self.assertNotIn( beam.axialStrain(npts, xv, yv, zv).sum(), badlist)
 
+    def testLoadCases(self):
+
+        nodes = 5
+        z = np.linspace(0.0, 10.0, nodes)
+        EIx = 3.0*np.linspace(2.0, 1.0, nodes)
+        EIy = 2.0*np.linspace(2.0, 1.0, nodes)
+        EA = GJ = rhoA = rhoJ = np.ones(nodes)
+        sec = pb.SectionData(nodes, z, EA, EIx, EIy, GJ, rhoA, rhoJ)
+        tip = pb.TipData(0.0, np.zeros(3), np.zeros(6), [1.0, -2.0, 0.5], [0.1, 0.2, 0.3])
+        base = pb.BaseData(np.ones(6), 1.0)
+
+        ncase = 3
+        Px = np.outer(np.arange(1, ncase+1), np.linspace(1.0, 2.0, nodes))
+        Py = -0.5*Px[::-1]
+        Pz = np.outer(np.ones(ncase), 0.1*z)
+        Mx = 0.2*Px
+        cases = pb.LoadCases(nodes, Px, Py, Pz, 0*Px, 0*Px, 0*Px, Mx, 0*Px, 0*Px)
+
+        beam = pb.Beam(sec, pb.Loads(nodes), tip, base)
+        out = beam.loadCases(cases)
+        npts = 7
+        xv = np.linspace(-0.5, 0.5, npts)
+        yv = 0.3*np.ones(npts)
+        zv = np.linspace(z[0], z[-1], npts)
+        strain = beam.axialStrainLoadCases(cases, xv, yv, zv)
+
+        # same as one beam per case
+        for k in range(ncase):
+            loads = pb.Loads(nodes, Px[k], Py[k], Pz[k], np.zeros(nodes), np.zeros(nodes), np.zeros(nodes),
+                             Mx[k], np.zeros(nodes), np.zeros(nodes))
+            beam_k = pb.Beam(sec, loads, tip, base)
+            expect = beam_k.displacement() + beam_k.shearAndBending()
+            for x, x_k in zip(out, expect):
+                npt.assert_allclose(x[k], x_k, rtol=1e-10, atol=1e-12)
+            npt.assert_allclose(strain[k], beam_k.axialStrain(npts, xv, yv, zv), rtol=1e-10, atol=1e-12)
+
     def testCurveFEM_FixedBeam_n1(self):
         # Test data from "Consistent Mass Matrix for Distributed Mass Systmes", John Archer,
         # Journal of the Structural Division Proceedings of the American Society of Civil Engineers,
@@ -578,6 +578,7 @@ class FrameTestEXB(unittest.TestCase):
 
 
         self.displacements, self.forces, self.reactions, self.internalForces, self.mass, self.modal = frame.run()
+        self.frame = frame
 
 
     def test_disp1(self):
@@ -827,6 +828,27 @@ class FrameTestEXB(unittest.TestCase):
         np.testing.assert_array_almost_equal(modal.zrot[iM, :], out[:, 6], decimal=3)
 
 
+    def test_modal_sparse(self):
+
+        nM = 6
+        self.frame.enableDynamics(nM, 3, 0, 1e-9, 0.0)
+        displacements, forces, reactions, internalForces, mass, modal = self.frame.run()
+
+        np.testing.assert_equal(mass.xmass, self.mass.xmass)
+        np.testing.assert_allclose(modal.freq, self.modal.freq, rtol=1e-8)
+        np.testing.assert_array_equal(modal.node, self.modal.node)
+
+        # the sign of the mode shapes is arbitrary
+        fields = ['xdsp', 'ydsp', 'zdsp', 'xrot', 'yrot', 'zrot']
+        for iM in range(nM):
+            sign = np.sign(sum(np.dot(getattr(modal, f)[iM, :], getattr(self.modal, f)[iM, :]) for f in fields))
+            mpf = np.array([modal.xmpf[iM], modal.ympf[iM], modal.zmpf[iM]])
+            mpf_ref = np.array([self.modal.xmpf[iM], self.modal.ympf[iM], self.modal.zmpf[iM]])
+            np.testing.assert_allclose(sign*mpf, mpf_ref, atol=1e-6*np.max(np.abs(mpf_ref)))
+            for field in fields:
+                np.testing.assert_allclose(sign*getattr(modal, field)[iM, :], getattr(self.modal, field)[iM, :], atol=1e-10)
+
+
 
 class GravityAdd(unittest.TestCase):
 
@@ -917,11 +939,92 @@ class GravityAdd(unittest.TestCase):
         self.assertAlmostEqual(2*reactions.Fz[0,0], reactions.Fz[2,0])
 
 
+class FrameReuse(unittest.TestCase):
+
+    def cantilever(self, E=1e5, Fx=0.0):
+
+        nnode = 6
+        node = np.arange(1, 1+nnode)
+        z = 10.0*np.arange(nnode)
+        nodes = NodeData(node, np.zeros(nnode), np.zeros(nnode), z, np.zeros(nnode))
+
+        rigid = 1e16
+        Kx = Ky = Kz = Ktx = Kty = Ktz = np.array([rigid])
+        reactions = ReactionData(np.array([1]), Kx, Ky, Kz, Ktx, Kty, Ktz, rigid)
+
+        ne = nnode-1
+        elements = ElementData(np.arange(1, nnode), np.arange(1, nnode), np.arange(2, nnode+1),
+                               5.0*np.ones(ne), np.ones(ne), np.ones(ne), np.ones(ne), np.ones(ne), 0.5*np.ones(ne),
+                               E*np.ones(ne), 1e4*np.ones(ne), np.zeros(ne), 0.25*np.ones(ne))
+        options = Options(False, False, 1.0)
+
+        loads = []
+        for gz, F in [(-10.0, Fx), (0.0, 2*Fx+1.0)]:
+            load = StaticLoadCase(0.0, 0.0, gz)
+            load.changePointLoads(np.array([nnode]), np.array([F]), np.array([0.0]), np.array([0.0]),
+                                  np.array([0.0]), np.array([0.0]), np.array([0.0]))
+            loads.append(load)
+
+        return nodes, reactions, elements, options, loads
+
+    def assertSameResults(self, out1, out2):
+        for a, b in zip(list(out1[:3]) + out1[3], list(out2[:3]) + out2[3]):
+            for field in a._fields:
+                np.testing.assert_equal(getattr(a, field), getattr(b, field))
+
+    def new_frame(self, **kwargs):
+        nodes, reactions, elements, options, loads = self.cantilever(**kwargs)
+        frame = Frame(nodes, reactions, elements, options)
+        for load in loads:
+            frame.addLoadCase(load)
+        return frame
+
+    def test_repeated_run(self):
+
+        frame = self.new_frame(Fx=1.0)
+        out1 = frame.run()
+        disp = np.copy(out1[0].dx)
+        out2 = frame.run()
+        self.assertSameResults(out1, out2)
+
+        # the outputs of a run are not overwritten by the next one
+        np.testing.assert_equal(out1[0].dx, disp)
+        self.assertFalse(np.shares_memory(out1[0].dx, out2[0].dx))
+        self.assertFalse(np.shares_memory(out1[3][0].Nx, out2[3][0].Nx))
+
+    def test_change_data(self):
+
+        frame = self.new_frame()
+        frame.run()
+
+        for E, Fx in [(1e5, 2.0), (2e5, 2.0), (2e5, 3.0)]:
+            nodes, reactions, elements, options, loads = self.cantilever(E=E, Fx=Fx)
+            self.assertTrue(frame.sameTopology(nodes, reactions, elements, options))
+            frame.changeNodeData(nodes)
+            frame.changeReactionData(reactions)
+            frame.changeElementData(elements)
+            frame.clearLoadCases()
+            for load in loads:
+                frame.addLoadCase(load)
+
+            self.assertSameResults(frame.run(), self.new_frame(E=E, Fx=Fx).run())
+
+    def test_change_topology(self):
+
+        frame = self.new_frame()
+        nodes, reactions, elements, options, loads = self.cantilever()
+        elements.N2[-1] = 1
+        self.assertFalse(frame.sameTopology(nodes, reactions, elements, options))
+        with self.assertRaises(ValueError):
+            frame.changeElementData(elements)
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(FrameTestEXA))
     suite.addTest(unittest.makeSuite(FrameTestEXB))
     suite.addTest(unittest.makeSuite(GravityAdd))
+    suite.addTest(unittest.makeSuite(FrameReuse))
     return suite
 
 if __name__ == '__main__':
@@ -1,9 +1,13 @@
 import unittest
 
 from wisdem.test.test_rotorse import test_rotor_aero
+from wisdem.test.test_rotorse import test_precomp
+from wisdem.test.test_rotorse import test_rotor_geometry
 
 def suite():
     suite = unittest.TestSuite( (test_rotor_aero.suite(),
+    test_precomp.suite(),
+    test_rotor_geometry.suite(),
     ) )
     return suite
 
@@ -0,0 +1,83 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+from wisdem.rotorse.precomp import PreComp, Profile, CompositeSection, Orthotropic2DMaterial, _precomp
+
+
+def naca(tc):
+    # symmetric NACA 4-digit profile
+    x = 0.5*(1 - np.cos(np.linspace(0, np.pi, 60)))
+    y = 5*tc*(0.2969*np.sqrt(x) - 0.1260*x - 0.3516*x**2 + 0.2843*x**3 - 0.1036*x**4)
+    y[-1] = 0.
+    return Profile(x, y, x, -y)
+
+
+class TestPreComp(unittest.TestCase):
+    def setUp(self):
+        materials = [Orthotropic2DMaterial(37e9, 9e9, 4e9, 0.28, 1900.),
+                     Orthotropic2DMaterial(10e9, 10e9, 8e9, 0.3, 1800.),
+                     Orthotropic2DMaterial(2.5e8, 2.5e8, 5e7, 0.3, 200.)]
+
+        nsec = 5
+        r = np.linspace(3., 60., nsec)
+        profile, upperCS, lowerCS, websCS = [], [], [], []
+        for i in range(nsec):
+            profile.append(naca(0.4 - 0.05*i))
+            t = 0.02*(1 - 0.15*i)
+            # skin only at the root and tip, spar cap and two webs in between
+            if i in [0, nsec-1]:
+                upperCS.append(CompositeSection([0., 1.], [[2, 10]], [[0.001, t]], [[0., 45.]], [[1, 0]], materials))
+                websCS.append(CompositeSection([], [], [], [], [], materials))
+            else:
+                upperCS.append(CompositeSection([0., 0.2, 0.5, 1.], [[2], [2, 30], [2, 4, 1]], [[0.001], [0.001, t], [0.001, 0.01, 0.001]],
+                                                [[45.], [45., 0.], [45., 0., 45.]], [[1], [1, 0], [1, 2, 1]], materials))
+                websCS.append(CompositeSection([0.2, 0.5], [[2, 20, 2], [1, 10]], [[0.001, 0.02, 0.001], [0.001, 0.01]],
+                                               [[45., 0., 45.], [45., 0.]], [[1, 2, 1], [1, 2]], materials))
+            lowerCS.append(upperCS[-1].mycopy())
+
+        self.beam = PreComp(r, np.linspace(4., 1.5, nsec), np.linspace(12., 0., nsec), 0.3*np.ones(nsec),
+                            np.zeros(nsec), np.zeros(nsec), profile, materials, upperCS, lowerCS, websCS,
+                            [None]*nsec, [None]*nsec, [None]*nsec, [None]*nsec)
+
+    def testBatchMatchesStations(self):
+        out = self.beam.sectionProperties()
+
+        b = self.beam
+        m = b.materials
+        for i in range(len(b.r)):
+            xnode, ynode = b.profile[i]._preCompFormat()
+            locU, n_laminaU, n_pliesU, tU, thetaU, mat_idxU = b.upperCS[i]._preCompFormat()
+            locL, n_laminaL, n_pliesL, tL, thetaL, mat_idxL = b.lowerCS[i]._preCompFormat()
+            locW, n_laminaW, n_pliesW, tW, thetaW, mat_idxW = b.websCS[i]._preCompFormat()
+            nwebs = len(locW)
+            if nwebs == 0:
+                locW = n_laminaW = n_pliesW = tW = thetaW = mat_idxW = [0]
+
+            results = _precomp.properties(b.chord[i], b.theta[i], b.th_prime[i], b.leLoc[i], xnode, ynode,
+                [x.E1 for x in m], [x.E2 for x in m], [x.G12 for x in m], [x.nu12 for x in m], [x.rho for x in m],
+                locU, n_laminaU, n_pliesU, tU, thetaU, mat_idxU,
+                locL, n_laminaL, n_pliesL, tL, thetaL, mat_idxL,
+                nwebs, locW, n_laminaW, n_pliesW, tW, thetaW, mat_idxW)
+
+            self.assertEqual(out[0][i], results[1])     # EIxx
+            self.assertEqual(out[1][i], results[0])     # EIyy
+            self.assertEqual(out[2][i], results[2])     # GJ
+            self.assertEqual(out[3][i], results[3])     # EA
+            self.assertEqual(out[7][i], results[14])    # rhoA
+            self.assertEqual(b.y_ec_nose[i], results[12])
+
+    def testThreads(self):
+        out1 = self.beam.sectionProperties()
+        for threads in [2, 10]:
+            out = self.beam.sectionProperties(threads=threads)
+            for a, b in zip(out1, out):
+                npt.assert_equal(a, b)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestPreComp))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
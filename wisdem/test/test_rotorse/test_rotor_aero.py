@@ -343,6 +343,161 @@ class TestRotorAero(unittest.TestCase):
         myCp = self.outputs['P']/(0.5*1.225*V_expect1**3.*np.pi*70**2)
         npt.assert_allclose(myCp[:7], myCp[0])
         npt.assert_allclose(myCp[:7], self.outputs['Cp'][:7])
+
+
+    def testRegulationTrajectoryParallel(self):
+        # Load in airfoil and blade shape inputs for NREL 5MW
+        npzfile = np.load(ARCHIVE)
+        self.inputs['airfoils_aoa'] = npzfile['aoa']
+        self.inputs['airfoils_Re'] = npzfile['Re']
+        self.inputs['airfoils_cl'] = npzfile['cl']
+        self.inputs['airfoils_cd'] = npzfile['cd']
+        self.inputs['airfoils_cm'] = npzfile['cm']
+        self.inputs['r'] = npzfile['r']
+        self.inputs['chord'] = npzfile['chord']
+        self.inputs['theta'] = npzfile['theta']
+
+        naero = self.inputs['r'].size
+        n_aoa_grid = self.inputs['airfoils_aoa'].size
+        n_Re_grid = self.inputs['airfoils_Re'].size
+        n_pc = 22
+
+        # parameters
+        self.inputs['control_Vin'] = 4.
+        self.inputs['control_Vout'] = 25.
+        self.inputs['control_ratedPower'] = 5e6
+        self.inputs['control_minOmega'] = 0.0
+        self.inputs['control_maxOmega'] = 10.0
+        self.inputs['control_maxTS'] = 90.
+        self.inputs['control_tsr'] = 10.
+        self.inputs['control_pitch'] = 0.0
+        self.discrete_inputs['drivetrainType'] = 'GEARED'
+        self.inputs['drivetrainEff'] = 0.95
+
+        self.inputs['Rhub'] = 1.
+        self.inputs['Rtip'] = 70.
+        self.inputs['hub_height'] = 100.
+        self.inputs['precone'] = 0.
+        self.inputs['tilt'] = 0.
+        self.inputs['yaw'] = 0.
+        self.inputs['precurve'] = np.zeros(naero)
+        self.inputs['precurveTip'] = 0.
+        self.inputs['presweep'] = np.zeros(naero)
+        self.inputs['presweepTip'] = 0.
+
+        self.discrete_inputs['nBlades'] = 3
+        self.inputs['rho'] = 1.225
+        self.inputs['mu'] = 1.81206e-5
+        self.inputs['shearExp'] = 0.25
+        self.discrete_inputs['nSector'] = 4
+        self.discrete_inputs['tiploss'] = True
+        self.discrete_inputs['hubloss'] = True
+        self.discrete_inputs['wakerotation'] = True
+        self.discrete_inputs['usecd'] = True
+
+        outputs = []
+        for cores, chunk in [(1, 4), (2, 4), (1, 1)]:
+            myobj = ra.RegulatedPowerCurve(naero=naero, n_aoa_grid=n_aoa_grid, n_Re_grid=n_Re_grid, n_pc=n_pc, n_pc_spline=n_pc,
+                                           regulation_reg_II5=True, regulation_reg_III=True, cores=cores, pitch_chunk=chunk)
+            myobj.naero = naero
+            outputs.append({})
+            myobj.compute(self.inputs, outputs[-1], self.discrete_inputs, self.discrete_outputs)
+
+        # Region 3 holds rated power with increasing pitch
+        i_3 = np.nonzero(outputs[0]['V'] > outputs[0]['rated_V'])[0]
+        npt.assert_allclose(outputs[0]['P'][i_3], 5e6, rtol=1e-4)
+        npt.assert_array_less(outputs[0]['pitch'][i_3[:-1]], outputs[0]['pitch'][i_3[1:]])
+
+        # Process pool reproduces the serial solve
+        for k in ['V', 'Omega', 'pitch', 'P', 'T', 'Q', 'Cp']:
+            npt.assert_allclose(outputs[1][k], outputs[0][k])
+
+        # Warm starting each wind speed from its lower neighbour finds the same schedule
+        npt.assert_allclose(outputs[2]['pitch'], outputs[0]['pitch'], atol=1e-2)
+        npt.assert_allclose(outputs[2]['P'], outputs[0]['P'], rtol=1e-4)
+
+        # With a pool, each chunk of warm started wind speeds holds at least one per core
+        myobj = ra.RegulatedPowerCurve(naero=naero, n_aoa_grid=n_aoa_grid, n_Re_grid=n_Re_grid, n_pc=n_pc, n_pc_spline=n_pc,
+                                       cores=3, pitch_chunk=1)
+        sizes = []
+        myobj._warm_start(lambda k, pitch0: sizes.append(k.size) or pitch0, np.arange(7), np.zeros(7), pool=object())
+        self.assertEqual(sizes, [3, 3, 1])
+
+
+    def testRegulationTrajectoryTable(self):
+        # Load in airfoil and blade shape inputs for NREL 5MW
+        npzfile = np.load(ARCHIVE)
+        self.inputs['airfoils_aoa'] = npzfile['aoa']
+        self.inputs['airfoils_Re'] = npzfile['Re']
+        self.inputs['airfoils_cl'] = npzfile['cl']
+        self.inputs['airfoils_cd'] = npzfile['cd']
+        self.inputs['airfoils_cm'] = npzfile['cm']
+        self.inputs['r'] = npzfile['r']
+        self.inputs['chord'] = npzfile['chord']
+        self.inputs['theta'] = npzfile['theta']
+
+        naero = self.inputs['r'].size
+        n_aoa_grid = self.inputs['airfoils_aoa'].size
+        n_Re_grid = self.inputs['airfoils_Re'].size
+        n_pc = 22
+
+        # parameters
+        self.inputs['control_Vin'] = 4.
+        self.inputs['control_Vout'] = 25.
+        self.inputs['control_ratedPower'] = 5e6
+        self.inputs['control_minOmega'] = 0.0
+        self.inputs['control_maxOmega'] = 10.0
+        self.inputs['control_maxTS'] = 90.
+        self.inputs['control_tsr'] = 10.
+        self.inputs['control_pitch'] = 0.0
+        self.discrete_inputs['drivetrainType'] = 'GEARED'
+        self.inputs['drivetrainEff'] = 0.95
+
+        self.inputs['Rhub'] = 1.
+        self.inputs['Rtip'] = 70.
+        self.inputs['hub_height'] = 100.
+        self.inputs['precone'] = 0.
+        self.inputs['tilt'] = 0.
+        self.inputs['yaw'] = 0.
+        self.inputs['precurve'] = np.zeros(naero)
+        self.inputs['precurveTip'] = 0.
+        self.inputs['presweep'] = np.zeros(naero)
+        self.inputs['presweepTip'] = 0.
+
+        self.discrete_inputs['nBlades'] = 3
+        self.inputs['rho'] = 1.225
+        self.inputs['mu'] = 1.81206e-5
+        self.inputs['shearExp'] = 0.25
+        self.discrete_inputs['nSector'] = 4
+        self.discrete_inputs['tiploss'] = True
+        self.discrete_inputs['hubloss'] = True
+        self.discrete_inputs['wakerotation'] = True
+        self.discrete_inputs['usecd'] = True
+
+        outputs = []
+        for table in [False, True]:
+            myobj = ra.RegulatedPowerCurve(naero=naero, n_aoa_grid=n_aoa_grid, n_Re_grid=n_Re_grid, n_pc=n_pc, n_pc_spline=n_pc,
+                                           regulation_reg_II5=True, regulation_reg_III=True, regulation_table=table)
+            myobj.naero = naero
+            outputs.append({})
+            myobj.compute(self.inputs, outputs[-1], self.discrete_inputs, self.discrete_outputs)
+
+        # Interpolated schedule stays within the error tolerance of direct BEM
+        npt.assert_allclose(outputs[1]['V'], outputs[0]['V'])
+        npt.assert_allclose(outputs[1]['Omega'], outputs[0]['Omega'])
+        npt.assert_allclose(outputs[1]['pitch'], outputs[0]['pitch'], atol=0.05)
+        npt.assert_allclose(outputs[1]['P'], outputs[0]['P'], rtol=2e-3)
+
+        # Surface is reused when only the control inputs change
+        surface = myobj._surface
+        self.inputs['control_tsr'] = 9.
+        myobj.compute(self.inputs, outputs[-1], self.discrete_inputs, self.discrete_outputs)
+        self.assertIs(myobj._surface, surface)
+
+        self.inputs['chord'] = 1.01*npzfile['chord']
+        myobj.compute(self.inputs, outputs[-1], self.discrete_inputs, self.discrete_outputs)
+        self.assertIsNot(myobj._surface, surface)
+
         
 def suite():
     suite = unittest.TestSuite()
@@ -0,0 +1,120 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import copy
+import os
+from wisdem.rotorse.rotor_geometry_yaml import ReferenceBlade, calc_axis_intersections
+BOUNDS   = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'composite_bounds.npz')
+ONTOLOGY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test_assemblies', 'IEA-15-240-RWT.yaml')
+
+
+def updater(refBlade):
+    blade = ReferenceBlade()
+    blade.NINPUT   = refBlade.NINPUT
+    blade.NPTS     = refBlade.NPTS
+    blade.spar_var = refBlade.spar_var
+    blade.te_var   = refBlade.te_var
+    return blade
+
+
+class TestReferenceBladeUpdate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.refBlade = ReferenceBlade()
+        cls.refBlade.NINPUT   = 8
+        cls.refBlade.NPTS     = 30
+        cls.refBlade.spar_var = ['Spar_cap_ss', 'Spar_cap_ps']
+        cls.refBlade.te_var   = 'TE_reinforcement'
+        cls.refBlade.validate = False
+        cls.blade = cls.refBlade.initialize(ONTOLOGY)
+
+    def design(self, chord_scale=1., sparT_scale=1.):
+        blade = copy.deepcopy(self.blade, {id(self.blade['AFref']): self.blade['AFref']})
+        blade['ctrl_pts']['chord_in'] = chord_scale*np.array(blade['ctrl_pts']['chord_in'])
+        blade['ctrl_pts']['sparT_in'] = sparT_scale*np.array(blade['ctrl_pts']['sparT_in'])
+        return blade
+
+    def assertSameBlade(self, blade, expected):
+        for var in ['chord', 'theta', 'rthick', 'r']:
+            npt.assert_equal(blade['pf'][var], expected['pf'][var])
+        npt.assert_equal(blade['profile'], expected['profile'])
+        npt.assert_equal(blade['airfoils_cl'], expected['airfoils_cl'])
+        for layer, layer_exp in zip(blade['st']['layers'], expected['st']['layers']):
+            self.assertEqual(layer['start_nd_arc']['values'], layer_exp['start_nd_arc']['values'])
+            self.assertEqual(layer['thickness']['values'], layer_exp['thickness']['values'])
+        for cs, cs_exp in zip(blade['precomp']['upperCS'], expected['precomp']['upperCS']):
+            npt.assert_equal(cs.loc, cs_exp.loc)
+            npt.assert_equal(np.concatenate(cs.t), np.concatenate(cs_exp.t))
+
+    def testIncrementalUpdate(self):
+        myobj = updater(self.refBlade)
+        for chord_scale, sparT_scale in [(1., 1.), (1.05, 1.), (1.05, 1.1), (1.05, 1.1)]:
+            memo  = dict(myobj.memo)
+            blade = myobj.update(self.design(chord_scale, sparT_scale))
+            self.assertSameBlade(blade, updater(self.refBlade).update(self.design(chord_scale, sparT_scale)))
+
+        # the last design was unchanged, so no stage ran again
+        for stage in memo:
+            self.assertIs(myobj.memo[stage], memo[stage])
+
+    def testChordOnlySkipsAirfoils(self):
+        myobj = updater(self.refBlade)
+        myobj.update(self.design())
+        memo = dict(myobj.memo)
+        myobj.update(self.design(chord_scale=0.95))
+
+        self.assertIs(myobj.memo['remap_profiles'], memo['remap_profiles'])
+        self.assertIs(myobj.memo['remap_polars'], memo['remap_polars'])
+        self.assertIsNot(myobj.memo['update_planform'], memo['update_planform'])
+        self.assertIsNot(myobj.memo['convert_precomp'], memo['convert_precomp'])
+
+    def testCompositeBounds(self):
+        # arc positions of the layers and webs of IEA-15 at 30 stations, as computed by the
+        # original station by station intersection search
+        ref = np.load(BOUNDS)
+        for type_sec in ['layers', 'webs']:
+            for sec in self.blade['st'][type_sec]:
+                for key, field in [('start', 'start_nd_arc'), ('end', 'end_nd_arc')]:
+                    npt.assert_allclose(np.array(sec[field]['values'], dtype=float), ref['%s/%s/%s' % (type_sec, sec['name'], key)],
+                                        rtol=0., atol=1e-12)
+
+    def testCompositeBoundsErrors(self):
+        blade = self.design()
+        layer = [sec for sec in blade['st']['layers'] if 'side' in sec][0]
+        layer['side'] = 'top'
+        with self.assertRaises(ValueError):
+            self.refBlade.calc_composite_bounds(blade)
+
+        # an axis offset beyond the trailing edge misses the surface
+        x = np.linspace(1., 0., 11)
+        y = 0.1*np.sin(np.pi*x)
+        profile = np.array([np.r_[x, x[-2::-1]], np.r_[y, -y[-2::-1]]]).T[np.newaxis]
+        arc = np.linspace(0., 1., profile.shape[1])[np.newaxis]
+        npt.assert_allclose(calc_axis_intersections(profile, np.array([21]), np.array([10]), arc, [0, 0], [0., 0.], [0.5, 0.5], [0, 1]),
+                            [0.25, 0.75])
+        with self.assertRaises(ValueError):
+            calc_axis_intersections(profile, np.array([21]), np.array([10]), arc, [0], [0.], [2.], [0])
+
+    def testWriteKeepsComments(self):
+        fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_write_ontology.yaml')
+        try:
+            self.refBlade.write_ontology(fname, self.blade, copy.deepcopy(self.refBlade.wt_ref))
+            with open(fname, 'r') as f:
+                self.assertIn('# alpha:[7    21  21]', f.read())
+
+            wt = self.refBlade.load_ontology(fname)
+            npt.assert_allclose(wt['components']['blade']['outer_shape_bem']['chord']['values'], self.blade['pf']['chord'])
+        finally:
+            if os.path.exists(fname):
+                os.remove(fname)
+            if os.path.exists(os.path.join(os.path.dirname(fname), '.test_write_ontology.yaml.cache')):
+                os.remove(os.path.join(os.path.dirname(fname), '.test_write_ontology.yaml.cache'))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestReferenceBladeUpdate))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())